@@ -7,3 +7,4 @@ __version__ = '1.0.0'
 from .validation import *
 from .manipulation import *
 from .generation import *
+from .extraction import *
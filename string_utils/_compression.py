@@ -0,0 +1,424 @@
+# -*- coding: utf-8 -*-
+
+# INTERNAL USE ONLY COMPRESSION CODECS!
+
+import abc
+import bz2
+import lzma
+import zlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ._regex import *
+
+# Third party codecs are optional: they are available only when the related package is installed.
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover
+    lz4_frame = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+
+class Codec(abc.ABC):
+    """
+    Base class of compression codecs.
+
+    Compressed data starts with a header byte which identifies the codec, so that it can be detected on decompression.
+    The only exception is zlib, whose output already starts with a header byte that has 8 as its low nibble
+    (deflate compression method): this keeps the default output the same of previous versions, while codecs ids
+    are chosen so that their low nibble is never 8.
+
+    Codecs supporting preset dictionaries set `DICTIONARY_FLAG` in the header byte when a dictionary is used,
+    followed by the 4 bytes id of the dictionary (its adler32 checksum, like in the zlib header).
+    """
+
+    # name of the codec (used by the `codec` argument of compress())
+    name = None
+
+    # codec id stored in the header byte (None if the header is not added)
+    header = None
+
+    # package to install in order to use the codec (None for codecs in the standard library)
+    package = None
+
+    # True if the codec can compress using a preset dictionary
+    supports_dictionary = False
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @abc.abstractmethod
+    def compress(self, data: bytes, level: int, dictionary: Optional[bytes] = None) -> bytes:
+        pass
+
+    @abc.abstractmethod
+    def decompress(self, data: bytes, dictionary: Optional[bytes] = None) -> bytes:
+        pass
+
+
+class ZlibCodec(Codec):
+    name = 'zlib'
+    supports_dictionary = True
+
+    def compress(self, data: bytes, level: int, dictionary: Optional[bytes] = None) -> bytes:
+        if dictionary is None:
+            return zlib.compress(data, level)
+
+        # zlib natively stores the dictionary id into its header (FDICT flag)
+        compressor = zlib.compressobj(level, zdict=dictionary)
+
+        return compressor.compress(data) + compressor.flush()
+
+    def decompress(self, data: bytes, dictionary: Optional[bytes] = None) -> bytes:
+        if dictionary is None:
+            return zlib.decompress(data)
+
+        decompressor = zlib.decompressobj(zdict=dictionary)
+        output = decompressor.decompress(data) + decompressor.flush()
+
+        if not decompressor.eof:
+            raise zlib.error('Error -5 while decompressing data: incomplete or truncated stream')
+
+        return output
+
+    @staticmethod
+    def dictionary_id(data: bytes) -> Optional[int]:
+        # FDICT flag of the FLG byte tells if DICTID follows CMF and FLG
+        if len(data) >= 6 and data[1] & 0x20:
+            return int.from_bytes(data[2:6], 'big')
+
+        return None
+
+
+class LzmaCodec(Codec):
+    name = 'lzma'
+    header = 1
+
+    def compress(self, data: bytes, level: int, dictionary: Optional[bytes] = None) -> bytes:
+        return lzma.compress(data, preset=level)
+
+    def decompress(self, data: bytes, dictionary: Optional[bytes] = None) -> bytes:
+        return lzma.decompress(data)
+
+
+class Bz2Codec(Codec):
+    name = 'bz2'
+    header = 2
+
+    def compress(self, data: bytes, level: int, dictionary: Optional[bytes] = None) -> bytes:
+        # bz2 levels start from 1
+        return bz2.compress(data, max(level, 1))
+
+    def decompress(self, data: bytes, dictionary: Optional[bytes] = None) -> bytes:
+        return bz2.decompress(data)
+
+
+class ZstdCodec(Codec):
+    name = 'zstd'
+    header = 3
+    package = 'zstandard'
+    supports_dictionary = True
+
+    @property
+    def available(self) -> bool:
+        return zstandard is not None
+
+    def compress(self, data: bytes, level: int, dictionary: Optional[bytes] = None) -> bytes:
+        dict_data = None if dictionary is None else zstandard.ZstdCompressionDict(dictionary)
+
+        # zstd levels start from 1 (0 means "default level")
+        return zstandard.ZstdCompressor(level=max(level, 1), dict_data=dict_data).compress(data)
+
+    def decompress(self, data: bytes, dictionary: Optional[bytes] = None) -> bytes:
+        dict_data = None if dictionary is None else zstandard.ZstdCompressionDict(dictionary)
+
+        return zstandard.ZstdDecompressor(dict_data=dict_data).decompress(data)
+
+
+class Lz4Codec(Codec):
+    name = 'lz4'
+    header = 4
+    package = 'lz4'
+
+    @property
+    def available(self) -> bool:
+        return lz4_frame is not None
+
+    def compress(self, data: bytes, level: int, dictionary: Optional[bytes] = None) -> bytes:
+        return lz4_frame.compress(data, compression_level=level)
+
+    def decompress(self, data: bytes, dictionary: Optional[bytes] = None) -> bytes:
+        return lz4_frame.decompress(data)
+
+
+class BrotliCodec(Codec):
+    name = 'brotli'
+    header = 5
+    package = 'brotli'
+
+    @property
+    def available(self) -> bool:
+        return brotli is not None
+
+    def compress(self, data: bytes, level: int, dictionary: Optional[bytes] = None) -> bytes:
+        return brotli.compress(data, quality=level)
+
+    def decompress(self, data: bytes, dictionary: Optional[bytes] = None) -> bytes:
+        return brotli.decompress(data)
+
+
+# set in the header byte of codecs (other than zlib) when a dictionary id follows
+DICTIONARY_FLAG = 0x10
+
+# Header byte of the blocks format, used to compress with multiple threads: input is split into blocks of
+# BLOCK_SIZE bytes, each one compressed independently (as a regular frame, with its own codec header).
+# Layout: header byte, block size (4 bytes), number of blocks (4 bytes), compressed size of each block (4 bytes each)
+# and finally the compressed blocks.
+BLOCKS_HEADER = 6
+
+# size of uncompressed blocks
+BLOCK_SIZE = 1 << 20
+
+# all the codecs, in the order in which they are listed in messages (dicts are not ordered before python 3.6)
+ALL_CODECS = (ZlibCodec(), LzmaCodec(), Bz2Codec(), ZstdCodec(), Lz4Codec(), BrotliCodec())
+
+# codecs by name
+CODECS = {codec.name: codec for codec in ALL_CODECS}  # type: Dict[str, Codec]
+
+# codecs by header id
+HEADERS = {codec.header: codec for codec in CODECS.values() if codec.header is not None}  # type: Dict[int, Codec]
+
+
+def get_codec(name: str) -> Codec:
+    codec = CODECS.get(name) if isinstance(name, str) else None
+
+    if codec is None:
+        names = ', '.join(codec.name for codec in ALL_CODECS)
+        raise ValueError('Invalid codec "{}". Valid codecs are: {}'.format(name, names))
+
+    return require_available(codec)
+
+
+def require_available(codec: Codec) -> Codec:
+    if not codec.available:
+        raise ValueError('Codec "{}" requires "{}" package to be installed'.format(codec.name, codec.package))
+
+    return codec
+
+
+def detect_codec(data: bytes) -> Optional[Codec]:
+    """
+    Returns the codec used to compress the given data (None if the header is not recognized).
+    """
+    if len(data) == 0:
+        return None
+
+    header = data[0]
+
+    # zlib header (deflate compression method)
+    if header & 0x0f == 8:
+        return CODECS['zlib']
+
+    # bits other than codec id and dictionary flag are reserved
+    if header & ~(0x0f | DICTIONARY_FLAG):
+        return None
+
+    return HEADERS.get(header & 0x0f)
+
+
+def dictionary_id(dictionary: bytes) -> int:
+    return zlib.adler32(dictionary)
+
+
+def compress_frame(data: bytes, codec_name: str, level: int, dictionary: Optional[bytes] = None) -> bytes:
+    codec = get_codec(codec_name)
+
+    if dictionary is not None and not codec.supports_dictionary:
+        raise ValueError('Codec "{}" does not support dictionaries'.format(codec.name))
+
+    compressed = codec.compress(data, level, dictionary)
+
+    if codec.header is None:
+        return compressed
+
+    if dictionary is None:
+        return bytes((codec.header,)) + compressed
+
+    return bytes((codec.header | DICTIONARY_FLAG,)) + dictionary_id(dictionary).to_bytes(4, 'big') + compressed
+
+
+def decompress_frame(data: bytes, dictionaries: Iterable[bytes] = ()) -> bytes:
+    codec = detect_codec(data)
+
+    if codec is None:
+        raise ValueError('Invalid compressed data: unknown codec header')
+
+    require_available(codec)
+
+    if codec.header is None:
+        payload = data
+        required_id = ZlibCodec.dictionary_id(data)
+    elif data[0] & DICTIONARY_FLAG:
+        payload = memoryview(data)[5:]
+        required_id = int.from_bytes(data[1:5], 'big')
+    else:
+        payload = memoryview(data)[1:]
+        required_id = None
+
+    if required_id is None:
+        return codec.decompress(payload)
+
+    for dictionary in dictionaries:
+        if dictionary_id(dictionary) == required_id:
+            return codec.decompress(payload, dictionary)
+
+    raise ValueError('Dictionary not found: compressed data requires dictionary with id {}'.format(required_id))
+
+
+def train_dictionary(samples: Iterable[bytes], size: int) -> bytes:
+    """
+    Builds a preset dictionary made of the byte sequences which are most commonly shared among the samples.
+
+    Candidates are sequences of 1 to 4 tokens (runs of word chars or of anything else), scored by the number of
+    samples containing them (only the first occurrence in each sample is counted, since repetitions inside a single
+    sample are already handled by the compressor) multiplied by their length.
+    """
+    counts = Counter()
+
+    for sample in samples:
+        tokens = DICTIONARY_TOKEN_RE.findall(sample)
+        sequences = set()
+
+        for length in range(1, 5):
+            for index in range(len(tokens) - length + 1):
+                sequences.add(b''.join(tokens[index:index + length]))
+
+        counts.update(sequences)
+
+    # sequences found in a single sample are useless, very short ones are cheaper to encode as literals
+    candidates = sorted(
+        ((count * len(sequence), sequence) for sequence, count in counts.items() if count > 1 and len(sequence) > 2),
+        reverse=True
+    )
+
+    selected = []
+    selected_size = 0
+    dictionary = b''
+
+    for _, sequence in candidates:
+        if selected_size + len(sequence) > size:
+            continue
+
+        # skip sequences which are already part of the dictionary
+        if sequence in dictionary:
+            continue
+
+        selected.append(sequence)
+        selected_size += len(sequence)
+        dictionary = b''.join(selected)
+
+        if selected_size == size:
+            break
+
+    # compressors reference the dictionary as if it were data preceding the input, and closer matches are cheaper:
+    # the best sequences go at the end
+    return b''.join(reversed(selected))
+
+
+def __run(function, items: list, threads: int) -> list:
+    # zlib, lzma and bz2 release the GIL while they (de)compress, so blocks are actually processed in parallel
+    if threads <= 1 or len(items) <= 1:
+        return [function(item) for item in items]
+
+    with ThreadPoolExecutor(min(threads, len(items))) as executor:
+        return list(executor.map(function, items))
+
+
+def compress(data: bytes,
+             codec_name: str,
+             level: int,
+             dictionary: Optional[bytes] = None,
+             threads: int = 1) -> bytes:
+    if threads <= 1:
+        return compress_frame(data, codec_name, level, dictionary)
+
+    view = memoryview(data)
+    blocks = [view[start:start + BLOCK_SIZE] for start in range(0, len(view), BLOCK_SIZE)] or [view]
+    compressed_blocks = __run(lambda block: compress_frame(block, codec_name, level, dictionary), blocks, threads)
+
+    header = bytes((BLOCKS_HEADER,)) + BLOCK_SIZE.to_bytes(4, 'big') + len(compressed_blocks).to_bytes(4, 'big')
+    index = b''.join(len(block).to_bytes(4, 'big') for block in compressed_blocks)
+
+    return b''.join([header, index] + compressed_blocks)
+
+
+def read_blocks_index(data: bytes) -> Tuple[int, List[memoryview]]:
+    """
+    Returns the uncompressed block size and the compressed blocks of data in blocks format.
+    """
+    if len(data) < 9:
+        raise ValueError('Invalid compressed data: truncated blocks index')
+
+    block_size = int.from_bytes(data[1:5], 'big')
+    count = int.from_bytes(data[5:9], 'big')
+    offset = 9 + count * 4
+
+    if len(data) < offset or block_size == 0:
+        raise ValueError('Invalid compressed data: truncated blocks index')
+
+    view = memoryview(data)
+    blocks = []
+
+    for position in range(9, 9 + count * 4, 4):
+        size = int.from_bytes(data[position:position + 4], 'big')
+        blocks.append(view[offset:offset + size])
+        offset += size
+
+    if offset != len(data):
+        raise ValueError('Invalid compressed data: blocks size mismatch')
+
+    return block_size, blocks
+
+
+def decompress(data: bytes, dictionaries: Iterable[bytes] = (), threads: int = 1) -> bytes:
+    if len(data) == 0 or data[0] != BLOCKS_HEADER:
+        return decompress_frame(data, dictionaries)
+
+    _, blocks = read_blocks_index(data)
+
+    return b''.join(__run(lambda block: decompress_frame(block, dictionaries), blocks, threads))
+
+
+def decompress_range(data: bytes, start: int, stop: int, dictionaries: Iterable[bytes] = (), threads: int = 1) -> bytes:
+    """
+    Same as `decompress(data)[start:stop]`, but only the blocks containing the range are decompressed
+    (if data is in blocks format).
+    """
+    if len(data) == 0 or data[0] != BLOCKS_HEADER:
+        return decompress_frame(data, dictionaries)[start:stop]
+
+    block_size, blocks = read_blocks_index(data)
+
+    if start >= stop:
+        return b''
+
+    first_block = start // block_size
+    selected_blocks = blocks[first_block:(stop - 1) // block_size + 1]
+    output = b''.join(__run(lambda block: decompress_frame(block, dictionaries), selected_blocks, threads))
+    offset = first_block * block_size
+
+    return output[start - offset:stop - offset]
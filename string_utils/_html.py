@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+# INTERNAL USE ONLY HTML SCANNER!
+
+from typing import Optional, Tuple
+
+from ._regex import *
+
+# html elements which never have content (therefore no closing tag has to be expected for them)
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link', 'meta', 'param', 'source', 'track',
+    'wbr',
+])
+
+# kinds of token recognized by the scanner
+NOT_A_TAG = 0
+INCOMPLETE_TAG = 1
+OPEN_TAG = 2
+VOID_TAG = 3
+CLOSING_TAG = 4
+COMMENT = 5
+DOCTYPE = 6
+
+
+def contains_tag(input_string: str) -> bool:
+    """
+    Same as `HTML_RE.search(input_string) is not None`, but computed in linear time.
+
+    The regex looks for a closing ">" (or "-->") up to the end of the string for each "<" found, which is quadratic
+    for strings with many unclosed tags, while here we only have to check the first candidate of each kind
+    (if a terminator does not follow it, it won't follow the next ones either).
+    """
+    match = HTML_OPEN_TAG_START_RE.search(input_string)
+
+    if match is not None and input_string.find('>', match.end()) >= 0:
+        return True
+
+    comment_start = input_string.find('<!--')
+
+    if comment_start >= 0 and input_string.rfind('-->') >= comment_start + 4:
+        return True
+
+    match = HTML_DOCTYPE_START_RE.search(input_string)
+
+    return match is not None and input_string.rfind('>') >= match.end()
+
+
+class HtmlScanner:
+    """
+    Single pass html tags scanner, used to strip tags in linear time.
+
+    Text can be provided in chunks by calling `feed()` multiple times: anything which cannot be processed yet
+    (a tag split across chunks or the content of a tag whose closing tag has not been found yet) is carried over to
+    the next call.
+
+    Rules:
+
+    - open, closing and self closing tags (`<tag ...>`, `</tag>`, `<tag ... />`) are removed
+    - comments are removed up to the first "-->", doctype declarations up to the first ">"
+    - unless `keep_tag_content` is True, the content of non void tags is removed up to the first closing tag
+
+    If `max_tag_size` is given, a tag or comment which is not terminated within that many chars (or a tag content
+    whose closing tag is not found within that many chars) is not carried over any longer, but processed as if no
+    terminator followed it at all (like the last call does), so that the carry never grows beyond that size.
+    """
+
+    def __init__(self, keep_tag_content: bool, max_tag_size: Optional[int] = None):
+        self.keep_tag_content = keep_tag_content
+        self.max_tag_size = max_tag_size
+
+        # text not processed yet, kept as a list of chunks (see `__wait()`) along with its total size
+        self.__carry = []
+        self.__carry_size = 0
+
+        # terminator which the carry is waiting for ("</" stands for a closing tag), if any
+        self.__terminator = None
+
+        # position in the carry from which the search of the terminator of an incomplete tag (or of the closing tag
+        # in case of pending content) has to be resumed, so that the same text is never scanned twice
+        self.__resume_at = 0
+
+        # position in the carry of the content of an open tag, which is waiting for a closing tag
+        self.__content_at = None
+
+        # results of the last search for each terminator (see `__find()`)
+        self.__searches = {}
+
+    # Search with memory: scan positions only move forward, so if the last search started before the given start
+    # and its result (or the lack of it) is after it, the result is still valid and the text is not scanned again.
+    def __find(self, buffer: str, terminator: str, start: int) -> Tuple[int, int]:
+        cached = self.__searches.get(terminator)
+
+        if cached is not None:
+            cached_start, cached_result = cached
+
+            if cached_start <= start and (cached_result[0] == -1 or cached_result[0] >= start):
+                return cached_result
+
+        if terminator == '</':
+            match = HTML_CLOSING_TAG_RE.search(buffer, start)
+            result = (-1, -1) if match is None else match.span()
+        else:
+            position = buffer.find(terminator, start)
+            result = (position, -1 if position == -1 else position + len(terminator))
+
+        self.__searches[terminator] = (start, result)
+
+        return result
+
+    def __read_tag(self, buffer: str, start: int, final: bool) -> Tuple[int, int]:
+        size = len(buffer)
+        resume_at = max(start, self.__resume_at)
+
+        if start + 1 == size:
+            return (NOT_A_TAG if final else INCOMPLETE_TAG), start
+
+        next_char = buffer[start + 1]
+
+        # open tag or void tag
+        match = HTML_OPEN_TAG_START_RE.match(buffer, start)
+
+        if match is not None:
+            _, end = self.__find(buffer, '>', max(match.end(), resume_at))
+
+            if end == -1:
+                self.__resume_at = size
+                self.__terminator = '>'
+                return (NOT_A_TAG if final else INCOMPLETE_TAG), start
+
+            is_void = match.group(1).lower() in VOID_ELEMENTS or buffer[end - 2] == '/'
+
+            return (VOID_TAG if is_void else OPEN_TAG), end
+
+        # closing tag
+        if next_char == '/':
+            match = HTML_CLOSING_TAG_RE.match(buffer, start)
+
+            if match is not None:
+                return CLOSING_TAG, match.end()
+
+            match = HTML_PARTIAL_CLOSING_TAG_RE.match(buffer, start)
+
+            if not final and match.end() == size:
+                return INCOMPLETE_TAG, start
+
+            return NOT_A_TAG, start
+
+        # comment or doctype
+        if next_char == '!':
+            head = buffer[start:start + 9]
+
+            if head.startswith('<!--'):
+                kind, terminator, min_end = COMMENT, '-->', start + 4
+            elif head.lower() == '<!doctype':
+                kind, terminator, min_end = DOCTYPE, '>', start + 9
+            else:
+                is_partial = '<!--'.startswith(head) or '<!doctype'.startswith(head.lower())
+                return (INCOMPLETE_TAG if is_partial and not final else NOT_A_TAG), start
+
+            _, end = self.__find(buffer, terminator, max(min_end, resume_at))
+
+            if end == -1:
+                # the terminator could be split between this chunk and the next one
+                self.__resume_at = max(min_end, size - len(terminator) + 1)
+                self.__terminator = terminator
+                return (NOT_A_TAG if final else INCOMPLETE_TAG), start
+
+            return kind, end
+
+        return NOT_A_TAG, start
+
+    @staticmethod
+    def __closing_tag_resume_at(buffer: str, start: int) -> int:
+        # a closing tag could start at the last "<" and be completed by next chunk (closing tags never contain "<", so
+        # this is the only candidate), unless what follows it cannot be the beginning of a closing tag
+        last_tag_start = buffer.rfind('<', start)
+
+        if last_tag_start == -1:
+            return len(buffer)
+
+        match = HTML_PARTIAL_CLOSING_TAG_RE.match(buffer, last_tag_start)
+
+        if last_tag_start + 1 == len(buffer) or (match is not None and match.end() == len(buffer)):
+            return last_tag_start
+
+        return len(buffer)
+
+    def __exceeds_max_tag_size(self, size: int) -> bool:
+        return self.max_tag_size is not None and size > self.max_tag_size
+
+    def __wait(self, chunk: str) -> bool:
+        # While the carry is waiting for a terminator, only the new chunk (along with the few chars of the carry
+        # which have not been searched yet) is searched: if the terminator is not found the chunk is just appended to
+        # the carry, so that a long unclosed tag or comment is never copied over and over.
+        # Returns true if the chunk has been carried over, false if the whole text has to be processed.
+        terminator = self.__terminator
+
+        if terminator is None or self.__exceeds_max_tag_size(self.__carry_size + len(chunk)):
+            return False
+
+        # the part of the carry not searched yet is always at its end and short (see `__closing_tag_resume_at()`)
+        tail_size = self.__carry_size - self.__resume_at
+        tail_chunks = []
+
+        for carried in reversed(self.__carry):
+            if tail_size <= 0:
+                break
+
+            tail_chunks.append(carried[-tail_size:])
+            tail_size -= len(carried)
+
+        window = ''.join(reversed(tail_chunks)) + chunk
+
+        if terminator == '</':
+            if HTML_CLOSING_TAG_RE.search(window) is not None:
+                return False
+
+            self.__resume_at += self.__closing_tag_resume_at(window, 0)
+        else:
+            if terminator in window:
+                return False
+
+            self.__resume_at += max(0, len(window) - len(terminator) + 1)
+
+        self.__carry.append(chunk)
+        self.__carry_size += len(chunk)
+
+        return True
+
+    def feed(self, chunk: str, final: bool = False) -> str:
+        """
+        Process the given chunk of text and returns the text which is certainly not part of any tag.
+
+        :param chunk: Text to process.
+        :param final: True if this is the last chunk (nothing will be carried over).
+        :return: Text without tags.
+        """
+        if not final and self.__wait(chunk):
+            return ''
+
+        self.__carry.append(chunk)
+        buffer = ''.join(self.__carry)
+        size = len(buffer)
+        output = []
+        position = 0
+        self.__searches = {}
+        self.__terminator = None
+
+        while position < size:
+            # the content of an open tag is removed along with the tag only if a closing tag follows
+            if self.__content_at is not None:
+                closing_start, closing_end = self.__find(buffer, '</', max(self.__content_at, self.__resume_at))
+
+                if closing_start >= 0:
+                    position = closing_end
+                    self.__content_at = None
+                    self.__resume_at = 0
+                    continue
+
+                if not final and not self.__exceeds_max_tag_size(size - self.__content_at):
+                    self.__resume_at = self.__closing_tag_resume_at(buffer, max(self.__content_at, self.__resume_at))
+                    self.__terminator = '</'
+                    position = self.__content_at
+                    break
+
+                # no closing tag at all: the content is processed as normal text
+                position = self.__content_at
+                self.__content_at = None
+                self.__resume_at = 0
+                continue
+
+            tag_start = buffer.find('<', position)
+
+            if tag_start == -1:
+                output.append(buffer[position:])
+                position = size
+                break
+
+            output.append(buffer[position:tag_start])
+            position = tag_start
+            kind, tag_end = self.__read_tag(buffer, tag_start, final)
+
+            if kind == INCOMPLETE_TAG:
+                if not self.__exceeds_max_tag_size(size - tag_start):
+                    break
+
+                kind = NOT_A_TAG
+
+            if kind == NOT_A_TAG:
+                output.append('<')
+                position += 1
+
+                # the terminator of a tag which turned out not to be a tag must not affect the next ones
+                self.__resume_at = 0
+                self.__terminator = None
+                continue
+
+            self.__resume_at = 0
+            position = tag_end
+
+            if kind == OPEN_TAG and not self.keep_tag_content:
+                self.__content_at = tag_end
+
+        # keeps unprocessed text for the next call, positions are now relative to its beginning
+        carry = buffer[position:]
+        self.__carry = [carry] if carry else []
+        self.__carry_size = len(carry)
+        self.__resume_at = max(0, self.__resume_at - position)
+
+        if self.__content_at is not None:
+            self.__content_at -= position
+
+        if final:
+            self.__carry = []
+            self.__carry_size = 0
+            self.__resume_at = 0
+            self.__content_at = None
+            self.__terminator = None
+
+        return ''.join(output)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# INTERNAL USE ONLY IP PARSER!
+
+# Addresses are scanned into their packed integer value (the same of `int(ipaddress.ip_address(...))`) without
+# creating any intermediate object, None is returned for strings which are not valid addresses.
+
+from typing import Optional, Tuple
+
+from ._regex import *
+
+# longest valid ip v6 representation: 6 groups of 4 chars, 6 colons and an embedded ip v4 (15 chars)
+MAX_V6_LENGTH = 45
+
+
+def parse_v4(input_string: str) -> Optional[int]:
+    match = IP_V4_RE.fullmatch(input_string)
+
+    if match is None:
+        return None
+
+    a, b, c, d = map(int, match.groups())
+
+    if a > 255 or b > 255 or c > 255 or d > 255:
+        return None
+
+    return a << 24 | b << 16 | c << 8 | d
+
+
+def parse_v6(input_string: str) -> Optional[int]:
+    if len(input_string) > MAX_V6_LENGTH or ':' not in input_string:
+        return None
+
+    head, compressed, tail = input_string.partition('::')
+
+    if compressed:
+        # "::" can be used only once, it replaces one or more groups of zeros
+        head_groups = head.split(':') if head else []
+        tail_groups = tail.split(':') if tail else []
+        last_groups = tail_groups
+    else:
+        head_groups = input_string.split(':')
+        tail_groups = []
+        last_groups = head_groups
+
+    # an ip v4 can take the place of the last two groups (eg: "::ffff:192.168.0.1")
+    embedded_v4 = None
+
+    if last_groups and '.' in last_groups[-1]:
+        embedded_v4 = parse_v4(last_groups.pop())
+
+        if embedded_v4 is None:
+            return None
+
+    size = len(head_groups) + len(tail_groups) + (0 if embedded_v4 is None else 2)
+
+    if (size > 7) if compressed else (size != 8):
+        return None
+
+    for group in head_groups + tail_groups:
+        if not 0 < len(group) < 5:
+            return None
+
+    fill = ['0000'] * (8 - size) if compressed else []
+    hex_digits = ''.join([group.zfill(4) for group in head_groups + fill + tail_groups])
+
+    # int() would allow underscores between digits
+    if IP_V6_HEX_RE.fullmatch(hex_digits) is None:
+        return None
+
+    value = int(hex_digits, 16) if hex_digits else 0
+
+    if embedded_v4 is not None:
+        value = value << 32 | embedded_v4
+
+    return value
+
+
+def parse(input_string: str) -> Optional[Tuple[int, int]]:
+    # returns a (version, value) tuple
+    if ':' in input_string:
+        value = parse_v6(input_string)
+        return None if value is None else (6, value)
+
+    value = parse_v4(input_string)
+
+    return None if value is None else (4, value)
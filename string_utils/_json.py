@@ -0,0 +1,312 @@
+# -*- coding: utf-8 -*-
+
+# INTERNAL USE ONLY JSON SCANNER!
+
+import codecs
+from typing import Any, Callable, Optional
+
+from ._regex import *
+
+# what the scanner expects to find next
+VALUE = 0
+KEY = 1
+COLON = 2
+COMMA_OR_CLOSE = 3
+END = 4
+
+# white spaces allowed around tokens (same of `json.loads()`)
+WHITESPACE = ' \t\n\r'
+
+# longest token which is not a string ("-Infinity")
+MAX_NON_STRING_TOKEN_SIZE = 9
+
+
+def detect_encoding(data: bytes) -> str:
+    # same rules of `json.detect_encoding()` (which is not available before python 3.6): a BOM if any, otherwise
+    # the position of the null bytes in the first 4 bytes (the first two chars of a json are always ascii)
+    if data.startswith((codecs.BOM_UTF32_BE, codecs.BOM_UTF32_LE)):
+        return 'utf-32'
+
+    if data.startswith((codecs.BOM_UTF16_BE, codecs.BOM_UTF16_LE)):
+        return 'utf-16'
+
+    if data.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    if len(data) >= 4:
+        if not data[0]:
+            return 'utf-16-be' if data[1] else 'utf-32-be'
+
+        if not data[1]:
+            return 'utf-16-le' if data[2] or data[3] else 'utf-32-le'
+    elif len(data) == 2:
+        if not data[0]:
+            return 'utf-16-be'
+
+        if not data[1]:
+            return 'utf-16-le'
+
+    return 'utf-8'
+
+
+class JsonScanner:
+    """
+    Non materializing json validator: the grammar is checked token by token keeping only the stack of the open
+    containers (no object is ever created). Strings longer than a chunk are scanned one chunk at time as well, so
+    that memory usage of streams and bytes depends on the chunk size and on the depth, not on the size of the json.
+
+    Source can be a string, a bytes-like object or a readable stream (either text or binary), bytes are decoded in
+    chunks after detecting the encoding like `json.loads()` does.
+
+    Rules are the same of `is_json()`: only objects and arrays are accepted as top level values and the grammar is
+    the one of `json.loads()` (which also accepts NaN, Infinity and -Infinity).
+
+    Runs of flat members (scalar items of arrays and "key": scalar members of objects) are consumed by a single regex
+    match, so that the python loop runs about once for each container rather than once for each token.
+    """
+
+    def __init__(self, source: Any, max_depth: Optional[int] = None, max_size: Optional[int] = None,
+                 chunk_size: int = 65536):
+        self.source = source
+        self.max_depth = max_depth
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+
+        # raw units (chars or bytes) read so far
+        self.__size = 0
+
+        # function reading raw chunks from the source (None for strings) and decoder of binary ones
+        self.__read_raw = None
+        self.__decoder = None
+
+    def __open(self) -> Optional[str]:
+        # returns the first text chunk (None if the source is not supported or not valid)
+        source = self.source
+
+        if isinstance(source, str):
+            self.__size = len(source)
+            return source
+
+        if callable(getattr(source, 'read', None)):
+            self.__read_raw = source.read
+        else:
+            try:
+                view = memoryview(source).cast('B')
+            except TypeError:
+                return None
+
+            self.__read_raw = self.__view_reader(view)
+
+        return self.__read(self.chunk_size)
+
+    @staticmethod
+    def __view_reader(view: memoryview) -> Callable[[int], bytes]:
+        position = 0
+
+        def read(size: int) -> bytes:
+            nonlocal position
+            chunk = view[position:position + size].tobytes()
+            position += len(chunk)
+            return chunk
+
+        return read
+
+    def __read(self, size: int) -> Optional[str]:
+        # returns the next text chunk, an empty string once the source has been consumed or None if the source
+        # is exceeding `max_size` (or cannot be decoded)
+        while True:
+            raw = self.__read_raw(size)
+
+            if isinstance(raw, str):
+                text = raw
+            elif isinstance(raw, (bytes, bytearray, memoryview)):
+                raw = bytes(raw)
+
+                # at least 4 bytes are needed to detect the encoding (unless the source is shorter)
+                if self.__decoder is None:
+                    while 0 < len(raw) < 4:
+                        more = self.__read_raw(size)
+
+                        if not more:
+                            break
+
+                        raw += bytes(more)
+
+                    encoding = detect_encoding(raw)
+                    self.__decoder = codecs.getincrementaldecoder(encoding)('surrogatepass')
+
+                try:
+                    text = self.__decoder.decode(raw, not raw)
+                except UnicodeDecodeError:
+                    return None
+            else:
+                return None
+
+            self.__size += len(raw)
+
+            if self.max_size is not None and self.__size > self.max_size:
+                return None
+
+            # a chunk may contain just a part of a multi byte char, in which case there is nothing to return yet
+            if text or not raw:
+                return text
+
+    def __skip_string(self, text: str) -> Optional[str]:
+        # text follows the opening quote of a string, the text following the closing quote is returned
+        # (None if the string is not valid or not terminated)
+        while True:
+            end = JSON_STRING_BODY_RE.match(text).end()
+
+            if end < len(text):
+                if text[end] == '"':
+                    return text[end + 1:]
+
+                # only an escape sequence cut by the end of the chunk is carried to the next one
+                if JSON_STRING_ESCAPE_PREFIX_RE.fullmatch(text, end) is None:
+                    return None
+
+                carry = text[end:]
+            else:
+                carry = ''
+
+            more = self.__read(self.chunk_size)
+
+            if not more:
+                return None
+
+            text = carry + more
+
+    def is_valid(self) -> bool:
+        buffer = self.__open()
+
+        if buffer is None or (self.max_size is not None and self.__size > self.max_size):
+            return False
+
+        is_last = self.__read_raw is None or not buffer
+        position = 0
+        stack = []
+        expect = VALUE
+
+        # true right after an open bracket (so that empty containers are accepted)
+        can_close = False
+
+        while True:
+            # nothing but white spaces can follow the top level value
+            if expect == END:
+                if buffer[position:].strip(WHITESPACE):
+                    return False
+
+                if is_last:
+                    return True
+
+                buffer = self.__read(self.chunk_size)
+
+                if buffer is None:
+                    return False
+
+                is_last = not buffer
+                position = 0
+                continue
+
+            if expect == KEY or (expect == VALUE and stack and stack[-1] == '['):
+                regex = JSON_OBJECT_MEMBERS_RE if expect == KEY else JSON_ARRAY_ITEMS_RE
+                end = regex.match(buffer, position).end()
+
+                if end > position:
+                    position = end
+                    can_close = False
+
+            match = JSON_TOKEN_RE.match(buffer, position)
+
+            # a token at the very end of the buffer may be incomplete (eg: "12" followed by ".5" in the next chunk),
+            # in which case more text is needed to check it
+            if not is_last and (match is None or match.end() + 2 >= len(buffer)):
+                if match is None:
+                    pending = buffer[position:].lstrip(WHITESPACE)
+
+                    # strings may be longer than the chunks, they are skipped without keeping them in the buffer,
+                    # and replaced by an empty string (so the token is checked as usual)
+                    if pending.startswith('"'):
+                        rest = self.__skip_string(pending[1:])
+
+                        if rest is None:
+                            return False
+
+                        buffer = '""' + rest
+                        position = 0
+                        continue
+
+                    # no need to read more for tokens which are already longer than any other (but strings)
+                    if len(pending) > MAX_NON_STRING_TOKEN_SIZE:
+                        return False
+
+                # the size of reads grows with the pending text, so that long tokens are not scanned over and over
+                more = self.__read(max(self.chunk_size, len(buffer) - position))
+
+                if more is None:
+                    return False
+
+                is_last = not more
+                buffer = buffer[position:] + more
+                position = 0
+                continue
+
+            if match is None:
+                return False
+
+            token, colon = match.groups()
+            position = match.end()
+            char = token[0]
+
+            if colon is not None:
+                if expect != KEY or char != '"':
+                    return False
+
+                expect = VALUE
+                can_close = False
+                continue
+
+            if char == '[' or char == '{':
+                if expect != VALUE:
+                    return False
+
+                stack.append(char)
+
+                if self.max_depth is not None and len(stack) > self.max_depth:
+                    return False
+
+                expect = VALUE if char == '[' else KEY
+                can_close = True
+                continue
+
+            if char == ']' or char == '}':
+                if not stack or stack[-1] != ('[' if char == ']' else '{'):
+                    return False
+
+                if expect != COMMA_OR_CLOSE and not can_close:
+                    return False
+
+                stack.pop()
+                expect = COMMA_OR_CLOSE if stack else END
+            elif char == ',':
+                if expect != COMMA_OR_CLOSE:
+                    return False
+
+                expect = VALUE if stack[-1] == '[' else KEY
+            elif char == ':':
+                if expect != COLON:
+                    return False
+
+                expect = VALUE
+            elif expect == KEY:
+                if char != '"':
+                    return False
+
+                expect = COLON
+            elif expect == VALUE and stack:
+                expect = COMMA_OR_CLOSE
+            else:
+                # top level scalars are not accepted
+                return False
+
+            can_close = False
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import re
+from typing import Optional
 
 # INTERNAL USE ONLY REGEX!
 
@@ -22,6 +23,8 @@ URL_RE = re.compile(r'^{}$'.format(URLS_RAW_STRING), re.IGNORECASE)
 
 URLS_RE = re.compile(r'({})'.format(URLS_RAW_STRING), re.IGNORECASE)
 
+URLS_BYTES_RE = re.compile(r'({})'.format(URLS_RAW_STRING).encode('ascii'), re.IGNORECASE)
+
 ESCAPED_AT_SIGN = re.compile(r'(?!"[^"]*)@+(?=[^"]*")|\\@')
 
 EMAILS_RAW_STRING = r"[a-zA-Z\d._\+\-'`!%#$&*/=\?\^\{\}\|~\\]+@[a-z\d-]+\.?[a-z\d-]+\.[a-z]{2,4}"
@@ -30,6 +33,15 @@ EMAIL_RE = re.compile(r'^{}$'.format(EMAILS_RAW_STRING))
 
 EMAILS_RE = re.compile(r'({})'.format(EMAILS_RAW_STRING))
 
+EMAILS_BYTES_RE = re.compile(r'({})'.format(EMAILS_RAW_STRING).encode('ascii'))
+
+# matches the most common email shape (unquoted head without escaped signs or consecutive dots), the first group
+# captures the head so that its size can be checked without splitting the string
+EMAIL_FAST_RE = re.compile(
+    r"([a-zA-Z\d_\+\-'`!%#$&*/=\?\^\{\}\|~\\]+(?:\.[a-zA-Z\d_\+\-'`!%#$&*/=\?\^\{\}\|~\\]+)*)"
+    r'@[a-z\d-]+\.?[a-z\d-]+\.[a-z]{2,4}'
+)
+
 CAMEL_CASE_TEST_RE = re.compile(r'^[a-zA-Z]*([a-z]+[A-Z]+|[A-Z]+[a-z]+)[a-zA-Z\d]*$')
 
 CAMEL_CASE_REPLACE_RE = re.compile(r'([a-z]|[A-Z]+)(?=[A-Z])')
@@ -53,13 +65,53 @@ CREDIT_CARDS = {
 
 JSON_WRAPPER_RE = re.compile(r'^\s*[\[{]\s*(.*)\s*[\}\]]\s*$', re.MULTILINE | re.DOTALL)
 
+# json tokens, same grammar of `json.loads()` (which also accepts NaN, Infinity and -Infinity)
+JSON_STRING_RAW_STRING = r'"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"'
+
+JSON_SCALAR_RAW_STRING = (
+    JSON_STRING_RAW_STRING +
+    r'|-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?'
+    r'|true|false|null|NaN|Infinity|-Infinity'
+)
+
+# a colon following a token is matched as well (it is valid only after keys, which are then checked at once)
+JSON_TOKEN_RE = re.compile(r'[ \t\n\r]*(' + JSON_SCALAR_RAW_STRING + r'|[\[\]{},:])(?:[ \t\n\r]*(:))?')
+
+# body of a string (after the opening quote), which is scanned in chunks when it spans multiple reads
+JSON_STRING_BODY_RE = re.compile(r'[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*')
+
+# escape sequence cut by the end of a chunk
+JSON_STRING_ESCAPE_PREFIX_RE = re.compile(r'\\(?:u[0-9a-fA-F]{0,3})?')
+
+# runs of scalar items of an array, each one followed by a comma (runs are capped since the regex engine keeps
+# backtracking data for each repetition, which would take hundreds of MB on arrays with millions of items)
+JSON_ARRAY_ITEMS_RE = re.compile(r'(?:[ \t\n\r]*(?:' + JSON_SCALAR_RAW_STRING + r')[ \t\n\r]*,){0,256}')
+
+# runs of members of an object having a scalar value, each one followed by a comma (capped as above)
+JSON_OBJECT_MEMBERS_RE = re.compile(
+    r'(?:[ \t\n\r]*' + JSON_STRING_RAW_STRING + r'[ \t\n\r]*:[ \t\n\r]*(?:' + JSON_SCALAR_RAW_STRING + r')'
+    r'[ \t\n\r]*,){0,256}'
+)
+
+# digits in the ascii range only ("\d" and `str.isdecimal()` accept any unicode decimal digit)
+ASCII_DIGITS_RE = re.compile(r'[0-9]*')
+
 UUID_RE = re.compile(r'^[a-f\d]{8}-[a-f\d]{4}-[a-f\d]{4}-[a-f\d]{4}-[a-f\d]{12}$', re.IGNORECASE)
 
 UUID_HEX_OK_RE = re.compile(r'^[a-f\d]{8}-?[a-f\d]{4}-?[a-f\d]{4}-?[a-f\d]{4}-?[a-f\d]{12}$', re.IGNORECASE)
 
-SHALLOW_IP_V4_RE = re.compile(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$')
+# explicit upper case ranges are used in place of IGNORECASE, which makes the match several times slower
+UUID_BATCH_RE = re.compile(r'[0-9a-fA-F-]*')
+
+# chars allowed for the first digit of the fourth group when the variant is the RFC 4122 one (binary 10xx)
+UUID_VARIANT_DIGITS_RE = re.compile(r'[89abAB]*')
 
-IP_V6_RE = re.compile(r'^([a-z\d]{0,4}:){7}[a-z\d]{0,4}$', re.IGNORECASE)
+IP_V4_RE = re.compile(r'(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})')
+
+IP_V6_HEX_RE = re.compile(r'[0-9a-f]*', re.IGNORECASE)
+
+# prefix length of a CIDR notation (range is checked by the caller, since it depends on the ip version)
+CIDR_PREFIX_RE = re.compile(r'[0-9]{1,3}')
 
 WORDS_COUNT_RE = re.compile(r'\W*[^\W_]+\W*', re.IGNORECASE | re.MULTILINE | re.UNICODE)
 
@@ -73,11 +125,24 @@ HTML_TAG_ONLY_RE = re.compile(
     re.IGNORECASE | re.MULTILINE | re.DOTALL
 )
 
+# used by the html scanner (see `_html.py`)
+HTML_OPEN_TAG_START_RE = re.compile(r'<(?:[a-z]+:)?([a-z]+)', re.IGNORECASE)
+
+HTML_CLOSING_TAG_RE = re.compile(r'</([a-z]+:)?[a-z]+>', re.IGNORECASE)
+
+HTML_PARTIAL_CLOSING_TAG_RE = re.compile(r'</(?:[a-z]+:)?[a-z]*', re.IGNORECASE)
+
+HTML_DOCTYPE_START_RE = re.compile(r'<!doctype', re.IGNORECASE)
+
 SPACES_RE = re.compile(r'\s')
 
+# Most of the prettify regex are made by many alternatives starting with a lookbehind, which are very expensive
+# to evaluate on every position of the string. Each of them is therefore prefixed by a lookahead listing the only
+# chars that can start a match, so that any other position is discarded immediately.
 PRETTIFY_RE = {
     # match repetitions of signs that should not be repeated (like multiple spaces or duplicated quotes)
     'DUPLICATES': re.compile(
+        r'(?=[(){}\[\]:,;+\-\s%="\'])'
         r'(\({2,}|\){2,}|\[{2,}|\]{2,}|{{2,}|\}{2,}|:{2,}|,{2,}|;{2,}|\+{2,}|-{2,}|\s{2,}|%{2,}|={2,}|"{2,}|\'{2,})',
         re.MULTILINE
     ),
@@ -85,6 +150,7 @@ PRETTIFY_RE = {
     # check that a sign cannot have a space before or missing a space after,
     # unless it is a dot or a comma, where numbers may follow (5.5 or 5,5 is ok)
     'RIGHT_SPACE': re.compile(
+        r'(?=[\s\d,.;:!?])'
         r'('
         r'(?<=[^\s\d]),(?=[^\s\d])|\s,\s|\s,(?=[^\s\d])|\s,(?!.)|'  # comma (,)
         r'(?<=[^\s\d.])\.+(?=[^\s\d.])|\s\.+\s|\s\.+(?=[^\s\d])|\s\.+(?!\.)|'  # dot (.)
@@ -98,6 +164,7 @@ PRETTIFY_RE = {
     ),
 
     'LEFT_SPACE': re.compile(
+        r'(?=[\s"(])'
         r'('
 
         # quoted text ("hello world")
@@ -117,6 +184,7 @@ PRETTIFY_RE = {
     'UPPERCASE_AFTER_SIGN': re.compile(r'([.?!]\s\w)', re.MULTILINE | re.UNICODE),
 
     'SPACES_AROUND': re.compile(
+        r'(?=[\s+\-/*="(])'
         r'('
         r'(?<=\S)\+(?=\S)|(?<=\S)\+\s|\s\+(?=\S)|'  # plus (+)
         r'(?<=\S)-(?=\S)|(?<=\S)-\s|\s-(?=\S)|'  # minus (-)
@@ -143,6 +211,7 @@ PRETTIFY_RE = {
     ),
 
     'SAXON_GENITIVE': re.compile(
+        r'(?=[\s\'])'
         r'('
         r'(?<=\w)\'\ss\s|(?<=\w)\s\'s(?=\w)|(?<=\w)\s\'s\s(?=\w)'
         r')',
@@ -150,6 +219,8 @@ PRETTIFY_RE = {
     )
 }
 
+SLUG_WORD_RE = re.compile(r'[a-z\d]+')
+
 NO_LETTERS_OR_NUMBERS_RE = re.compile(r'[^\w\d]+|_+', re.IGNORECASE | re.UNICODE)
 
 MARGIN_RE = re.compile(r'^[^\S\r\n]+')
@@ -157,3 +228,63 @@ MARGIN_RE = re.compile(r'^[^\S\r\n]+')
 LOCALE_RE = re.compile(r'^[a-z]{2}_[A-Z]{2}$')
 
 INSENSITIVE_LOCALE_RE = re.compile(r'^[a-z]{2}_[a-z]{2}$', re.IGNORECASE)
+
+# tokens used to train compression dictionaries (runs of word chars or runs of anything else)
+DICTIONARY_TOKEN_RE = re.compile(rb'\w+|\W+')
+
+# Regex depending on a separator sign (which is injected in place of "{sign}" in the template).
+# They are compiled only once for each separator by `get_separator_re()`.
+SEPARATOR_RE_TEMPLATES = {
+    'SNAKE_CASE_TEST': (r'([a-z]+\d*{sign}[a-z\d{sign}]*|{sign}+[a-z\d]+[a-z\d{sign}]*)', re.IGNORECASE),
+    'SEPARATORS_RUN': (r'(?:{sign})+', 0),
+    'DUPLICATED_SEPARATORS': (r'{sign}+', 0),
+}
+
+# regex of the default separators, which are not built from the templates (unlike the ones of custom separators
+# they only match whole strings), they are looked up before the cache so that a cache reset cannot affect them
+__SEPARATOR_RE_DEFAULTS = {
+    ('SNAKE_CASE_TEST', '_'): SNAKE_CASE_TEST_RE,
+    ('SNAKE_CASE_TEST', '-'): SNAKE_CASE_TEST_DASH_RE,
+}
+
+# cache of the regex built from the templates, keyed by (template name, separator)
+__separator_re_cache = {}
+
+# max number of compiled regex in the cache (custom separators are usually very few, this just prevents unbounded
+# memory growth if separators come from untrusted input)
+__SEPARATOR_RE_CACHE_SIZE = 512
+
+
+# compiled uuid regex cache, keyed by (allow_hex, version)
+__uuid_re_cache = {}
+
+
+def get_uuid_re(allow_hex: bool, version: Optional[int]):
+    # meant to be used with `fullmatch()`, if a version is given the variant must be the RFC 4122 one
+    key = (bool(allow_hex), version)
+    regex = __uuid_re_cache.get(key)
+
+    if regex is None:
+        separator = '-?' if allow_hex else '-'
+        version_group = r'[0-9a-fA-F]{4}' if version is None else r'%d[0-9a-fA-F]{3}' % version
+        variant_group = r'[0-9a-fA-F]{4}' if version is None else r'[89abAB][0-9a-fA-F]{3}'
+        groups = (r'[0-9a-fA-F]{8}', r'[0-9a-fA-F]{4}', version_group, variant_group, r'[0-9a-fA-F]{12}')
+        regex = re.compile(separator.join(groups))
+        __uuid_re_cache[key] = regex
+
+    return regex
+
+
+def get_separator_re(template_name: str, separator: str):
+    key = (template_name, separator)
+    regex = __SEPARATOR_RE_DEFAULTS.get(key) or __separator_re_cache.get(key)
+
+    if regex is None:
+        if len(__separator_re_cache) >= __SEPARATOR_RE_CACHE_SIZE:
+            __separator_re_cache.clear()
+
+        template, flags = SEPARATOR_RE_TEMPLATES[template_name]
+        regex = re.compile(template.format(sign=re.escape(separator)), flags)
+        __separator_re_cache[key] = regex
+
+    return regex
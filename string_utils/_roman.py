@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+
+# INTERNAL USE ONLY ROMAN NUMBERS ENCODER/DECODER!
+
+from typing import Iterable, Union
+
+from .validation import is_full_string, is_integer
+
+
+class RomanNumbers:
+    # internal rule mappings for encode()
+    __mappings = [
+        # units
+        {1: 'I', 5: 'V'},
+        # tens
+        {1: 'X', 5: 'L'},
+        # hundreds
+        {1: 'C', 5: 'D'},
+        # thousands
+        {1: 'M'},
+    ]
+
+    # flat sign -> value definitions for decode()
+    __sign_values = {sign: key * 10 ** index for index, m in enumerate(__mappings) for key, sign in m.items()}
+
+    # combining overline (vinculum) used in extended mode, which multiplies by 1000 the value of the preceding sign
+    __overline = '\u0305'
+
+    # lookup tables built lazily on first use (the whole domain is just 1-3999)
+    __encode_table = None
+    __decode_table = None
+
+    @classmethod
+    def __encode_digit(cls, index: int, value: int) -> str:
+        # if digit is zero, there is no sign to display
+        if value == 0:
+            return ''
+
+        # from 1 to 3 we have just to repeat the sign N times (eg: III, XXX...)
+        if value <= 3:
+            return cls.__mappings[index][1] * value
+
+        # if 4 we have to add unit prefix
+        if value == 4:
+            return cls.__mappings[index][1] + cls.__mappings[index][5]
+
+        # if is 5, is a straight map
+        if value == 5:
+            return cls.__mappings[index][5]
+
+        # if 6, 7 or 8 we have to append unit suffixes
+        if value <= 8:
+            suffix = cls.__mappings[index][1] * (value - 5)
+            return cls.__mappings[index][5] + suffix
+
+        # if 9 we have to prepend current unit to next
+        return cls.__mappings[index][1] + cls.__mappings[index + 1][1]
+
+    @classmethod
+    def __build_tables(cls) -> None:
+        # encode digit by digit once per value (from thousands to units), table index is the number itself
+        encode_table = ['']
+
+        for value in range(1, 4000):
+            encoded = ''
+
+            for index in range(3, -1, -1):
+                encoded += cls.__encode_digit(index, value // 10 ** index % 10)
+
+            encode_table.append(encoded)
+
+        # decode table is assigned last, since it is the one used to check if tables are ready
+        cls.__encode_table = encode_table
+        cls.__decode_table = {encoded: value for value, encoded in enumerate(encode_table) if value > 0}
+
+    @classmethod
+    def table(cls) -> list:
+        if cls.__decode_table is None:
+            cls.__build_tables()
+
+        return cls.__encode_table
+
+    @classmethod
+    def decode_table(cls) -> dict:
+        if cls.__decode_table is None:
+            cls.__build_tables()
+
+        return cls.__decode_table
+
+    @classmethod
+    def __encode_extended(cls, input_string: str) -> str:
+        table = cls.table()
+
+        # split digits in groups of 3 (from units to the highest group), each group is a number in the range 0-999
+        # which is encoded as usual and then multiplied by 1000 once for each level by overlining its signs
+        groups = [int(input_string[max(0, end - 3):end]) for end in range(len(input_string), 0, -3)]
+
+        # a highest group lower than 4 is better written with "M" signs in the lower group (eg: MMM instead of III
+        # overlined), just like in standard roman numbers
+        if len(groups) > 1 and groups[-1] < 4:
+            highest_group = groups.pop()
+            groups[-1] += highest_group * 1000
+
+        output = []
+
+        for level in range(len(groups) - 1, -1, -1):
+            encoded_group = table[groups[level]]
+
+            if level > 0:
+                overline = cls.__overline * level
+                encoded_group = ''.join(sign + overline for sign in encoded_group)
+
+            output.append(encoded_group)
+
+        return ''.join(output)
+
+    @classmethod
+    def encode(cls, input_number: Union[str, int], extended: bool = False) -> str:
+        # fast path: plain integers do not need to be validated as strings
+        if type(input_number) is int:
+            value = input_number
+        else:
+            # force input conversion to a string (we need it in order to validate each digit)
+            input_string = str(input_number)
+
+            if not is_integer(input_string):
+                raise ValueError('Invalid input, only strings or integers are allowed')
+
+            value = int(input_string)
+
+        if extended:
+            if value < 1:
+                raise ValueError('Input must be >= 1')
+
+            if value > 3999:
+                return cls.__encode_extended(str(value))
+
+        elif value < 1 or value > 3999:
+            raise ValueError('Input must be >= 1 and <= 3999')
+
+        return cls.table()[value]
+
+    @classmethod
+    def encode_many(cls, input_numbers: Iterable, extended: bool = False) -> list:
+        table = cls.table()
+
+        # any valid integer in the standard range is just looked up, everything else goes through encode()
+        return [
+            table[n] if type(n) is int and 0 < n < 4000 else cls.encode(n, extended)
+            for n in input_numbers
+        ]
+
+    @classmethod
+    def decode(cls, input_string: str, extended: bool = False) -> int:
+        if not is_full_string(input_string):
+            raise ValueError('Input must be a non empty string')
+
+        if cls.__decode_table is None:
+            cls.__build_tables()
+
+        input_string = input_string.upper()
+
+        # fast path: any well formed roman number is in the table
+        value = cls.__decode_table.get(input_string)
+
+        if value is not None:
+            return value
+
+        # track last used value
+        last_value = None
+
+        # computed number to return
+        output = 0
+
+        # number of overlines found after the current sign (extended mode only)
+        overlines = 0
+
+        # Non canonical strings (eg: "IIII") are still decoded as they always were: parsing from units to thousands,
+        # we add or subtract the value of each sign to the computed output
+        for sign in reversed(input_string):
+            # in extended mode, each overline multiplies by 1000 the value of the sign which precedes it
+            if extended and sign == cls.__overline:
+                overlines += 1
+                continue
+
+            sign_value = cls.__sign_values.get(sign)
+
+            if sign_value is None:
+                raise ValueError('Invalid token found: "{}"'.format(sign))
+
+            if overlines:
+                sign_value *= 1000 ** overlines
+                overlines = 0
+
+            # increase total value if we are moving on with level
+            if last_value is None or sign_value >= last_value:
+                output += sign_value
+
+            # Decrease value if we are back to a previous level
+            # For instance, if we are parsing "IX", we first encounter "X" which is ten then "I" which is unit,
+            # So we have to do the following operation in order to get 9 (the final result): 10 - 1
+            else:
+                output -= sign_value
+
+            last_value = sign_value
+
+        # overlines at the beginning of the string are not related to any sign
+        if overlines:
+            raise ValueError('Invalid token found: "{}"'.format(cls.__overline))
+
+        return output
+
+    @classmethod
+    def decode_many(cls, input_strings: Iterable, extended: bool = False) -> list:
+        if cls.__decode_table is None:
+            cls.__build_tables()
+
+        table = cls.__decode_table
+
+        # upper case well formed roman numbers are just looked up, everything else goes through decode() (including
+        # objects which are not strings, that may not even be hashable)
+        return [(type(s) is str and table.get(s)) or cls.decode(s, extended) for s in input_strings]
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+# public api to export
+__all__ = [
+    'slugify_cached',
+    'asciify_cached',
+    'configure',
+    'info',
+    'clear',
+]
+
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from .errors import InvalidInputError
+from .manipulation import slugify, asciify
+from .validation import is_string
+
+
+# PRIVATE API
+
+
+class __LRUCache:
+    def __init__(self, func: Callable[..., str], maxsize: int, max_bytes: int):
+        self.func = func
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.size_bytes = 0
+        self.__data = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def get(self, key: tuple) -> str:
+        # Hit path does not acquire the lock: OrderedDict get() and move_to_end() are atomic, the only possible
+        # conflict is the entry being evicted by another thread in the meantime, which is harmless.
+        # (for the same reason counters are approximated under heavy concurrency)
+        entry = self.__data.get(key)
+
+        if entry is not None:
+            try:
+                self.__data.move_to_end(key)
+            except KeyError:
+                pass
+
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        value = self.func(*key)
+        entry_bytes = sys.getsizeof(key[0]) + sys.getsizeof(value)
+
+        # values bigger than the whole cache are never stored
+        if entry_bytes > self.max_bytes:
+            return value
+
+        with self.__lock:
+            if key not in self.__data:
+                self.__data[key] = (value, entry_bytes)
+                self.size_bytes += entry_bytes
+
+                # evicts least recently used entries until both limits are respected
+                while len(self.__data) > self.maxsize or self.size_bytes > self.max_bytes:
+                    _, (_, evicted_bytes) = self.__data.popitem(last=False)
+                    self.size_bytes -= evicted_bytes
+
+        return value
+
+    def info(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.__data),
+            'bytes': self.size_bytes,
+        }
+
+    def clear(self):
+        with self.__lock:
+            self.__data.clear()
+            self.size_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+__caches = {
+    'slugify': __LRUCache(slugify, maxsize=100000, max_bytes=64 * 1024 * 1024),
+    'asciify': __LRUCache(asciify, maxsize=100000, max_bytes=64 * 1024 * 1024),
+}
+
+
+# PUBLIC API
+
+
+def slugify_cached(input_string: str, separator: str = '-') -> str:
+    """
+    Same as `slugify()`, but results are kept in a LRU cache (keyed on input string and separator) so that
+    recurring strings are converted only once.
+
+    Cache limits can be changed using `configure()`.
+
+    *Example:*
+
+    >>> slugify_cached('Top 10 Reasons To Love Dogs!!!') # returns: 'top-10-reasons-to-love-dogs'
+
+    :param input_string: String to convert.
+    :type input_string: str
+    :param separator: Sign used to join string tokens (default to "-").
+    :type separator: str
+    :return: Slug string
+    """
+    if not is_string(input_string):
+        raise InvalidInputError(input_string)
+
+    return __caches['slugify'].get((input_string, separator))
+
+
+def asciify_cached(input_string: str) -> str:
+    """
+    Same as `asciify()`, but results are kept in a LRU cache so that recurring strings are converted only once.
+
+    Cache limits can be changed using `configure()`.
+
+    *Example:*
+
+    >>> asciify_cached('èéùúòóäåëýñÅÀÁÇÌÍÑÓË') # returns 'eeuuooaaeynAAACIINOE'
+
+    :param input_string: String to convert
+    :type input_string: str
+    :return: Ascii utf-8 string
+    """
+    if not is_string(input_string):
+        raise InvalidInputError(input_string)
+
+    return __caches['asciify'].get((input_string,))
+
+
+def configure(maxsize: Optional[int] = None, max_bytes: Optional[int] = None, func: Optional[str] = None):
+    """
+    Changes the limits of the caches (entries exceeding the new limits are evicted on next insertion).
+
+    *Example:*
+
+    >>> configure(maxsize=1000, max_bytes=1024 * 1024, func='slugify')
+
+    :param maxsize: Max number of entries (default to 100000).
+    :type maxsize: Optional[int]
+    :param max_bytes: Max (approximated) memory used by keys and values, in bytes (default to 64MB).
+    :type max_bytes: Optional[int]
+    :param func: Name of the cached function to configure ("slugify" or "asciify"), None for all (default).
+    :type func: Optional[str]
+    """
+    for name, value in (('maxsize', maxsize), ('max_bytes', max_bytes)):
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError('{} must be >= 1'.format(name))
+
+    if func is not None and func not in __caches:
+        raise KeyError('Invalid func "{}". Valid values are: {}'.format(func, ', '.join(__caches.keys())))
+
+    for name, cache in __caches.items():
+        if func is None or func == name:
+            cache.maxsize = maxsize or cache.maxsize
+            cache.max_bytes = max_bytes or cache.max_bytes
+
+
+def info() -> Dict[str, Dict[str, Any]]:
+    """
+    Returns statistics about the caches: hits, misses, number of entries and bytes used by each cached function.
+
+    *Example:*
+
+    >>> info() # returns {'slugify': {'hits': 10, 'misses': 2, 'entries': 2, 'bytes': 230}, 'asciify': {...}}
+
+    :return: Dictionary of statistics for each cached function.
+    """
+    return {name: cache.info() for name, cache in __caches.items()}
+
+
+def clear():
+    """
+    Removes all the entries from the caches and resets their statistics.
+    """
+    for cache in __caches.values():
+        cache.clear()
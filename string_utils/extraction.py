@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# public api to export
+__all__ = [
+    'extract_urls',
+    'extract_emails',
+]
+
+from typing import Any, Generator, Pattern
+
+from ._regex import *
+
+
+# PRIVATE API
+
+
+class __StreamExtractor:
+    # Urls and emails never contain white spaces, so the stream can be safely split right after any of these chars
+    # without affecting the matches (the remaining text is carried over and scanned with the next chunk).
+    __text_separators = (' ', '\t', '\n', '\r', '\f', '\v')
+    __bytes_separators = tuple(s.encode('ascii') for s in __text_separators)
+
+    # Streams may have no white spaces at all (eg: minified html or json), in which case the carried over text is cut
+    # anyway keeping only its last part (of this size), so that memory usage does not grow up to the whole stream.
+    # Matches starting before the cut are still scanned on the whole buffer, therefore only urls or emails longer than
+    # this size (and not preceded by a white space) may be truncated.
+    __max_match_size = 16384
+
+    def __init__(self, stream: Any, text_regex: Pattern, bytes_regex: Pattern, chunk_size: int):
+        if not callable(getattr(stream, 'read', None)):
+            raise TypeError('Expected a readable stream, received "{}"'.format(type(stream).__name__))
+
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError('chunk_size must be >= 1')
+
+        self.stream = stream
+        self.text_regex = text_regex
+        self.bytes_regex = bytes_regex
+        self.chunk_size = chunk_size
+
+    def extract(self) -> Generator:
+        chunk = self.stream.read(self.chunk_size)
+
+        # text streams are scanned as they are (offsets are char positions), binary streams and mmap regions are
+        # scanned without decoding them (offsets are byte positions)
+        is_text = isinstance(chunk, str)
+        regex = self.text_regex if is_text else self.bytes_regex
+        separators = self.__text_separators if is_text else self.__bytes_separators
+
+        # stream position of the first char in the buffer
+        offset = 0
+        buffer = chunk[:0]
+
+        while True:
+            buffer += chunk
+            is_last = len(chunk) == 0
+
+            # scan the buffer up to the last separator (or entirely once the stream has been consumed)
+            end = len(buffer) if is_last else max([buffer.rfind(s) for s in separators]) + 1
+            scan_end = end
+
+            # too much text after the last separator: matches starting before the last `__max_match_size` chars are
+            # taken (looking at the whole buffer), the scan is then resumed from the end of the last one
+            if len(buffer) - end > self.__max_match_size:
+                end = len(buffer) - self.__max_match_size
+                scan_end = len(buffer)
+
+            resume_at = end
+
+            for match in regex.finditer(buffer, 0, scan_end):
+                if match.start() >= end:
+                    break
+
+                value = match.group(0)
+                resume_at = max(resume_at, match.end())
+                yield offset + match.start(), value if is_text else value.decode('utf-8', 'replace')
+
+            if is_last:
+                return
+
+            buffer = buffer[resume_at:]
+            offset += resume_at
+            chunk = self.stream.read(self.chunk_size)
+
+
+# PUBLIC API
+
+
+def extract_urls(stream: Any, chunk_size: int = 65536) -> Generator:
+    """
+    Lazily finds all the urls contained into a stream (text file, binary file, mmap or any object with a `read()`
+    method), which is consumed in chunks of the given size, so that huge files can be scanned with constant memory.
+
+    The returned generator produces tuples made by the offset of the url in the stream and the url itself
+    (offsets are char positions for text streams and byte positions for binary ones).
+
+    Memory usage stays bounded even for streams without white spaces (like minified html or json), but in long runs
+    of text without white spaces urls longer than 16384 chars may be truncated.
+
+    *Example:*
+
+    >>> with open('crawl.txt') as f:
+    >>>     for offset, url in extract_urls(f): print(offset, url)
+
+    :param stream: Readable object to scan.
+    :type stream: Any
+    :param chunk_size: Size of each read (default to 65536).
+    :type chunk_size: int
+    :return: Generator of (offset, url) tuples.
+    """
+    return __StreamExtractor(stream, URLS_RE, URLS_BYTES_RE, chunk_size).extract()
+
+
+def extract_emails(stream: Any, chunk_size: int = 65536) -> Generator:
+    """
+    Lazily finds all the emails contained into a stream (text file, binary file, mmap or any object with a `read()`
+    method), which is consumed in chunks of the given size, so that huge files can be scanned with constant memory.
+
+    The returned generator produces tuples made by the offset of the email in the stream and the email itself
+    (offsets are char positions for text streams and byte positions for binary ones).
+
+    Memory usage stays bounded even for streams without white spaces (like minified html or json), but in long runs
+    of text without white spaces emails longer than 16384 chars may be truncated.
+
+    *Example:*
+
+    >>> with open('dump.bin', 'rb') as f:
+    >>>     for offset, email in extract_emails(f): print(offset, email)
+
+    :param stream: Readable object to scan.
+    :type stream: Any
+    :param chunk_size: Size of each read (default to 65536).
+    :type chunk_size: int
+    :return: Generator of (offset, email) tuples.
+    """
+    return __StreamExtractor(stream, EMAILS_RE, EMAILS_BYTES_RE, chunk_size).extract()
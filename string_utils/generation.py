@@ -12,10 +12,88 @@ import binascii
 import os
 import random
 import string
-from typing import Generator
+from collections.abc import Sequence
+from typing import Iterator, Optional, Union
 from uuid import uuid4
 
-from .manipulation import roman_encode
+from ._roman import RomanNumbers
+
+
+# PRIVATE API
+
+
+class __RomanRange(Sequence):
+    # Read only view of the roman numbers tables: each item is looked up by its integer value, so iterating or
+    # accessing items costs as much as a list index (and membership tests as much as a dict lookup)
+
+    def __init__(self, values: range):
+        self.__values = values
+        self.__table = RomanNumbers.table()
+        self.__decode_table = RomanNumbers.decode_table()
+        self.__cursor = None
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, 'Sequence']:
+        if isinstance(index, slice):
+            return self.__class__(self.__values[index])
+
+        return self.__table[self.__values[index]]
+
+    def __value_of(self, item: object) -> Optional[int]:
+        # integer value of the item if it's one of the range numbers, None otherwise
+        value = self.__decode_table.get(item) if isinstance(item, str) else None
+
+        return value if value is not None and value in self.__values else None
+
+    def __contains__(self, item: object) -> bool:
+        return self.__value_of(item) is not None
+
+    def index(self, item: object, start: int = 0, stop: Optional[int] = None) -> int:
+        if start != 0 or stop is not None:
+            return super().index(item, start, stop)
+
+        value = self.__value_of(item)
+
+        if value is None:
+            raise ValueError('{!r} is not in range'.format(item))
+
+        return self.__values.index(value)
+
+    def count(self, item: object) -> int:
+        # numbers of a range are unique
+        return 1 if item in self else 0
+
+    # roman_range() used to return a generator, so it can still be consumed by calling next() on it: once next()
+    # has been called, iterating the range continues from the same cursor (like the generator did), so the numbers
+    # already returned by next() are skipped (while len(), indexing and reversed() always see the whole range)
+    def __iter__(self) -> Iterator[str]:
+        if self.__cursor is not None:
+            return self.__cursor
+
+        return map(self.__table.__getitem__, self.__values)
+
+    def __reversed__(self) -> Iterator[str]:
+        return map(self.__table.__getitem__, reversed(self.__values))
+
+    def __next__(self) -> str:
+        if self.__cursor is None:
+            self.__cursor = iter(self)
+
+        return next(self.__cursor)
+
+    def __repr__(self) -> str:
+        values = self.__values
+
+        if not values:
+            return 'roman_range(empty)'
+
+        # stop is shown inclusive, as it is given to roman_range()
+        return 'roman_range(start={}, stop={}, step={})'.format(values[0], values[-1], values.step)
+
+
+# PUBLIC API
 
 
 def uuid(as_hex: bool = False) -> str:
@@ -85,10 +163,16 @@ def secure_random_hex(byte_count: int) -> str:
     return hex_string
 
 
-def roman_range(stop: int, start: int = 1, step: int = 1) -> Generator:
+def roman_range(stop: int, start: int = 1, step: int = 1) -> Sequence:
     """
-    Similarly to native Python's `range()`, returns a Generator object which generates a new roman number
-    on each iteration instead of an integer.
+    Similarly to native Python's `range()`, returns a sequence of roman numbers instead of integers.
+
+    Like a `range()` it supports `len()`, indexing, slicing and reversed iteration, items are served from a
+    table of the whole roman numbers domain (built once on first use).
+
+    **Bear in mind:** for backward compatibility the sequence can also be consumed by calling `next()` on it, like the
+    generator returned by previous versions. Once `next()` has been called, iterating the sequence continues from the
+    next number instead of starting over (eg: `r = roman_range(3); next(r); list(r)` returns `['II', 'III']`).
 
     *Example:*
 
@@ -96,11 +180,12 @@ def roman_range(stop: int, start: int = 1, step: int = 1) -> Generator:
     >>> # prints: I, II, III, IV, V, VI, VII
     >>> for n in roman_range(start=7, stop=1, step=-1): print(n)
     >>> # prints: VII, VI, V, IV, III, II, I
+    >>> roman_range(100)[41] # returns 'XLII'
 
     :param stop: Number at which the generation must stop (must be <= 3999).
     :param start: Number at which the generation must start (must be >= 1).
     :param step: Increment of each generation step (default to 1).
-    :return: Generator of roman numbers.
+    :return: Sequence of roman numbers.
     """
 
     def validate(arg_value, arg_name, allow_negative=False):
@@ -115,17 +200,6 @@ def roman_range(stop: int, start: int = 1, step: int = 1) -> Generator:
         if arg_value < 1 or arg_value > 3999:
             raise ValueError(msg)
 
-    def generate():
-        current = start
-
-        # generate values for each step
-        while current != stop:
-            yield roman_encode(current)
-            current += step
-
-        # last value to return
-        yield roman_encode(current)
-
     # checks each single argument value
     validate(stop, 'stop')
     validate(start, 'start')
@@ -137,4 +211,7 @@ def roman_range(stop: int, start: int = 1, step: int = 1) -> Generator:
     if forward_exceed or backward_exceed:
         raise OverflowError('Invalid start/stop/step configuration')
 
-    return generate()
+    # stop is inclusive
+    values = range(start, stop + (1 if step > 0 else -1), step)
+
+    return __RomanRange(values)
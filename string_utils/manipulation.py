@@ -7,6 +7,8 @@ __all__ = [
     'reverse',
     'shuffle',
     'strip_html',
+    'strip_html_iter',
+    'strip_html_stream',
     'prettify',
     'asciify',
     'slugify',
@@ -14,199 +16,282 @@ __all__ = [
     'strip_margin',
     'compress',
     'decompress',
+    'train_dictionary',
+    'compress_bytes',
+    'decompress_bytes',
+    'decompress_bytes_range',
+    'compress_stream',
+    'decompress_stream',
     'roman_encode',
     'roman_decode',
+    'roman_encode_many',
+    'roman_decode_many',
+    'isbn_10_to_13',
+    'isbn_check_digit',
+    'parse_ip',
+    'parse_ip_many',
 ]
 
 import base64
+import codecs
 import random
 import unicodedata
 import zlib
-from typing import Union
-from uuid import uuid4
-
+from array import array
+from typing import Any, Generator, Iterable, Iterator, Optional, Tuple, Union
+
+from ._compression import compress as compress_data, decompress as decompress_data, train_dictionary as train
+from ._compression import decompress_range as decompress_data_range
+from ._compression import BLOCKS_HEADER, detect_codec
+from ._html import HtmlScanner
+from ._ip import parse as scan_ip, parse_v4 as scan_ip_v4, parse_v6 as scan_ip_v6
 from ._regex import *
+from ._roman import RomanNumbers
 from .errors import InvalidInputError
-from .validation import is_snake_case, is_full_string, is_camel_case, is_integer, is_string
+from .validation import is_snake_case, is_full_string, is_camel_case, is_string, is_isbn_10
 
 
 # PRIVATE API
 
 
-class __RomanNumbers:
-    # internal rule mappings for encode()
-    __mappings = [
-        # units
-        {1: 'I', 5: 'V'},
-        # tens
-        {1: 'X', 5: 'L'},
-        # hundreds
-        {1: 'C', 5: 'D'},
-        # thousands
-        {1: 'M'},
-    ]
+class __StringCompressor:
+
+    @staticmethod
+    def __require_valid_input_and_encoding(input_string: str, encoding: str):
+        if not is_string(input_string):
+            raise InvalidInputError(input_string)
 
-    # swap key/value definitions for decode()
-    __reversed_mappings = [{v: k for k, v in m.items()} for m in __mappings]
+        if len(input_string) == 0:
+            raise ValueError('Input string cannot be empty')
+
+        if not is_string(encoding):
+            raise ValueError('Invalid encoding')
+
+    @staticmethod
+    def __require_valid_dictionaries(dictionaries: tuple):
+        for dictionary in dictionaries:
+            if not isinstance(dictionary, bytes) or len(dictionary) == 0:
+                raise ValueError('Invalid dictionary: it must be a non empty "bytes" object')
+
+    @staticmethod
+    def __require_valid_threads(threads: int):
+        if not isinstance(threads, int) or threads < 1:
+            raise ValueError('threads must be >= 1')
+
+    @staticmethod
+    def __require_valid_compression_level(compression_level: int):
+        if not isinstance(compression_level, int) or compression_level < 0 or compression_level > 9:
+            raise ValueError('Invalid compression_level: it must be an "int" between 0 and 9')
 
     @classmethod
-    def __encode_digit(cls, index: int, value: int) -> str:
-        # if digit is zero, there is no sign to display
-        if value == 0:
-            return ''
+    def compress(cls,
+                 input_string: str,
+                 encoding: str = 'utf-8',
+                 compression_level: int = 9,
+                 codec: str = 'zlib',
+                 dictionary: Optional[bytes] = None,
+                 threads: int = 1) -> str:
+        cls.__require_valid_input_and_encoding(input_string, encoding)
+        cls.__require_valid_compression_level(compression_level)
+        cls.__require_valid_dictionaries(() if dictionary is None else (dictionary,))
+        cls.__require_valid_threads(threads)
 
-        # from 1 to 3 we have just to repeat the sign N times (eg: III, XXX...)
-        if value <= 3:
-            return cls.__mappings[index][1] * value
+        # turns input string into a sequence of bytes using provided encoding
+        original_bytes = input_string.encode(encoding)
 
-        # if 4 we have to add unit prefix
-        if value == 4:
-            return cls.__mappings[index][1] + cls.__mappings[index][5]
+        # compress bytes using the given codec (a header byte identifying the codec is added, unless it's zlib)
+        compressed_bytes = compress_data(original_bytes, codec, compression_level, dictionary, threads)
 
-        # if is 5, is a straight map
-        if value == 5:
-            return cls.__mappings[index][5]
+        # encode compressed bytes using base64
+        # (this ensure that all characters will be available and that the output string can be used safely in any
+        # context such URLs)
+        encoded_bytes = base64.urlsafe_b64encode(compressed_bytes)
 
-        # if 6, 7 or 8 we have to append unit suffixes
-        if value <= 8:
-            suffix = cls.__mappings[index][1] * (value - 5)
-            return cls.__mappings[index][5] + suffix
+        # finally turns base64 bytes into a string
+        output = encoded_bytes.decode(encoding)
 
-        # if 9 we have to prepend current unit to next
-        return cls.__mappings[index][1] + cls.__mappings[index + 1][1]
+        return output
 
     @classmethod
-    def encode(cls, input_number: Union[str, int]) -> str:
-        # force input conversion to a string (we need it in order to iterate on each digit)
-        input_string = str(input_number)
-
-        if not is_integer(input_string):
-            raise ValueError('Invalid input, only strings or integers are allowed')
+    def decompress(cls,
+                   input_string: str,
+                   encoding: str = 'utf-8',
+                   dictionaries: Optional[Iterable] = None,
+                   threads: int = 1) -> str:
+        cls.__require_valid_input_and_encoding(input_string, encoding)
+        dictionaries = () if dictionaries is None else tuple(dictionaries)
+        cls.__require_valid_dictionaries(dictionaries)
+        cls.__require_valid_threads(threads)
 
-        value = int(input_string)
+        # turns input string into a sequence of bytes
+        # (the string is assumed to be a previously compressed string, therefore we have to decode it using base64)
+        input_bytes = base64.urlsafe_b64decode(input_string)
 
-        if value < 1 or value > 3999:
-            raise ValueError('Input must be >= 1 and <= 3999')
+        # decompress bytes using the codec detected from the header (and the dictionary, if any, whose id is there)
+        decompressed_bytes = decompress_data(input_bytes, dictionaries, threads)
 
-        input_len = len(input_string)
-        output = ''
+        # decode the decompressed bytes to get the original string back
+        original_string = decompressed_bytes.decode(encoding)
 
-        # decode digits from right to left (start from units to thousands)
-        for index in range(input_len):
-            # get actual digit value as int
-            digit = int(input_string[input_len - index - 1])
+        return original_string
 
-            # encode digit to roman string
-            encoded_digit = cls.__encode_digit(index, digit)
+    @staticmethod
+    def __as_bytes_view(data: Any) -> memoryview:
+        try:
+            view = memoryview(data)
+        except TypeError:
+            raise TypeError('Expected a bytes-like object, received "{}"'.format(type(data).__name__))
 
-            # prepend encoded value to the current output in order to have the final string sorted
-            # from thousands to units
-            output = encoded_digit + output
+        # codecs work on flat sequences of bytes (this is a zero copy cast, as long as data is contiguous)
+        if view.ndim != 1 or view.format != 'B':
+            view = view.cast('B') if view.c_contiguous else memoryview(view.tobytes())
 
-        return output
+        return view
 
     @classmethod
-    def __index_for_sign(cls, sign: str) -> int:
-        for index, mapping in enumerate(cls.__reversed_mappings):
-            if sign in mapping:
-                return index
-
-        raise ValueError('Invalid token found: "{}"'.format(sign))
+    def compress_bytes(cls,
+                       data: Any,
+                       compression_level: int = 9,
+                       codec: str = 'zlib',
+                       dictionary: Optional[bytes] = None,
+                       threads: int = 1) -> bytes:
+        view = cls.__as_bytes_view(data)
+        cls.__require_valid_compression_level(compression_level)
+        cls.__require_valid_dictionaries(() if dictionary is None else (dictionary,))
+        cls.__require_valid_threads(threads)
+
+        return compress_data(view, codec, compression_level, dictionary, threads)
 
     @classmethod
-    def decode(cls, input_string: str) -> int:
-        if not is_full_string(input_string):
-            raise ValueError('Input must be a non empty string')
+    def decompress_bytes(cls, data: Any, dictionaries: Optional[Iterable] = None, threads: int = 1) -> bytes:
+        view = cls.__as_bytes_view(data)
+        dictionaries = () if dictionaries is None else tuple(dictionaries)
+        cls.__require_valid_dictionaries(dictionaries)
+        cls.__require_valid_threads(threads)
 
-        # reverse the provided string so that we can start parsing from units to thousands
-        reversed_string = reverse(input_string.upper())
+        return decompress_data(view, dictionaries, threads)
 
-        # track last used value
-        last_value = None
+    @classmethod
+    def decompress_bytes_range(cls,
+                               data: Any,
+                               start: int,
+                               stop: int,
+                               dictionaries: Optional[Iterable] = None,
+                               threads: int = 1) -> bytes:
+        view = cls.__as_bytes_view(data)
+        dictionaries = () if dictionaries is None else tuple(dictionaries)
+        cls.__require_valid_dictionaries(dictionaries)
+        cls.__require_valid_threads(threads)
+
+        for value in (start, stop):
+            if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                raise ValueError('Invalid range: start and stop must be integers >= 0')
+
+        return decompress_data_range(view, start, stop, dictionaries, threads)
 
-        # computed number to return
-        output = 0
+    @classmethod
+    def compress_stream(cls,
+                        chunks: Iterator[str],
+                        encoding: str = 'utf-8',
+                        compression_level: int = 9) -> Iterator[str]:
+        if not is_string(encoding):
+            raise ValueError('Invalid encoding')
 
-        # for each sign in the string we get its numeric value and add or subtract it to the computed output
-        for sign in reversed_string:
-            # are we dealing with units, tens, hundreds or thousands?
-            index = cls.__index_for_sign(sign)
+        cls.__require_valid_compression_level(compression_level)
 
-            # it's basically 1 or 5 (based on mapping rules definitions)
-            key_value = cls.__reversed_mappings[index][sign]
+        encoder = codecs.getincrementalencoder(encoding)()
 
-            # Based on the level (tens, hundreds...) we have to add as many zeroes as the level into which we are
-            # in order to have the actual sign value.
-            # For instance, if we are at level 2 we are dealing with hundreds, therefore instead of 1 or 5, we will
-            # obtain 100 or 500 by adding 2 zeroes
-            sign_value = int(str(key_value) + '0' * index)
+        def generate():
+            compressor = zlib.compressobj(compression_level)
 
-            # increase total value if we are moving on with level
-            if last_value is None or sign_value >= last_value:
-                output += sign_value
+            # compressed bytes not yet encoded (base64 works on groups of 3 bytes, padding is allowed only at the end)
+            pending = b''
 
-            # Decrease value if we are back to a previous level
-            # For instance, if we are parsing "IX", we first encounter "X" which is ten then "I" which is unit,
-            # So we have to do the following operation in order to get 9 (the final result): 10 - 1
-            else:
-                output -= sign_value
+            for chunk in chunks:
+                pending += compressor.compress(encoder.encode(chunk))
+                size = len(pending) - len(pending) % 3
 
-            last_value = sign_value
+                if size > 0:
+                    yield base64.urlsafe_b64encode(pending[:size]).decode('ascii')
+                    pending = pending[size:]
 
-        return output
+            pending += compressor.compress(encoder.encode('', final=True)) + compressor.flush()
 
+            yield base64.urlsafe_b64encode(pending).decode('ascii')
 
-class __StringCompressor:
+        return generate()
 
     @staticmethod
-    def __require_valid_input_and_encoding(input_string: str, encoding: str):
-        if not is_string(input_string):
-            raise InvalidInputError(input_string)
-
-        if len(input_string) == 0:
-            raise ValueError('Input string cannot be empty')
+    def __require_streamable_header(header: bytes):
+        # only plain zlib data can be decompressed incrementally, other formats produced by compress() are detected
+        # here, so that they are not reported as corrupted data by zlib
+        codec = detect_codec(header)
+
+        if len(header) > 0 and header[0] == BLOCKS_HEADER:
+            reason = 'data compressed using multiple threads'
+        elif codec is not None and codec.name != 'zlib':
+            reason = 'data compressed using "{}" codec'.format(codec.name)
+        elif codec is not None and len(header) > 1 and header[1] & 0x20:
+            # FDICT flag of the zlib header
+            reason = 'data compressed using a dictionary'
+        else:
+            return
+
+        raise ValueError('Cannot decompress stream of {}: use decompress() instead'.format(reason))
 
+    @classmethod
+    def decompress_stream(cls, chunks: Iterator[str], encoding: str = 'utf-8') -> Iterator[str]:
         if not is_string(encoding):
             raise ValueError('Invalid encoding')
 
-    @classmethod
-    def compress(cls, input_string: str, encoding: str = 'utf-8', compression_level: int = 9) -> str:
-        cls.__require_valid_input_and_encoding(input_string, encoding)
+        decoder = codecs.getincrementaldecoder(encoding)()
 
-        if not isinstance(compression_level, int) or compression_level < 0 or compression_level > 9:
-            raise ValueError('Invalid compression_level: it must be an "int" between 0 and 9')
+        def generate():
+            decompressor = zlib.decompressobj()
 
-        # turns input string into a sequence of bytes using provided encoding
-        original_bytes = input_string.encode(encoding)
+            # base64 chars not yet decoded (base64 works on groups of 4 chars)
+            pending = ''
 
-        # compress bytes using zlib library
-        compressed_bytes = zlib.compress(original_bytes, compression_level)
+            # the first 2 compressed bytes, kept until the header has been checked
+            header = b''
 
-        # encode compressed bytes using base64
-        # (this ensure that all characters will be available and that the output string can be used safely in any
-        # context such URLs)
-        encoded_bytes = base64.urlsafe_b64encode(compressed_bytes)
+            for chunk in chunks:
+                # white spaces (like line breaks of wrapped text) are ignored by the base64 decoder, but they must not
+                # be counted in the groups of 4 chars
+                pending += ''.join(chunk.split())
+                size = len(pending) - len(pending) % 4
 
-        # finally turns base64 bytes into a string
-        output = encoded_bytes.decode(encoding)
+                if size > 0:
+                    data = base64.urlsafe_b64decode(pending[:size])
+                    pending = pending[size:]
 
-        return output
+                    if len(header) < 2:
+                        header += data[:2 - len(header)]
 
-    @classmethod
-    def decompress(cls, input_string: str, encoding: str = 'utf-8') -> str:
-        cls.__require_valid_input_and_encoding(input_string, encoding)
+                        if len(header) == 2:
+                            cls.__require_streamable_header(header)
 
-        # turns input string into a sequence of bytes
-        # (the string is assumed to be a previously compressed string, therefore we have to decode it using base64)
-        input_bytes = base64.urlsafe_b64decode(input_string)
+                    output = decoder.decode(decompressor.decompress(data))
 
-        # decompress bytes using zlib
-        decompressed_bytes = zlib.decompress(input_bytes)
+                    if output:
+                        yield output
 
-        # decode the decompressed bytes to get the original string back
-        original_string = decompressed_bytes.decode(encoding)
+            data = base64.urlsafe_b64decode(pending)
 
-        return original_string
+            if len(header) < 2:
+                cls.__require_streamable_header(header + data[:2 - len(header)])
+
+            output = decompressor.decompress(data) + decompressor.flush()
+
+            if not decompressor.eof:
+                raise zlib.error('Error -5 while decompressing data: incomplete or truncated stream')
+
+            output = decoder.decode(output, final=True)
+
+            if output:
+                yield output
+
+        return generate()
 
 
 class __StringFormatter:
@@ -241,42 +326,115 @@ class __StringFormatter:
     def __fix_saxon_genitive(self, regex_match):
         return regex_match.group(1).replace(' ', '') + ' '
 
-    # generates a placeholder to inject temporary into the string, it will be replaced with the original
-    # value at the end of the process
+    # Returns the prefix of the placeholders to inject temporary into the string (they will be replaced with the
+    # original value at the end of the process).
+    # The prefix is made longer until it's not contained into the string, so that placeholders cannot be confused
+    # with the original text.
+    @staticmethod
+    def __placeholder_prefix(input_string: str) -> str:
+        prefix = '$ph'
+
+        while prefix in input_string:
+            prefix += 'h'
+
+        return prefix
+
+    # finds urls and emails (in this order, emails contained into urls are already protected by the url itself)
     @staticmethod
-    def __placeholder_key():
-        return '$' + uuid4().hex + '$'
+    def __protected_spans(input_string: str) -> list:
+        spans = [m.span() for m in URLS_RE.finditer(input_string)]
+
+        if '@' in input_string:
+            url_spans = spans
+            spans = []
+            url_index = 0
+
+            for email_match in EMAILS_RE.finditer(input_string):
+                start, end = email_match.span()
+
+                # url spans are sorted too, so we only have to move forward on them
+                while url_index < len(url_spans) and url_spans[url_index][1] <= start:
+                    spans.append(url_spans[url_index])
+                    url_index += 1
+
+                if url_index == len(url_spans) or end <= url_spans[url_index][0]:
+                    spans.append((start, end))
+
+            spans.extend(url_spans[url_index:])
+
+        return spans
 
     def format(self) -> str:
-        # map of temporary placeholders
-        placeholders = {}
         out = self.input_string
+        prefix = self.__placeholder_prefix(out)
+
+        # original values replaced by placeholders (the placeholder of each value contains its index in the list)
+        protected_values = []
+        tokens = []
+        last_end = 0
 
-        # looks for url or email and updates placeholders map with found values
-        placeholders.update({self.__placeholder_key(): m[0] for m in URLS_RE.findall(out)})
-        placeholders.update({self.__placeholder_key(): m for m in EMAILS_RE.findall(out)})
+        # builds the string with placeholders in a single pass
+        for start, end in self.__protected_spans(out):
+            tokens.append(out[last_end:start])
+            tokens.append(prefix + str(len(protected_values)) + '$')
+            protected_values.append(out[start:end])
+            last_end = end
 
-        # replace original value with the placeholder key
-        for p in placeholders:
-            out = out.replace(placeholders[p], p, 1)
+        if protected_values:
+            tokens.append(out[last_end:])
+            out = ''.join(tokens)
+
+        # rules involving quotes, brackets or apostrophes are skipped when those signs are not in the string at all
+        # (no rule adds them, so the check is safe), this avoids useless full scans of the string
+        has_quotes_or_brackets = '"' in out or '(' in out
 
         out = PRETTIFY_RE['UPPERCASE_FIRST_LETTER'].sub(self.__uppercase_first_char, out)
         out = PRETTIFY_RE['DUPLICATES'].sub(self.__remove_duplicates, out)
         out = PRETTIFY_RE['RIGHT_SPACE'].sub(self.__ensure_right_space_only, out)
-        out = PRETTIFY_RE['LEFT_SPACE'].sub(self.__ensure_left_space_only, out)
+
+        if has_quotes_or_brackets:
+            out = PRETTIFY_RE['LEFT_SPACE'].sub(self.__ensure_left_space_only, out)
+
         out = PRETTIFY_RE['SPACES_AROUND'].sub(self.__ensure_spaces_around, out)
-        out = PRETTIFY_RE['SPACES_INSIDE'].sub(self.__remove_internal_spaces, out)
+
+        if has_quotes_or_brackets:
+            out = PRETTIFY_RE['SPACES_INSIDE'].sub(self.__remove_internal_spaces, out)
+
         out = PRETTIFY_RE['UPPERCASE_AFTER_SIGN'].sub(self.__uppercase_first_letter_after_sign, out)
-        out = PRETTIFY_RE['SAXON_GENITIVE'].sub(self.__fix_saxon_genitive, out)
+
+        if "'" in out:
+            out = PRETTIFY_RE['SAXON_GENITIVE'].sub(self.__fix_saxon_genitive, out)
+
         out = out.strip()
 
-        # restore placeholder keys with their associated original value
-        for p in placeholders:
-            out = out.replace(p, placeholders[p], 1)
+        # restore placeholders with their associated original value
+        if protected_values:
+            placeholder_re = re.compile(re.escape(prefix) + r'(\d+)\$')
+            out = placeholder_re.sub(lambda m: protected_values[int(m.group(1))], out)
 
         return out
 
 
+def __text_chunks(source: Any, chunk_size: int) -> Iterator[str]:
+    # validates arguments eagerly, so that errors are raised on call and not on first iteration
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError('chunk_size must be >= 1')
+
+    if callable(getattr(source, 'read', None)):
+        chunks = iter(lambda: source.read(chunk_size), '')
+    else:
+        chunks = iter(source)
+
+    def generate():
+        for chunk in chunks:
+            if not is_string(chunk):
+                raise InvalidInputError(chunk)
+
+            yield chunk
+
+    return generate()
+
+
 # PUBLIC API
 
 def reverse(input_string: str) -> str:
@@ -379,29 +537,141 @@ def shuffle(input_string: str) -> str:
     return ''.join(chars)
 
 
-def strip_html(input_string: str, keep_tag_content: bool = False) -> str:
+def strip_html(input_string: str, keep_tag_content: bool = False, engine: str = 'regex') -> str:
     """
     Remove html code contained into the given string.
 
+    Two engines are available:
+
+    - "regex" (default): tags are removed using regular expressions
+    - "scanner": tags are removed by a single pass scanner whose execution time is always linear in the string size,\
+    which makes it safe for large or untrusted documents (regular expressions may take a quadratic time on documents\
+    with many unclosed tags or comments). Moreover comments are removed up to their own end (instead of the end of\
+    the last comment in the document), content is never removed for void or self closing tags (like `<br>` or\
+    `<hr />`) and stray closing tags are removed too.
+
     *Examples:*
 
     >>> strip_html('test: <a href="foo/bar">click here</a>') # returns 'test: '
     >>> strip_html('test: <a href="foo/bar">click here</a>', keep_tag_content=True) # returns 'test: click here'
+    >>> strip_html('<!-- a --> b <!-- c -->', engine='scanner') # returns ' b '
 
     :param input_string: String to manipulate.
     :type input_string: str
     :param keep_tag_content: True to preserve tag content, False to remove tag and its content too (default).
     :type keep_tag_content: bool
+    :param engine: Engine to use: "regex" (default) or "scanner".
+    :type engine: str
     :return: String with html removed.
     """
     if not is_string(input_string):
         raise InvalidInputError(input_string)
 
+    if engine == 'scanner':
+        return HtmlScanner(keep_tag_content).feed(input_string, final=True)
+
+    if engine != 'regex':
+        raise ValueError('Invalid engine "{}". Valid engines are: regex, scanner'.format(engine))
+
     r = HTML_TAG_ONLY_RE if keep_tag_content else HTML_RE
 
     return r.sub('', input_string)
 
 
+def strip_html_iter(source: Any,
+                    keep_tag_content: bool = False,
+                    chunk_size: int = 65536,
+                    max_tag_size: Optional[int] = 1048576) -> Generator:
+    """
+    Remove html code from a stream of text, producing the stripped text incrementally.
+
+    The source can be a readable text stream (like a file opened in text mode), which is read in chunks of the given
+    size, or any iterable of strings. Tags split across chunks are handled correctly, since only the text which
+    may still be part of a tag is carried over to the next chunk.
+
+    Stripping rules are the same of `strip_html()` with `engine='scanner'`.
+
+    **Bear in mind**: a tag or comment has to be kept in memory until its terminator (">" or "-->") is found and,
+    when `keep_tag_content` is False, the content of a tag has to be kept in memory until its closing tag is found
+    (since it is removed only if a closing tag actually follows). To bound the memory used, a tag, comment or
+    content which is longer than `max_tag_size` chars is processed as if it was never terminated: its "<" (or its
+    content) is kept as text, exactly like it happens at the end of the document. Therefore the memory used depends
+    on `chunk_size` and `max_tag_size`, but not on the size of the document (unless `max_tag_size` is None).
+
+    *Example:*
+
+    >>> with open('page.html') as f:
+    >>>     for text in strip_html_iter(f): print(text)
+
+    :param source: Readable text stream or iterable of strings.
+    :type source: Any
+    :param keep_tag_content: True to preserve tag content, False to remove tag and its content too (default).
+    :type keep_tag_content: bool
+    :param chunk_size: Size of each read from readable streams (default to 65536).
+    :type chunk_size: int
+    :param max_tag_size: Max size of a tag, comment or tag content waiting for its terminator (default to 1048576,\
+    None for no limit).
+    :type max_tag_size: Optional[int]
+    :return: Generator of strings without html.
+    """
+    if max_tag_size is not None and (not isinstance(max_tag_size, int) or max_tag_size < 1):
+        raise ValueError('max_tag_size must be >= 1')
+
+    chunks = __text_chunks(source, chunk_size)
+
+    def generate():
+        scanner = HtmlScanner(keep_tag_content, max_tag_size)
+
+        for chunk in chunks:
+            output = scanner.feed(chunk)
+
+            if output:
+                yield output
+
+        output = scanner.feed('', final=True)
+
+        if output:
+            yield output
+
+    return generate()
+
+
+def strip_html_stream(readable: Any,
+                      writable: Any,
+                      keep_tag_content: bool = False,
+                      chunk_size: int = 65536,
+                      max_tag_size: Optional[int] = 1048576) -> int:
+    """
+    Remove html code from a readable text stream and writes the result into a writable text stream,
+    processing the input in chunks (see `strip_html_iter()`).
+
+    *Example:*
+
+    >>> with open('page.html') as src, open('page.txt', 'w') as dst:
+    >>>     strip_html_stream(src, dst)
+
+    :param readable: Readable text stream.
+    :type readable: Any
+    :param writable: Writable text stream.
+    :type writable: Any
+    :param keep_tag_content: True to preserve tag content, False to remove tag and its content too (default).
+    :type keep_tag_content: bool
+    :param chunk_size: Size of each read (default to 65536).
+    :type chunk_size: int
+    :param max_tag_size: Max size of a tag, comment or tag content waiting for its terminator (default to 1048576,\
+    None for no limit).
+    :type max_tag_size: Optional[int]
+    :return: Number of chars written.
+    """
+    written = 0
+
+    for text in strip_html_iter(readable, keep_tag_content, chunk_size, max_tag_size):
+        writable.write(text)
+        written += len(text)
+
+    return written
+
+
 def prettify(input_string: str) -> str:
     """
     Reformat a string by applying the following basic grammar and formatting rules:
@@ -492,7 +762,7 @@ def slugify(input_string: str, separator: str = '-') -> str:
     out = SPACES_RE.sub(separator, out)
 
     # normalize joins (remove duplicates)
-    out = re.sub(re.escape(separator) + r'+', separator, out)
+    out = get_separator_re('DUPLICATED_SEPARATORS', separator).sub(separator, out)
 
     return asciify(out)
 
@@ -558,7 +828,12 @@ def strip_margin(input_string: str) -> str:
     return out
 
 
-def compress(input_string: str, encoding: str = 'utf-8', compression_level: int = 9) -> str:
+def compress(input_string: str,
+             encoding: str = 'utf-8',
+             compression_level: int = 9,
+             codec: str = 'zlib',
+             dictionary: Optional[bytes] = None,
+             threads: int = 1) -> str:
     """
     Compress the given string by returning a shorter one that can be safely used in any context (like URL) and
     restored back to its original state using `decompress()`.
@@ -576,6 +851,30 @@ def compress(input_string: str, encoding: str = 'utf-8', compression_level: int
 
     Behind the scenes this method makes use of the standard Python's zlib and base64 libraries.
 
+    A different compression algorithm can be chosen by using `codec`:
+
+    - "zlib" (default)
+    - "lzma" (best compression ratio, slowest)
+    - "bz2"
+    - "zstd" (requires `zstandard` package)
+    - "lz4" (fastest, requires `lz4` package)
+    - "brotli" (requires `brotli` package)
+
+    Except for zlib, compressed data starts with a byte identifying the codec, so `decompress()` detects it
+    automatically.
+
+    Short strings can be compressed a lot better by using a preset `dictionary` (see `train_dictionary()`),
+    supported by "zlib" and "zstd" codecs. The id of the dictionary is stored into the compressed string, so
+    `decompress()` can pick the right one among the given `dictionaries`.
+
+    Big strings can be compressed using multiple `threads`: the string is split into blocks of 1MB which are
+    compressed independently and concurrently, then stored along with an index of blocks (so they can be
+    decompressed concurrently too, and each block can be decompressed on its own).
+    The result is a bit bigger, since blocks can't reference each other content.
+
+    Strings compressed using a `codec` other than "zlib", a `dictionary` or multiple `threads` can be restored only
+    by `decompress()`, not by `decompress_stream()`.
+
     *Examples:*
 
     >>> n = 0 # <- ignore this, it's a fix for Pycharm (not fixable using ignore comments)
@@ -590,25 +889,228 @@ def compress(input_string: str, encoding: str = 'utf-8', compression_level: int
     :type encoding: str
     :param compression_level: A value between 0 (no compression) and 9 (best compression), default to 9.
     :type compression_level: int
+    :param codec: Compression algorithm to use (default to "zlib").
+    :type codec: str
+    :param dictionary: Preset dictionary to use (default to None).
+    :type dictionary: bytes
+    :param threads: Number of threads to use, if greater than 1 the blocks format is used (default to 1).
+    :type threads: int
     :return: Compressed string.
     """
-    return __StringCompressor.compress(input_string, encoding, compression_level)
+    return __StringCompressor.compress(input_string, encoding, compression_level, codec, dictionary, threads)
 
 
-def decompress(input_string: str, encoding: str = 'utf-8') -> str:
+def decompress(input_string: str,
+               encoding: str = 'utf-8',
+               dictionaries: Optional[Iterable] = None,
+               threads: int = 1) -> str:
     """
     Restore a previously compressed string (obtained using `compress()`) back to its original state.
 
+    The codec used to compress the string is detected automatically, and so is the dictionary (if one has been used)
+    among the provided ones.
+
     :param input_string: String to restore.
     :type input_string: str
     :param encoding: Original string encoding.
     :type encoding: str
+    :param dictionaries: Preset dictionaries that may have been used to compress the string (default to None).
+    :type dictionaries: Optional[Iterable]
+    :param threads: Number of threads used to decompress blocks, if the string has been compressed in blocks\
+    (default to 1).
+    :type threads: int
     :return: Decompressed string.
     """
-    return __StringCompressor.decompress(input_string, encoding)
+    return __StringCompressor.decompress(input_string, encoding, dictionaries, threads)
 
 
-def roman_encode(input_number: Union[str, int]) -> str:
+def train_dictionary(samples: Iterable, size: int = 32768, encoding: str = 'utf-8') -> bytes:
+    """
+    Build a preset dictionary to be used by `compress()` and `decompress()` out of the given sample strings.
+
+    Compressing a short string gives poor results because it has very few repetitions of its own, but many short
+    strings of the same kind (like JSON objects with the same keys) share most of their content: a dictionary made
+    of the sequences which are most commonly shared among samples allows to compress them as if they were
+    repetitions.
+
+    Samples should be representative of the strings that will be compressed. Since zlib can only reference the
+    last 32KB of preceding data, bigger dictionaries are useful only with zstd.
+
+    *Example:*
+
+    >>> dictionary = train_dictionary(json_samples)
+    >>> compressed = compress('{"id": 42, "name": "foo"}', dictionary=dictionary)
+    >>> decompress(compressed, dictionaries=[dictionary]) # returns '{"id": 42, "name": "foo"}'
+
+    :param samples: Iterable of sample strings.
+    :type samples: Iterable
+    :param size: Max size in bytes of the dictionary (default to 32768).
+    :type size: int
+    :param encoding: String encoding (default to "utf-8").
+    :type encoding: str
+    :return: Dictionary bytes.
+    """
+    if not isinstance(size, int) or size < 1:
+        raise ValueError('size must be >= 1')
+
+    if not is_string(encoding):
+        raise ValueError('Invalid encoding')
+
+    def encoded_samples():
+        for sample in samples:
+            if not is_string(sample):
+                raise InvalidInputError(sample)
+
+            yield sample.encode(encoding)
+
+    return train(encoded_samples(), size)
+
+
+def compress_bytes(data: Any,
+                   compression_level: int = 9,
+                   codec: str = 'zlib',
+                   dictionary: Optional[bytes] = None,
+                   threads: int = 1) -> bytes:
+    """
+    Compress the given bytes, returning the raw compressed bytes (without base64 encoding).
+
+    Data can be any object supporting the buffer protocol (`bytes`, `bytearray`, `memoryview`, `array`...), which
+    is read in place without being copied.
+
+    Arguments are the same of `compress()` and the output is the same of `compress()` before base64 encoding,
+    therefore `base64.urlsafe_b64encode(compress_bytes(s.encode()))` is equal to `compress(s)`.
+
+    *Example:*
+
+    >>> compressed = compress_bytes(b'some bytes to compress')
+    >>> decompress_bytes(compressed) # returns b'some bytes to compress'
+
+    :param data: Bytes-like object to compress.
+    :type data: Any
+    :param compression_level: A value between 0 (no compression) and 9 (best compression), default to 9.
+    :type compression_level: int
+    :param codec: Compression algorithm to use (default to "zlib").
+    :type codec: str
+    :param dictionary: Preset dictionary to use (default to None).
+    :type dictionary: bytes
+    :param threads: Number of threads to use, if greater than 1 the blocks format is used (default to 1).
+    :type threads: int
+    :return: Compressed bytes.
+    """
+    return __StringCompressor.compress_bytes(data, compression_level, codec, dictionary, threads)
+
+
+def decompress_bytes(data: Any, dictionaries: Optional[Iterable] = None, threads: int = 1) -> bytes:
+    """
+    Restore bytes previously compressed using `compress_bytes()`.
+
+    Data can be any object supporting the buffer protocol, which is read in place without being copied.
+
+    :param data: Bytes-like object to restore.
+    :type data: Any
+    :param dictionaries: Preset dictionaries that may have been used to compress the data (default to None).
+    :type dictionaries: Optional[Iterable]
+    :param threads: Number of threads used to decompress blocks, if data has been compressed in blocks\
+    (default to 1).
+    :type threads: int
+    :return: Decompressed bytes.
+    """
+    return __StringCompressor.decompress_bytes(data, dictionaries, threads)
+
+
+def decompress_bytes_range(data: Any,
+                           start: int,
+                           stop: int,
+                           dictionaries: Optional[Iterable] = None,
+                           threads: int = 1) -> bytes:
+    """
+    Restore only a range of bytes previously compressed using `compress_bytes()`, which is the same of
+    `decompress_bytes(data)[start:stop]`.
+
+    If data has been compressed in blocks (using multiple threads), only the blocks containing the range are
+    decompressed, otherwise the whole data has to be decompressed.
+
+    *Example:*
+
+    >>> compressed = compress_bytes(huge_log, threads=4)
+    >>> decompress_bytes_range(compressed, 10000000, 10000100) # returns huge_log[10000000:10000100]
+
+    :param data: Bytes-like object to restore.
+    :type data: Any
+    :param start: Offset of the first byte to restore (must be >= 0).
+    :type start: int
+    :param stop: Offset at which the range stops (not included, must be >= 0).
+    :type stop: int
+    :param dictionaries: Preset dictionaries that may have been used to compress the data (default to None).
+    :type dictionaries: Optional[Iterable]
+    :param threads: Number of threads used to decompress blocks (default to 1).
+    :type threads: int
+    :return: Decompressed bytes in the range.
+    """
+    return __StringCompressor.decompress_bytes_range(data, start, stop, dictionaries, threads)
+
+
+def compress_stream(source: Any,
+                    encoding: str = 'utf-8',
+                    compression_level: int = 9,
+                    chunk_size: int = 65536) -> Iterator[str]:
+    """
+    Compress a stream of text incrementally, producing chunks of compressed string.
+
+    The source can be a readable text stream (like a file opened in text mode), which is read in chunks of the given
+    size, or any iterable of strings. Since neither the input nor the output are ever held in memory as a whole,
+    this can be used to compress huge files.
+
+    Joined together, the produced chunks are a string which can be restored using `decompress()`
+    (or `decompress_stream()`).
+
+    *Example:*
+
+    >>> with open('app.log') as src, open('app.log.z', 'w') as dst:
+    >>>     for chunk in compress_stream(src): dst.write(chunk)
+
+    :param source: Readable text stream or iterable of strings.
+    :type source: Any
+    :param encoding: String encoding (default to "utf-8").
+    :type encoding: str
+    :param compression_level: A value between 0 (no compression) and 9 (best compression), default to 9.
+    :type compression_level: int
+    :param chunk_size: Size of each read from readable streams (default to 65536).
+    :type chunk_size: int
+    :return: Iterator of compressed string chunks.
+    """
+    return __StringCompressor.compress_stream(__text_chunks(source, chunk_size), encoding, compression_level)
+
+
+def decompress_stream(source: Any, encoding: str = 'utf-8', chunk_size: int = 65536) -> Iterator[str]:
+    """
+    Restore a previously compressed string (obtained using `compress()` or `compress_stream()`) incrementally,
+    producing chunks of the original string.
+
+    The source can be a readable text stream (like a file opened in text mode), which is read in chunks of the given
+    size, or any iterable of strings.
+
+    **Bear in mind:**
+    Only zlib compressed strings can be restored incrementally: strings compressed by `compress()` using a different
+    `codec`, a `dictionary` or multiple `threads` must be restored using `decompress()` (a ValueError is raised).
+
+    *Example:*
+
+    >>> with open('app.log.z') as src:
+    >>>     for chunk in decompress_stream(src): print(chunk)
+
+    :param source: Readable text stream or iterable of strings.
+    :type source: Any
+    :param encoding: Original string encoding.
+    :type encoding: str
+    :param chunk_size: Size of each read from readable streams (default to 65536).
+    :type chunk_size: int
+    :return: Iterator of decompressed string chunks.
+    """
+    return __StringCompressor.decompress_stream(__text_chunks(source, chunk_size), encoding)
+
+
+def roman_encode(input_number: Union[str, int], extended: bool = False) -> str:
     """
     Convert the given number/string into a roman number.
 
@@ -622,28 +1124,226 @@ def roman_encode(input_number: Union[str, int]) -> str:
     roman numbers rules we can use 3 times M to reach 3000 but we can't go any further in thousands without\
     special "boxed chars").
 
+    If `extended` is True, there is no upper bound: numbers greater than 3999 are written using the vinculum notation,
+    where each sign followed by a combining overline (U+0305) is multiplied by 1000 (once for each overline).
+
     *Examples:*
 
     >>> roman_encode(37) # returns 'XXXVIII'
     >>> roman_encode('2020') # returns 'MMXX'
+    >>> roman_encode(5000, extended=True) # returns 'V\u0305'
 
     :param input_number: An integer or a string to be converted.
     :type input_number: Union[str, int]
+    :param extended: True to allow numbers greater than 3999 (default to False).
+    :type extended: bool
     :return: Roman number string.
     """
-    return __RomanNumbers.encode(input_number)
+    return RomanNumbers.encode(input_number, extended)
 
 
-def roman_decode(input_string: str) -> int:
+def roman_decode(input_string: str, extended: bool = False) -> int:
     """
     Decode a roman number string into an integer if the provided string is valid.
 
+    If `extended` is True, numbers using the vinculum notation (see `roman_encode()`) are decoded too.
+
     *Example:*
 
     >>> roman_decode('VII') # returns 7
+    >>> roman_decode('V\u0305', extended=True) # returns 5000
 
     :param input_string: (Assumed) Roman number
     :type input_string: str
+    :param extended: True to decode numbers in vinculum notation (default to False).
+    :type extended: bool
     :return: Integer value
     """
-    return __RomanNumbers.decode(input_string)
+    return RomanNumbers.decode(input_string, extended)
+
+
+def roman_encode_many(input_numbers: Iterable, extended: bool = False) -> list:
+    """
+    Convert each number/string of the given iterable into a roman number (same rules of `roman_encode()`).
+
+    Numbers in the standard range are looked up from a precomputed table without any further validation,
+    which makes this a lot faster than calling `roman_encode()` in a loop.
+
+    *Example:*
+
+    >>> roman_encode_many([1, 2, 3]) # returns ['I', 'II', 'III']
+
+    :param input_numbers: Iterable of integers or strings to be converted.
+    :type input_numbers: Iterable
+    :param extended: True to allow numbers greater than 3999 (default to False).
+    :type extended: bool
+    :return: List of roman number strings.
+    """
+    return RomanNumbers.encode_many(input_numbers, extended)
+
+
+def roman_decode_many(input_strings: Iterable, extended: bool = False) -> list:
+    """
+    Decode each roman number string of the given iterable into an integer (same rules of `roman_decode()`).
+
+    *Example:*
+
+    >>> roman_decode_many(['I', 'II', 'III']) # returns [1, 2, 3]
+
+    :param input_strings: Iterable of (assumed) roman numbers.
+    :type input_strings: Iterable
+    :param extended: True to decode numbers in vinculum notation (default to False).
+    :type extended: bool
+    :return: List of integer values.
+    """
+    return RomanNumbers.decode_many(input_strings, extended)
+
+
+def isbn_10_to_13(input_string: str, normalize: bool = True) -> str:
+    """
+    Convert an ISBN 10 into the equivalent ISBN 13 (by adding the "978" prefix and computing the new check digit).
+
+    Hyphens in the input are ignored (unless `normalize` is False, see `is_isbn_10()`), the returned ISBN contains
+    digits only.
+
+    *Example:*
+
+    >>> isbn_10_to_13('150-6715214') # returns '9781506715216'
+
+    :param input_string: ISBN 10 to convert.
+    :type input_string: str
+    :param normalize: True to ignore hyphens ("-") in the string (default), false otherwise.
+    :type normalize: bool
+    :return: ISBN 13 string.
+    """
+    if not is_isbn_10(input_string, normalize):
+        raise ValueError('Invalid ISBN 10: "{}"'.format(input_string))
+
+    # is_isbn_10() has already checked that digits are all decimals (but the last one, which is dropped anyway)
+    digits = '978' + ''.join(str(int(char)) for char in input_string.replace('-', '')[:9])
+
+    return digits + isbn_check_digit(digits)
+
+
+def isbn_check_digit(input_string: str, normalize: bool = True) -> str:
+    """
+    Returns the expected check digit of an ISBN 10 or 13, which can be used to fix an ISBN that fails validation
+    because of a wrong check digit.
+
+    The input can be a whole ISBN (whose last digit is ignored) or its digits without the check digit (9 digits for
+    an ISBN 10, 12 for an ISBN 13). Hyphens in the input are ignored, unless `normalize` is False.
+
+    *Examples:*
+
+    >>> isbn_check_digit('1506715215') # returns '4' (the valid ISBN is '1506715214')
+    >>> isbn_check_digit('978-031249858') # returns '0'
+    >>> isbn_check_digit('080442957') # returns 'X'
+
+    :param input_string: ISBN (or ISBN without check digit).
+    :type input_string: str
+    :param normalize: True to ignore hyphens ("-") in the string (default), false otherwise.
+    :type normalize: bool
+    :return: Check digit ("0" to "9", or "X" for ISBN 10).
+    """
+    if not is_string(input_string):
+        raise InvalidInputError(input_string)
+
+    digits = input_string.replace('-', '') if normalize else input_string
+
+    # drops the check digit, if any
+    if len(digits) == 10 and digits[9] in 'Xx':
+        digits = digits[:9]
+    elif len(digits) in (10, 13) and digits[-1].isdecimal():
+        digits = digits[:-1]
+
+    if len(digits) not in (9, 12) or not digits.isdecimal():
+        raise ValueError('Invalid ISBN: "{}"'.format(input_string))
+
+    values = [int(digit) for digit in digits]
+
+    if len(values) == 12:
+        # weights are 1 for even positions, 3 for odd ones
+        return str(-(sum(values[0::2]) + 3 * sum(values[1::2])) % 10)
+
+    # weights go from 1 to 10, since 10 is -1 modulo 11 the check digit is the weighted sum of the other digits
+    check_value = sum(value * weight for weight, value in enumerate(values, 1)) % 11
+
+    return 'X' if check_value == 10 else str(check_value)
+
+
+def parse_ip(input_string: str) -> Tuple[int, int]:
+    """
+    Parse an ip (either v4 or v6, same rules of `is_ip()`) into its version and its packed integer value
+    (the same returned by `int(ipaddress.ip_address(input_string))`, but without creating any object).
+
+    *Examples:*
+
+    >>> parse_ip('192.168.0.1') # returns (4, 3232235521)
+    >>> parse_ip('::ffff:192.168.0.1') # returns (6, 281473913978881)
+
+    :param input_string: Ip to parse.
+    :type input_string: str
+    :return: Tuple containing the ip version (4 or 6) and its integer value.
+    """
+    if not is_string(input_string):
+        raise InvalidInputError(input_string)
+
+    parsed = scan_ip(input_string)
+
+    if parsed is None:
+        raise ValueError('Invalid ip: "{}"'.format(input_string))
+
+    return parsed
+
+
+def parse_ip_many(input_strings: Iterable[Any], version: int = 4) -> Tuple[Union[array, bytes], bytearray]:
+    """
+    Parse many ip of the given version at once into a compact buffer of packed values.
+
+    Ip v4 are stored into an `array('I')` (one unsigned 32 bits integer for each ip), while ip v6 are stored into
+    `bytes` (16 bytes for each ip, in network order), so that large lists can be bucketed/sorted without creating
+    an object for each address.
+    Since invalid strings (including non strings objects and ip of the other version) take a zero value in the
+    buffer, validation results are returned as well in a bytearray (same as `is_ip_many()`).
+
+    *Example:*
+
+    >>> values, valid = parse_ip_many(['192.168.0.1', 'nope', '10.0.0.1'])
+    >>> values # array('I', [3232235521, 0, 167772161])
+    >>> valid # bytearray(b'\\x01\\x00\\x01')
+
+    :param input_strings: Iterable of ip to parse.
+    :type input_strings: Iterable[Any]
+    :param version: Ip version to parse: 4 (default) or 6.
+    :type version: int
+    :return: Tuple containing the packed values buffer and the validation results.
+    """
+    if version not in (4, 6):
+        raise ValueError('Invalid ip version "{}": it must be 4 or 6'.format(version))
+
+    valid = bytearray()
+    append_valid = valid.append
+
+    if version == 4:
+        values = array('I')
+        append_value = values.append
+        parse = scan_ip_v4
+
+        for input_string in input_strings:
+            value = parse(input_string) if isinstance(input_string, str) else None
+            append_value(value or 0)
+            append_valid(value is not None)
+
+        return values, valid
+
+    buffer = bytearray()
+    extend = buffer.extend
+    parse = scan_ip_v6
+    zero = bytes(16)
+
+    for input_string in input_strings:
+        value = parse(input_string) if isinstance(input_string, str) else None
+        extend(zero if value is None else value.to_bytes(16, 'big'))
+        append_valid(value is not None)
+
+    return bytes(buffer), valid
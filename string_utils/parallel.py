@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+# public api to export
+__all__ = [
+    'map',
+]
+
+import builtins
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Generator, Iterable, Optional
+
+
+# PRIVATE API
+
+
+# executed in the worker processes: a whole chunk is processed on each call, so that pickling and inter-process
+# communication costs are paid once per chunk instead of once per string
+def __apply_to_chunk(func: Callable, chunk: list) -> list:
+    return [func(item) for item in chunk]
+
+
+def __chunks(iterable: Iterable, chunksize: int) -> Generator:
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, chunksize))
+
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, chunksize))
+
+
+# PUBLIC API
+
+
+def map(func: Callable[[Any], Any], iterable: Iterable, workers: Optional[int] = None, chunksize: int = 1000) \
+        -> Generator:
+    """
+    Parallel version of the builtin `map()`, which applies the given function to each item of the iterable by using
+    multiple processes, so that CPU-bound functions (like `prettify()`, `slugify()`, `asciify()` or `strip_html()`)
+    are not limited to a single core by the GIL.
+
+    The iterable is consumed lazily and split into chunks, each one processed by a worker process.
+    Results are yielded in the same order of the input as soon as they are available and only a limited amount of
+    chunks is processed at the same time, so that memory usage is bounded even for huge (or infinite) iterables.
+
+    **Bear in mind**: the function must be picklable (a module-level function, not a lambda), and inputs and outputs
+    are sent across processes, so this is worth only for expensive functions or large amount of data.
+
+    *Example:*
+
+    >>> from string_utils import parallel, slugify
+    >>> for slug in parallel.map(slugify, titles, workers=8): print(slug)
+
+    :param func: Function to apply to each item.
+    :type func: Callable[[Any], Any]
+    :param iterable: Items to process.
+    :type iterable: Iterable
+    :param workers: Number of worker processes (default to the number of CPUs), with 1 no process is spawned.
+    :type workers: Optional[int]
+    :param chunksize: Number of items sent to a worker at once (default to 1000).
+    :type chunksize: int
+    :return: Generator of results.
+    """
+    if not callable(func):
+        raise TypeError('func must be callable')
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError('workers must be >= 1')
+
+    if not isinstance(chunksize, int) or chunksize < 1:
+        raise ValueError('chunksize must be >= 1')
+
+    def generate():
+        if workers == 1:
+            yield from builtins.map(func, iterable)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # keeps every worker busy while the results of the oldest chunk are consumed
+            pending = deque()
+
+            for chunk in __chunks(iterable, chunksize):
+                pending.append(executor.submit(__apply_to_chunk, func, chunk))
+
+                if len(pending) >= workers * 2:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+
+    return generate()
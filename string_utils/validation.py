@@ -9,17 +9,26 @@ __all__ = [
     'is_decimal',
     'is_url',
     'is_email',
+    'is_email_many',
     'is_credit_card',
+    'is_credit_card_many',
+    'detect_card_type',
     'is_camel_case',
     'is_snake_case',
     'is_json',
+    'is_json_structure',
+    'validate_json_lines',
     'is_uuid',
+    'is_uuid_many',
     'is_ip_v4',
     'is_ip_v6',
     'is_ip',
+    'is_ip_many',
+    'is_cidr',
     'is_isbn_10',
     'is_isbn_13',
     'is_isbn',
+    'is_isbn_many',
     'is_palindrome',
     'is_pangram',
     'is_isogram',
@@ -28,10 +37,18 @@ __all__ = [
     'words_count',
 ]
 
+import functools
 import json
+import mmap
+import operator
 import string
-from typing import Any, Optional, List
+from itertools import islice
+from typing import Any, Generator, Optional, List, Iterable
+from uuid import UUID
 
+from ._html import contains_tag
+from ._ip import parse as scan_ip, parse_v4 as scan_ip_v4, parse_v6 as scan_ip_v6
+from ._json import JsonScanner
 from ._regex import *
 from .errors import InvalidInputError
 
@@ -40,43 +57,271 @@ from .errors import InvalidInputError
 
 
 class __ISBNChecker:
-    def __init__(self, input_string: str, normalize: bool = True):
+    # Checksums are computed on the encoded digits (so that products and sums run in C rather than one digit at time
+    # in python), the code of "0" (48) multiplied by the sum of the weights is then subtracted to get the actual value
+
+    @staticmethod
+    def digits(input_string: str, normalize: bool = True) -> str:
         if not is_string(input_string):
             raise InvalidInputError(input_string)
 
-        self.input_string = input_string.replace('-', '') if normalize else input_string
+        # the string is copied only if there actually are hyphens to remove
+        if normalize and '-' in input_string:
+            return input_string.replace('-', '')
+
+        return input_string
+
+    @staticmethod
+    def __ascii_digits(digits: str) -> str:
+        # other unicode decimal digits (which were always accepted since they are valid for int()) are converted
+        return ''.join(str(int(digit)) for digit in digits)
+
+    @classmethod
+    def is_isbn_13(cls, digits: str) -> bool:
+        if len(digits) != 13 or not digits.isdecimal():
+            return False
+
+        if ASCII_DIGITS_RE.fullmatch(digits) is None:
+            digits = cls.__ascii_digits(digits)
+
+        # weights are 1 for even positions, 3 for odd ones
+        checksum = sum(digits[0::2].encode()) + 3 * sum(digits[1::2].encode()) - 48 * (7 + 3 * 6)
 
-    def is_isbn_13(self) -> bool:
-        if len(self.input_string) == 13:
-            product = 0
+        return checksum % 10 == 0
 
-            try:
-                for index, digit in enumerate(self.input_string):
-                    weight = 1 if (index % 2 == 0) else 3
-                    product += int(digit) * weight
+    @classmethod
+    def is_isbn_10(cls, digits: str) -> bool:
+        if len(digits) != 10:
+            return False
+
+        # check digit can be "X" (which stands for 10)
+        check_digit = digits[9]
+        digits = digits[:9]
 
-                return product % 10 == 0
+        if check_digit in 'Xx':
+            check_value = 10
+        elif check_digit.isdecimal():
+            check_value = int(check_digit)
+        else:
+            return False
 
-            except ValueError:
-                pass
+        if not digits.isdecimal():
+            return False
+
+        if ASCII_DIGITS_RE.fullmatch(digits) is None:
+            digits = cls.__ascii_digits(digits)
+
+        # weights go from 1 to 10 (position + 1)
+        checksum = sum(map(operator.mul, digits.encode(), range(1, 10))) - 48 * 45 + check_value * 10
+
+        return checksum % 11 == 0
+
+
+class __CreditCardChecker:
+    # card type and allowed numbers of digits by IIN prefix (same rules of CREDIT_CARDS regex), since no prefix is the
+    # beginning of another one, a number can match one prefix at most
+    __prefixes = {
+        '4': ('VISA', (13, 16)),
+        '51': ('MASTERCARD', (16,)),
+        '52': ('MASTERCARD', (16,)),
+        '53': ('MASTERCARD', (16,)),
+        '54': ('MASTERCARD', (16,)),
+        '55': ('MASTERCARD', (16,)),
+        '34': ('AMERICAN_EXPRESS', (15,)),
+        '37': ('AMERICAN_EXPRESS', (15,)),
+        '300': ('DINERS_CLUB', (14,)),
+        '301': ('DINERS_CLUB', (14,)),
+        '302': ('DINERS_CLUB', (14,)),
+        '303': ('DINERS_CLUB', (14,)),
+        '304': ('DINERS_CLUB', (14,)),
+        '305': ('DINERS_CLUB', (14,)),
+        '36': ('DINERS_CLUB', (14,)),
+        '38': ('DINERS_CLUB', (14,)),
+        '6011': ('DISCOVER', (16,)),
+        '65': ('DISCOVER', (16,)),
+        '2131': ('JCB', (15,)),
+        '1800': ('JCB', (15,)),
+        '35': ('JCB', (16,)),
+    }
+
+    # value added to the Luhn checksum by a doubled digit
+    __luhn_doubled = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+    # same as above, as a translation table from digit to digit (doubled values are always a single digit)
+    __luhn_doubled_digits = str.maketrans('0123456789', '0246813579')
+
+    @classmethod
+    def card_type(cls, input_string: str, luhn: bool = False) -> Optional[str]:
+        # like the "$" of CREDIT_CARDS regex, a single trailing new line is allowed
+        if input_string[-1:] == '\n':
+            input_string = input_string[:-1]
+
+        # any unicode decimal digit (like "\d" does)
+        if not input_string.isdecimal():
+            return None
+
+        for prefix_size in range(1, 5):
+            rule = cls.__prefixes.get(input_string[:prefix_size])
+
+            if rule is not None:
+                card_type, lengths = rule
+
+                if len(input_string) not in lengths:
+                    return None
+
+                if luhn and not cls.is_luhn_valid(input_string):
+                    return None
+
+                return card_type
+
+        return None
+
+    @classmethod
+    def is_luhn_valid(cls, digits: str) -> bool:
+        # starting from the rightmost digit, every second digit is doubled
+        if ASCII_DIGITS_RE.fullmatch(digits) is not None:
+            # fast path: once doubled digits are translated, the checksum is the sum of the codes of all the digits
+            # (minus the code of "0" for each digit)
+            doubled = digits[-2::-2].translate(cls.__luhn_doubled_digits)
+            checksum = sum(digits[-1::-2].encode()) + sum(doubled.encode()) - 48 * len(digits)
+        else:
+            doubled = cls.__luhn_doubled
+            checksum = sum(map(int, digits[-1::-2])) + sum(doubled[int(digit)] for digit in digits[-2::-2])
+
+        return checksum % 10 == 0
+
+    @classmethod
+    def require_valid_card_type(cls, card_type: str):
+        if card_type not in CREDIT_CARDS:
+            raise KeyError(
+                'Invalid card type "{}". Valid types are: {}'.format(card_type, ', '.join(CREDIT_CARDS.keys()))
+            )
+
+
+class __UUIDChecker:
+    # size of the batches checked by `check_batch()` (small batches limit the strings to check one by one when a
+    # batch contains an invalid one, while large ones would not be much faster to check if all valid)
+    batch_size = 128
+
+    @staticmethod
+    def require_valid_version(version: Optional[int]):
+        # bool is a subclass of int, but True is not a meaningful version
+        is_integer_version = isinstance(version, int) and not isinstance(version, bool)
+
+        if version is not None and (not is_integer_version or not 1 <= version <= 8):
+            raise ValueError('Invalid UUID version "{}": it must be an integer between 1 and 8'.format(version))
+
+    @staticmethod
+    def is_uuid(value: Any, allow_hex: bool, version: Optional[int]) -> bool:
+        if isinstance(value, str):
+            size = len(value)
+
+            # canonical form is 36 chars long, hex form is 32 chars long (plus up to 3 optional hyphens)
+            if size != 36 and not (allow_hex and 32 <= size < 36):
+                return False
+
+            return get_uuid_re(allow_hex, version).fullmatch(value) is not None
+
+        if isinstance(value, UUID):
+            return version is None or value.version == version
+
+        # raw bytes (as in `UUID.bytes`)
+        if isinstance(value, (bytes, bytearray)) and len(value) == 16:
+            return version is None or (value[6] >> 4 == version and value[8] & 0xc0 == 0x80)
 
         return False
 
-    def is_isbn_10(self) -> bool:
-        if len(self.input_string) == 10:
-            product = 0
+    @classmethod
+    def check_batch(cls, strings: list, allow_hex: bool, version: Optional[int]) -> bytearray:
+        if cls.all_valid(strings, allow_hex, version):
+            return bytearray(b'\x01') * len(strings)
+
+        fullmatch = get_uuid_re(allow_hex, version).fullmatch
+
+        return bytearray([
+            fullmatch(value) is not None if type(value) is str else cls.is_uuid(value, allow_hex, version)
+            for value in strings
+        ])
 
-            try:
-                for index, digit in enumerate(self.input_string):
-                    product += int(digit) * (index + 1)
+    @staticmethod
+    def all_valid(strings: list, allow_hex: bool, version: Optional[int]) -> bool:
+        # Checks a batch of strings at once (false negatives are allowed: if false is returned, strings have to be
+        # checked one by one). Strings are joined, so that hyphens, versions and variants are checked on stride
+        # slices (they are at fixed positions) and all the other chars with a single regex match.
+        if set(map(type, strings)) != {str}:
+            return False
+
+        lengths = set(map(len, strings))
+        count = len(strings)
+        joined = ''.join(strings)
+
+        if lengths == {36}:
+            size = 36
+            hyphens = (8, 13, 18, 23)
+        elif lengths == {32} and allow_hex:
+            size = 32
+            hyphens = ()
+        else:
+            return False
+
+        # hyphens must be all (and only) at their positions
+        if joined.count('-') != len(hyphens) * count:
+            return False
+
+        for position in hyphens:
+            if joined[position::size].count('-') != count:
+                return False
+
+        if UUID_BATCH_RE.fullmatch(joined) is None:
+            return False
+
+        if version is None:
+            return True
+
+        # first digits of the third and of the fourth group
+        version_position, variant_position = (14, 19) if hyphens else (12, 16)
+
+        return joined[version_position::size].count(str(version)) == count and \
+            UUID_VARIANT_DIGITS_RE.fullmatch(joined[variant_position::size]) is not None
+
+
+def __require_valid_json_limits(max_depth: Optional[int], max_size: Optional[int]):
+    for name, value in (('max_depth', max_depth), ('max_size', max_size)):
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError('{} must be >= 1 (or None)'.format(name))
 
-                return product % 11 == 0
 
-            except ValueError:
-                pass
+# lines up to this size are checked with `json.loads()` (see `__is_json_line()`)
+__JSON_LINE_DECODE_SIZE = 65536
 
+
+# executed by `validate_json_lines()`, possibly in worker processes (so it has to be a module-level function)
+def __is_json_line(line: Any, max_depth: Optional[int], max_size: Optional[int]) -> bool:
+    if max_size is not None and isinstance(line, (str, bytes, bytearray)) and len(line) > max_size:
         return False
 
+    if isinstance(line, (bytes, bytearray)):
+        # json lines are always utf-8 encoded
+        try:
+            line = line.decode('utf-8')
+        except UnicodeDecodeError:
+            return False
+
+    if not isinstance(line, str):
+        return False
+
+    # short lines are decoded by the C parser, which is several times faster than scanning them (and takes little
+    # memory anyway), while long or deeply nested ones are scanned
+    if max_depth is None and len(line) <= __JSON_LINE_DECODE_SIZE:
+        try:
+            return isinstance(json.loads(line), (dict, list))
+        except ValueError:
+            return False
+        except RecursionError:
+            pass
+
+    return JsonScanner(line, max_depth, max_size).is_valid()
+
 
 # PUBLIC API
 
@@ -244,7 +489,49 @@ def is_email(input_string: Any) -> bool:
         return False
 
 
-def is_credit_card(input_string: Any, card_type: str = None) -> bool:
+def is_email_many(input_strings: Iterable[Any]) -> bytearray:
+    """
+    Checks many strings at once for being valid emails (same rules of `is_email()`).
+
+    Results are returned as a compact bytearray containing 1 for each valid email and 0 otherwise (in the same
+    order of the given strings), which makes this function suitable for validating very large lists.
+
+    *Example:*
+
+    >>> is_email_many(['my.email@the-provider.com', '@gmail.com']) # returns bytearray(b'\\x01\\x00')
+
+    :param input_strings: Iterable of strings to check.
+    :type input_strings: Iterable[Any]
+    :return: Bytearray of validation results.
+    """
+    output = bytearray()
+    append = output.append
+    fast_match = EMAIL_FAST_RE.fullmatch
+
+    for input_string in input_strings:
+        # a string without "@" cannot be an email
+        if not isinstance(input_string, str) or '@' not in input_string:
+            append(0)
+            continue
+
+        # the vast majority of emails are validated by a single regex match plus some size checks,
+        # less common shapes (quoted or escaped heads, multiple "@"...) are delegated to `is_email()`
+        match = fast_match(input_string)
+
+        if match is not None:
+            head_size = match.end(1)
+            size = len(input_string)
+
+            if size <= 320 and head_size <= 64 and size - head_size <= 256:
+                append(1)
+                continue
+
+        append(is_email(input_string))
+
+    return output
+
+
+def is_credit_card(input_string: Any, card_type: str = None, luhn: bool = False) -> bool:
     """
     Checks if a string is a valid credit card number.
     If card type is provided then it checks against that specific type only,
@@ -259,10 +546,14 @@ def is_credit_card(input_string: Any, card_type: str = None) -> bool:
     - DISCOVER
     - JCB
 
+    If `luhn` is True, the Luhn checksum of the number is verified too.
+
     :param input_string: String to check.
     :type input_string: str
     :param card_type: Card type. Default to None (any card).
     :type card_type: str
+    :param luhn: True to verify the Luhn checksum (default to False).
+    :type luhn: bool
 
     :return: True if credit card, false otherwise.
     """
@@ -270,17 +561,76 @@ def is_credit_card(input_string: Any, card_type: str = None) -> bool:
         return False
 
     if card_type:
-        if card_type not in CREDIT_CARDS:
-            raise KeyError(
-                'Invalid card type "{}". Valid types are: {}'.format(card_type, ', '.join(CREDIT_CARDS.keys()))
-            )
-        return CREDIT_CARDS[card_type].match(input_string) is not None
+        __CreditCardChecker.require_valid_card_type(card_type)
 
-    for c in CREDIT_CARDS:
-        if CREDIT_CARDS[c].match(input_string) is not None:
-            return True
+    detected_type = __CreditCardChecker.card_type(input_string, luhn)
 
-    return False
+    if card_type:
+        return detected_type == card_type
+
+    return detected_type is not None
+
+
+def is_credit_card_many(input_strings: Iterable[Any], card_type: str = None, luhn: bool = False) -> bytearray:
+    """
+    Checks many strings at once for being valid credit card numbers (same rules of `is_credit_card()`).
+
+    Results are returned as a compact bytearray containing 1 for each valid number and 0 otherwise (in the same
+    order of the given strings), which makes this function suitable for validating very large lists.
+
+    *Example:*
+
+    >>> is_credit_card_many(['4929108461099666', '1234'], luhn=True) # returns bytearray(b'\\x01\\x00')
+
+    :param input_strings: Iterable of strings to check.
+    :type input_strings: Iterable[Any]
+    :param card_type: Card type. Default to None (any card).
+    :type card_type: str
+    :param luhn: True to verify the Luhn checksum (default to False).
+    :type luhn: bool
+    :return: Bytearray of validation results.
+    """
+    if card_type:
+        __CreditCardChecker.require_valid_card_type(card_type)
+
+    output = bytearray()
+    append = output.append
+    detect = __CreditCardChecker.card_type
+
+    for input_string in input_strings:
+        if not isinstance(input_string, str) or input_string == '':
+            append(0)
+            continue
+
+        detected_type = detect(input_string, luhn)
+
+        append(detected_type is not None if not card_type else detected_type == card_type)
+
+    return output
+
+
+def detect_card_type(input_string: Any, luhn: bool = True) -> Optional[str]:
+    """
+    Detects the type of a credit card number (see `is_credit_card()` for supported types).
+
+    The number is checked in a single scan: its prefix identifies the card type, then its length and
+    (unless `luhn` is False) its Luhn checksum are verified.
+
+    *Examples:*
+
+    >>> detect_card_type('4929108461099666') # returns 'VISA'
+    >>> detect_card_type('4929108461099667') # returns None (wrong checksum)
+
+    :param input_string: String to check.
+    :type input_string: str
+    :param luhn: True to verify the Luhn checksum (default), False otherwise.
+    :type luhn: bool
+    :return: Card type or None if the string is not a valid credit card number.
+    """
+    if not is_full_string(input_string):
+        return None
+
+    return __CreditCardChecker.card_type(input_string, luhn)
 
 
 def is_camel_case(input_string: Any) -> bool:
@@ -327,17 +677,7 @@ def is_snake_case(input_string: Any, separator: str = '_') -> bool:
     :return: True for a snake case string, false otherwise.
     """
     if is_full_string(input_string):
-        re_map = {
-            '_': SNAKE_CASE_TEST_RE,
-            '-': SNAKE_CASE_TEST_DASH_RE
-        }
-        re_template = r'([a-z]+\d*{sign}[a-z\d{sign}]*|{sign}+[a-z\d]+[a-z\d{sign}]*)'
-        r = re_map.get(
-            separator,
-            re.compile(re_template.format(sign=re.escape(separator)), re.IGNORECASE)
-        )
-
-        return r.match(input_string) is not None
+        return get_separator_re('SNAKE_CASE_TEST', separator).match(input_string) is not None
 
     return False
 
@@ -365,29 +705,149 @@ def is_json(input_string: Any) -> bool:
     return False
 
 
-def is_uuid(input_string: Any, allow_hex: bool = False) -> bool:
+def is_json_structure(source: Any,
+                      max_depth: Optional[int] = None,
+                      max_size: Optional[int] = None,
+                      chunk_size: int = 65536) -> bool:
+    """
+    Check if the given source is a valid json (same rules of `is_json()`) without decoding it.
+
+    The grammar is checked token by token without creating any object, which makes this function suitable for a
+    cheap validation of large payloads: streams and bytes are read in chunks (strings spanning multiple chunks
+    included), so memory usage depends on `chunk_size` and on the depth of the json, not on its size.
+    Source can be a string, a bytes-like object (whose encoding is detected as `json.loads()` does) or a readable
+    stream (text or binary) which is read in chunks.
+
+    *Examples:*
+
+    >>> is_json_structure('{"name": "Peter"}') # returns true
+    >>> is_json_structure(b'[1, 2, 3]') # returns true
+    >>> is_json_structure(open('data.json', 'rb')) # checks the file content
+    >>> is_json_structure('[[[1]]]', max_depth=2) # returns false (too many nested containers)
+
+    :param source: String, bytes or readable stream to check.
+    :type source: Any
+    :param max_depth: Max number of nested objects/arrays (default to None, no limit).
+    :type max_depth: Optional[int]
+    :param max_size: Max size of the source, in chars for strings and text streams, in bytes otherwise\
+    (default to None, no limit).
+    :type max_size: Optional[int]
+    :param chunk_size: Size of the chunks read from streams (default to 65536).
+    :type chunk_size: int
+    :return: True if json, false otherwise (sources exceeding the given limits are not valid).
+    """
+    __require_valid_json_limits(max_depth, max_size)
+
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError('chunk_size must be >= 1')
+
+    return JsonScanner(source, max_depth, max_size, chunk_size).is_valid()
+
+
+def validate_json_lines(readable: Any,
+                        workers: int = 1,
+                        chunksize: int = 1000,
+                        max_depth: Optional[int] = None,
+                        max_size: Optional[int] = None) -> Generator:
+    """
+    Lazily checks each line of a JSON Lines (aka NDJSON) source, yielding the number (starting from 1) of each line
+    which is not a valid json (same rules of `is_json_structure()`, so blank lines are not valid either).
+
+    Source can be a file (text or binary, binary lines are decoded as utf-8), a mmap object or any iterable of lines.
+    Long lines (over 64K chars) are validated without decoding them into objects and, if `workers` is greater than 1,
+    lines are checked by multiple processes (see `parallel.map()`), which is worth for files with millions of lines.
+
+    *Example:*
+
+    >>> with open('events.jsonl', 'rb') as f:
+    >>>     for line_number in validate_json_lines(f, workers=4): print('invalid line', line_number)
+
+    :param readable: File, mmap or iterable of lines to check.
+    :type readable: Any
+    :param workers: Number of processes used to check lines (default to 1, no process is spawned).
+    :type workers: int
+    :param chunksize: Number of lines sent to a process at once (default to 1000).
+    :type chunksize: int
+    :param max_depth: Max number of nested objects/arrays of each line (default to None, no limit).
+    :type max_depth: Optional[int]
+    :param max_size: Max size of each line, in chars for text lines and in bytes for binary ones\
+    (default to None, no limit).
+    :type max_size: Optional[int]
+    :return: Generator of invalid line numbers.
+    """
+    # imported here so that the main package does not load multiprocessing modules
+    from .parallel import map as parallel_map
+
+    __require_valid_json_limits(max_depth, max_size)
+
+    # mmap objects are iterated byte by byte
+    lines = iter(readable.readline, b'') if isinstance(readable, mmap.mmap) else readable
+    check = functools.partial(__is_json_line, max_depth=max_depth, max_size=max_size)
+    results = parallel_map(check, lines, workers, chunksize)
+
+    return (number for number, is_valid in enumerate(results, 1) if not is_valid)
+
+
+def is_uuid(input_string: Any, allow_hex: bool = False, version: Optional[int] = None) -> bool:
     """
     Check if a string is a valid UUID.
 
+    `uuid.UUID` objects and 16 bytes long bytes objects (as in `UUID.bytes`) are valid as well.
+
     *Example:*
 
     >>> is_uuid('6f8aa2f9-686c-4ac3-8766-5712354a04cf') # returns true
     >>> is_uuid('6f8aa2f9686c4ac387665712354a04cf') # returns false
     >>> is_uuid('6f8aa2f9686c4ac387665712354a04cf', allow_hex=True) # returns true
+    >>> is_uuid('6f8aa2f9-686c-4ac3-8766-5712354a04cf', version=4) # returns true
+    >>> is_uuid('6f8aa2f9-686c-1ac3-8766-5712354a04cf', version=4) # returns false (version 1)
 
     :param input_string: String to check.
     :type input_string: str
     :param allow_hex: True to allow UUID hex representation as valid, false otherwise (default)
     :type allow_hex: bool
+    :param version: If given, the UUID must be of this version (1 to 8) and of the RFC 4122 variant (default to None)
+    :type version: Optional[int]
     :return: True if UUID, false otherwise
     """
-    # string casting is used to allow UUID itself as input data type
-    s = str(input_string)
+    if version is not None:
+        __UUIDChecker.require_valid_version(version)
+
+    return __UUIDChecker.is_uuid(input_string, allow_hex, version)
+
+
+def is_uuid_many(input_strings: Iterable[Any], allow_hex: bool = False, version: Optional[int] = None) -> bytearray:
+    """
+    Checks many strings at once for being valid UUID (same rules of `is_uuid()`).
+
+    Results are returned as a compact bytearray containing 1 for each valid UUID and 0 otherwise (in the same
+    order of the given strings), which makes this function suitable for validating very large lists.
+    Strings are checked in batches (joined and matched at once), which is several times faster than checking them
+    one by one when most of them are valid.
+
+    *Example:*
+
+    >>> is_uuid_many(['6f8aa2f9-686c-4ac3-8766-5712354a04cf', 'nope']) # returns bytearray(b'\\x01\\x00')
+
+    :param input_strings: Iterable of strings to check.
+    :type input_strings: Iterable[Any]
+    :param allow_hex: True to allow UUID hex representation as valid, false otherwise (default)
+    :type allow_hex: bool
+    :param version: If given, UUID must be of this version (1 to 8) and of the RFC 4122 variant (default to None)
+    :type version: Optional[int]
+    :return: Bytearray of validation results.
+    """
+    __UUIDChecker.require_valid_version(version)
+
+    output = bytearray()
+    iterator = iter(input_strings)
+    batch = list(islice(iterator, __UUIDChecker.batch_size))
 
-    if allow_hex:
-        return UUID_HEX_OK_RE.match(s) is not None
+    while batch:
+        output += __UUIDChecker.check_batch(batch, allow_hex, version)
+        batch = list(islice(iterator, __UUIDChecker.batch_size))
 
-    return UUID_RE.match(s) is not None
+    return output
 
 
 def is_ip_v4(input_string: Any) -> bool:
@@ -404,15 +864,7 @@ def is_ip_v4(input_string: Any) -> bool:
     :type input_string: str
     :return: True if an ip v4, false otherwise.
     """
-    if not is_full_string(input_string) or SHALLOW_IP_V4_RE.match(input_string) is None:
-        return False
-
-    # checks that each entry in the ip is in the valid range (0 to 255)
-    for token in input_string.split('.'):
-        if not (0 <= int(token) <= 255):
-            return False
-
-    return True
+    return is_string(input_string) and scan_ip_v4(input_string) is not None
 
 
 def is_ip_v6(input_string: Any) -> bool:
@@ -422,13 +874,15 @@ def is_ip_v6(input_string: Any) -> bool:
     *Examples:*
 
     >>> is_ip_v6('2001:db8:85a3:0000:0000:8a2e:370:7334') # returns true
+    >>> is_ip_v6('2001:db8:85a3::8a2e:370:7334') # returns true (compressed notation)
+    >>> is_ip_v6('::ffff:192.168.0.1') # returns true (embedded ip v4)
     >>> is_ip_v6('2001:db8:85a3:0000:0000:8a2e:370:?') # returns false (invalid "?")
 
     :param input_string: String to check.
     :type input_string: str
     :return: True if a v6 ip, false otherwise.
     """
-    return is_full_string(input_string) and IP_V6_RE.match(input_string) is not None
+    return is_string(input_string) and scan_ip_v6(input_string) is not None
 
 
 def is_ip(input_string: Any) -> bool:
@@ -445,7 +899,88 @@ def is_ip(input_string: Any) -> bool:
     :type input_string: str
     :return: True if an ip, false otherwise.
     """
-    return is_ip_v6(input_string) or is_ip_v4(input_string)
+    if not is_string(input_string):
+        return False
+
+    if ':' in input_string:
+        return scan_ip_v6(input_string) is not None
+
+    return scan_ip_v4(input_string) is not None
+
+
+def is_ip_many(input_strings: Iterable[Any]) -> bytearray:
+    """
+    Checks many strings at once for being valid ip (either v4 or v6, same rules of `is_ip()`).
+
+    Results are returned as a compact bytearray containing 1 for each valid ip and 0 otherwise (in the same
+    order of the given strings), which makes this function suitable for validating very large lists.
+
+    *Example:*
+
+    >>> is_ip_many(['255.200.100.75', '::1', '1.2.3']) # returns bytearray(b'\\x01\\x01\\x00')
+
+    :param input_strings: Iterable of strings to check.
+    :type input_strings: Iterable[Any]
+    :return: Bytearray of validation results.
+    """
+    output = bytearray()
+    append = output.append
+    parse_v4 = scan_ip_v4
+    parse_v6 = scan_ip_v6
+
+    for input_string in input_strings:
+        if not isinstance(input_string, str):
+            append(0)
+        elif ':' in input_string:
+            append(parse_v6(input_string) is not None)
+        else:
+            append(parse_v4(input_string) is not None)
+
+    return output
+
+
+def is_cidr(input_string: Any, strict: bool = False) -> bool:
+    """
+    Checks if a string is a valid CIDR notation (an ip v4 or v6 followed by a slash and a prefix length).
+
+    By default, like routers do, bits of the address beyond the prefix are ignored, if `strict` is True they must
+    be zeros instead (so that the string represents a network rather than an address inside of it).
+
+    *Examples:*
+
+    >>> is_cidr('192.168.0.0/16') # returns true
+    >>> is_cidr('2001:db8::/32') # returns true
+    >>> is_cidr('192.168.0.1/16') # returns true
+    >>> is_cidr('192.168.0.1/16', strict=True) # returns false (host bits are set)
+    >>> is_cidr('192.168.0.0/33') # returns false (prefix is too long)
+
+    :param input_string: String to check.
+    :type input_string: str
+    :param strict: True to require zeros after the prefix, false otherwise (default).
+    :type strict: bool
+    :return: True if a valid CIDR, false otherwise.
+    """
+    if not is_string(input_string):
+        return False
+
+    address, slash, prefix = input_string.partition('/')
+
+    if not slash or CIDR_PREFIX_RE.fullmatch(prefix) is None:
+        return False
+
+    parsed = scan_ip(address)
+
+    if parsed is None:
+        return False
+
+    version, value = parsed
+    bits = 32 if version == 4 else 128
+    prefix_length = int(prefix)
+
+    if prefix_length > bits:
+        return False
+
+    return not strict or value & ((1 << (bits - prefix_length)) - 1) == 0
 
 
 def is_palindrome(input_string: Any, ignore_spaces: bool = False, ignore_case: bool = False) -> bool:
@@ -547,9 +1082,40 @@ def is_slug(input_string: Any, separator: str = '-') -> bool:
     if not is_full_string(input_string):
         return False
 
-    rex = r'^([a-z\d]+' + re.escape(separator) + r'*?)*[a-z\d]$'
+    # A slug is made by words of lowercase letters and digits joined by one or more separators.
+    # Words and separators runs are matched alternately from left to right (each char is read only once),
+    # so the validation time is linear even for long malicious strings, which would instead cause catastrophic
+    # backtracking with a single regex made by nested quantifiers.
+    match = SLUG_WORD_RE.match(input_string)
+
+    if match is None:
+        return False
+
+    position = match.end()
+    size = len(input_string)
 
-    return re.match(rex, input_string) is not None
+    if position == size:
+        return True
+
+    if not separator:
+        return False
+
+    separators_run_re = get_separator_re('SEPARATORS_RUN', separator)
+
+    while position < size:
+        match = separators_run_re.match(input_string, position)
+
+        if match is None:
+            return False
+
+        match = SLUG_WORD_RE.match(input_string, match.end())
+
+        if match is None:
+            return False
+
+        position = match.end()
+
+    return True
 
 
 def contains_html(input_string: str) -> bool:
@@ -571,7 +1137,7 @@ def contains_html(input_string: str) -> bool:
     if not is_string(input_string):
         raise InvalidInputError(input_string)
 
-    return HTML_RE.search(input_string) is not None
+    return contains_tag(input_string)
 
 
 def words_count(input_string: str) -> int:
@@ -603,6 +1169,7 @@ def is_isbn_10(input_string: str, normalize: bool = True) -> bool:
     Checks if the given string represents a valid ISBN 10 (International Standard Book Number).
     By default hyphens in the string are ignored, so digits can be separated in different ways, by calling this
     function with `normalize=False` only digit-only strings will pass the validation.
+    The last digit can be "X" (which stands for 10).
 
     *Examples:*
 
@@ -614,8 +1181,7 @@ def is_isbn_10(input_string: str, normalize: bool = True) -> bool:
     :param normalize: True to ignore hyphens ("-") in the string (default), false otherwise.
     :return: True if valid ISBN 10, false otherwise.
     """
-    checker = __ISBNChecker(input_string, normalize)
-    return checker.is_isbn_10()
+    return __ISBNChecker.is_isbn_10(__ISBNChecker.digits(input_string, normalize))
 
 
 def is_isbn_13(input_string: str, normalize: bool = True) -> bool:
@@ -634,8 +1200,7 @@ def is_isbn_13(input_string: str, normalize: bool = True) -> bool:
     :param normalize: True to ignore hyphens ("-") in the string (default), false otherwise.
     :return: True if valid ISBN 13, false otherwise.
     """
-    checker = __ISBNChecker(input_string, normalize)
-    return checker.is_isbn_13()
+    return __ISBNChecker.is_isbn_13(__ISBNChecker.digits(input_string, normalize))
 
 
 def is_isbn(input_string: str, normalize: bool = True) -> bool:
@@ -653,5 +1218,44 @@ def is_isbn(input_string: str, normalize: bool = True) -> bool:
     :param normalize: True to ignore hyphens ("-") in the string (default), false otherwise.
     :return: True if valid ISBN (10 or 13), false otherwise.
     """
-    checker = __ISBNChecker(input_string, normalize)
-    return checker.is_isbn_13() or checker.is_isbn_10()
+    digits = __ISBNChecker.digits(input_string, normalize)
+
+    return __ISBNChecker.is_isbn_13(digits) or __ISBNChecker.is_isbn_10(digits)
+
+
+def is_isbn_many(input_strings: Iterable[Any], normalize: bool = True) -> bytearray:
+    """
+    Checks many strings at once for being valid ISBN 10 or 13 (same rules of `is_isbn()`).
+
+    Results are returned as a compact bytearray containing 1 for each valid ISBN and 0 otherwise (in the same
+    order of the given strings), which makes this function suitable for validating very large lists.
+    Unlike `is_isbn()`, objects which are not strings are not valid (no exception is raised).
+
+    *Example:*
+
+    >>> is_isbn_many(['9780312498580', '150-6715214', '1234']) # returns bytearray(b'\\x01\\x01\\x00')
+
+    :param input_strings: Iterable of strings to check.
+    :type input_strings: Iterable[Any]
+    :param normalize: True to ignore hyphens ("-") in the strings (default), false otherwise.
+    :type normalize: bool
+    :return: Bytearray of validation results.
+    """
+    output = bytearray()
+    append = output.append
+    check_10 = __ISBNChecker.is_isbn_10
+    check_13 = __ISBNChecker.is_isbn_13
+
+    for input_string in input_strings:
+        if not isinstance(input_string, str):
+            append(0)
+            continue
+
+        if normalize and '-' in input_string:
+            input_string = input_string.replace('-', '')
+
+        size = len(input_string)
+
+        append(check_13(input_string) if size == 13 else size == 10 and check_10(input_string))
+
+    return output
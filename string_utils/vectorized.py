@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# public api to export
+__all__ = [
+    'validate',
+    'transform',
+]
+
+from typing import Any, Callable, Optional
+
+from ._regex import *
+from .validation import is_uuid, is_camel_case, is_snake_case
+
+# NumPy and pyarrow are optional: when they are not installed, functions in this module simply work on
+# plain python iterables and return lists.
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import pyarrow
+    import pyarrow.compute
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+
+# PRIVATE API
+
+
+class __ArrowRegexKernels:
+    # Validators which can be implemented by a single regex that pyarrow can evaluate, associated with a function
+    # returning the pattern to use given the validator keyword arguments (None if the arguments don't allow the push
+    # down).
+    # Pyarrow uses RE2, whose semantics differ from the python ones: "$" does not allow a trailing new line, "\d" and
+    # case insensitive matching are ascii only (and lookarounds are not supported). Patterns are therefore rewritten
+    # with explicit ascii ranges and a trailing "\n?" where python allows it, so that they give the same results of
+    # the validators on ascii strings (others are checked in python, see `validate()`).
+    __patterns = {
+        is_uuid: lambda allow_hex=False, version=None: (
+            r'^(?:' + get_uuid_re(allow_hex, version).pattern + r')$'
+            if version is None or (type(version) is int and 1 <= version <= 8) else None
+        ),
+        is_camel_case: lambda: r'^[a-zA-Z]*(?:[a-z]+[A-Z]+|[A-Z]+[a-z]+)[a-zA-Z0-9]*\n?$',
+        is_snake_case: lambda separator='_': (
+            r'^(?:[a-zA-Z]+[0-9]*_[a-zA-Z0-9_]*|_+[a-zA-Z0-9]+[a-zA-Z0-9_]*)\n?$' if separator == '_' else None
+        ),
+    }
+
+    @classmethod
+    def pattern_for(cls, validator: Callable, kwargs: dict) -> Optional[str]:
+        factory = cls.__patterns.get(validator)
+
+        if factory is None:
+            return None
+
+        try:
+            return factory(**kwargs)
+        except TypeError:
+            return None
+
+    @staticmethod
+    def validate_chunk(validator: Callable[..., bool], chunk: Any, pattern: str, kwargs: dict) -> Any:
+        mask = pyarrow.compute.fill_null(pyarrow.compute.match_substring_regex(chunk, pattern), False)
+        non_ascii = pyarrow.compute.invert(pyarrow.compute.fill_null(pyarrow.compute.string_is_ascii(chunk), True))
+
+        # strings having non ascii chars (usually few) may be valid for the validator, they are checked in python
+        if pyarrow.compute.any(non_ascii).as_py():
+            others = [bool(validator(v, **kwargs)) for v in chunk.filter(non_ascii).to_pylist()]
+            mask = pyarrow.compute.replace_with_mask(mask, non_ascii, pyarrow.array(others, type=pyarrow.bool_()))
+
+        return mask
+
+
+def __is_numpy_array(values: Any) -> bool:
+    return numpy is not None and isinstance(values, numpy.ndarray)
+
+
+def __is_arrow_array(values: Any) -> bool:
+    return pyarrow is not None and isinstance(values, (pyarrow.Array, pyarrow.ChunkedArray))
+
+
+def __to_list(values: Any) -> list:
+    if __is_numpy_array(values) or __is_arrow_array(values):
+        return values.tolist() if __is_numpy_array(values) else values.to_pylist()
+
+    return list(values)
+
+
+# PUBLIC API
+
+
+def validate(validator: Callable[..., bool], values: Any, **kwargs) -> Any:
+    """
+    Applies a validation function (like `is_uuid()`, `is_ip_v4()`, `is_email()`...) to each string in the given
+    array, returning a boolean mask.
+
+    Supported input types are NumPy arrays (object or string dtypes), pyarrow arrays (StringArray, ChunkedArray) and
+    any other iterable. The returned mask is of the same family of the input (a bool NumPy array, a pyarrow
+    BooleanArray or a list). Null/None values are never valid.
+
+    When the input is a pyarrow array and the validator is entirely defined by a regex (`is_uuid()`,
+    `is_camel_case()`, `is_snake_case()`) the validation of ascii strings runs inside pyarrow regex kernel without
+    calling python code for each value.
+
+    NumPy and pyarrow are optional, if they are not installed plain iterables can still be used.
+
+    *Examples:*
+
+    >>> validate(is_uuid, numpy.array(['6f8aa2f9-686c-4ac3-8766-5712354a04cf', 'nope'])) # array([True, False])
+    >>> validate(is_snake_case, pyarrow.array(['foo-bar', None]), separator='-') # [true, false]
+
+    :param validator: Validation function to apply.
+    :type validator: Callable[..., bool]
+    :param values: Array of strings to validate.
+    :type values: Any
+    :param kwargs: Keyword arguments to pass to the validator.
+    :return: Boolean mask.
+    """
+    if __is_arrow_array(values):
+        pattern = __ArrowRegexKernels.pattern_for(validator, kwargs)
+
+        if pattern is not None and pyarrow.types.is_string(values.type):
+            if isinstance(values, pyarrow.Array):
+                return __ArrowRegexKernels.validate_chunk(validator, values, pattern, kwargs)
+
+            masks = [__ArrowRegexKernels.validate_chunk(validator, chunk, pattern, kwargs) for chunk in values.chunks]
+            return pyarrow.chunked_array(masks, type=pyarrow.bool_())
+
+    results = [v is not None and bool(validator(v, **kwargs)) for v in __to_list(values)]
+
+    if __is_numpy_array(values):
+        return numpy.array(results, dtype=bool)
+
+    if __is_arrow_array(values):
+        return pyarrow.array(results, type=pyarrow.bool_())
+
+    return results
+
+
+def transform(manipulator: Callable[..., str], values: Any, **kwargs) -> Any:
+    """
+    Applies a manipulation function (like `slugify()`, `asciify()`, `prettify()`...) to each string in the given
+    array, returning an array of the transformed strings.
+
+    Supported input types are NumPy arrays (object or string dtypes), pyarrow arrays (StringArray, ChunkedArray) and
+    any other iterable. The returned array is of the same family of the input (a NumPy array, a pyarrow array or a
+    list). Null/None values are preserved.
+
+    NumPy and pyarrow are optional, if they are not installed plain iterables can still be used.
+
+    *Example:*
+
+    >>> transform(slugify, numpy.array(['Top 10 Reasons To Love Dogs!!!', 'Mönstér Mägnët'], dtype=object))
+    >>> # array(['top-10-reasons-to-love-dogs', 'monster-magnet'], dtype=object)
+
+    :param manipulator: Manipulation function to apply.
+    :type manipulator: Callable[..., str]
+    :param values: Array of strings to transform.
+    :type values: Any
+    :param kwargs: Keyword arguments to pass to the manipulator.
+    :return: Array of transformed strings.
+    """
+    results = [None if v is None else manipulator(v, **kwargs) for v in __to_list(values)]
+
+    if __is_numpy_array(values):
+        # fixed size unicode arrays may not fit the new strings, so numpy has to compute the new size
+        dtype = None if values.dtype.kind == 'U' else values.dtype
+        return numpy.array(results, dtype=dtype)
+
+    if __is_arrow_array(values):
+        is_string_type = pyarrow.types.is_string(values.type) or pyarrow.types.is_large_string(values.type)
+        return pyarrow.array(results, type=values.type if is_string_type else pyarrow.string())
+
+    return results
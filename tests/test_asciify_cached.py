@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+from string_utils import asciify, cache
+from string_utils.errors import InvalidInputError
+
+
+class AsciifyCachedTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_raise_exception_if_provided_input_is_not_string(self):
+        with self.assertRaises(InvalidInputError) as raised:
+            # noinspection PyTypeChecker
+            cache.asciify_cached(None)
+
+        self.assertEqual(str(raised.exception), 'Expected "str", received "NoneType"')
+
+    def test_returns_same_result_of_asciify(self):
+        s = 'èéùúòóäåëýñÅÀÁÇÌÍÑÓË'
+
+        self.assertEqual(cache.asciify_cached(s), asciify(s))
+        self.assertEqual(cache.asciify_cached(s), asciify(s))
+        self.assertEqual(cache.info()['asciify']['hits'], 1)
+        self.assertEqual(cache.info()['asciify']['misses'], 1)
@@ -1,6 +1,9 @@
-from unittest import TestCase
+import base64
+import zlib
+from unittest import TestCase, skipIf
 
 from string_utils import compress
+from string_utils._compression import CODECS
 from string_utils.errors import InvalidInputError
 
 
@@ -60,3 +63,57 @@ class CompressTestCase(TestCase):
         self.assertTrue(isinstance(compressed, str))
         self.assertTrue(len(compressed) < len(self.input_string_with_utf8_chars))
         self.assertFalse(' ' in compressed)
+
+    def test_compress_raise_exception_if_codec_is_invalid(self):
+        with self.assertRaises(ValueError) as raised:
+            compress('A string to compress', codec='foo')
+
+        self.assertEqual(
+            str(raised.exception),
+            'Invalid codec "foo". Valid codecs are: zlib, lzma, bz2, zstd, lz4, brotli'
+        )
+
+    def test_compress_uses_zlib_without_header_by_default(self):
+        compressed = compress(self.input_string_with_utf8_chars)
+
+        self.assertEqual(compressed, compress(self.input_string_with_utf8_chars, codec='zlib'))
+        self.assertEqual(base64.urlsafe_b64decode(compressed)[0], 0x78)
+
+    def test_compress_adds_codec_header(self):
+        self.assertEqual(base64.urlsafe_b64decode(compress(self.input_string_with_utf8_chars, codec='lzma'))[0], 1)
+        self.assertEqual(base64.urlsafe_b64decode(compress(self.input_string_with_utf8_chars, codec='bz2'))[0], 2)
+
+    @skipIf(CODECS['zstd'].available, 'zstandard is installed')
+    def test_compress_raise_exception_if_codec_is_not_installed(self):
+        with self.assertRaises(ValueError) as raised:
+            compress('A string to compress', codec='zstd')
+
+        self.assertEqual(str(raised.exception), 'Codec "zstd" requires "zstandard" package to be installed')
+
+    def test_compress_raise_exception_if_dictionary_is_invalid(self):
+        expected_msg = 'Invalid dictionary: it must be a non empty "bytes" object'
+
+        with self.assertRaises(ValueError) as raised:
+            # noinspection PyTypeChecker
+            compress('A string to compress', dictionary='foo')
+
+        self.assertEqual(str(raised.exception), expected_msg)
+
+        with self.assertRaises(ValueError) as raised:
+            compress('A string to compress', dictionary=b'')
+
+        self.assertEqual(str(raised.exception), expected_msg)
+
+    def test_compress_raise_exception_if_codec_does_not_support_dictionaries(self):
+        with self.assertRaises(ValueError) as raised:
+            compress('A string to compress', codec='lzma', dictionary=b'string')
+
+        self.assertEqual(str(raised.exception), 'Codec "lzma" does not support dictionaries')
+
+    def test_compress_with_dictionary_stores_dictionary_id(self):
+        dictionary = b'A string to compress'
+        compressed = base64.urlsafe_b64decode(compress('A string to compress', dictionary=dictionary))
+
+        # zlib FDICT flag and DICTID
+        self.assertTrue(compressed[1] & 0x20)
+        self.assertEqual(compressed[2:6], zlib.adler32(dictionary).to_bytes(4, 'big'))
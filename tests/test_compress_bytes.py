@@ -0,0 +1,68 @@
+import array
+import base64
+from unittest import TestCase
+
+from string_utils import compress, compress_bytes, decompress_bytes
+
+
+class CompressBytesTestCase(TestCase):
+    data = ', '.join(['Test æåëýþÿìäçìíó¿ {}'.format(i) for i in range(50)]).encode('utf-8')
+
+    def test_raise_exception_if_data_is_not_bytes_like(self):
+        with self.assertRaises(TypeError) as raised:
+            # noinspection PyTypeChecker
+            compress_bytes('A string to compress')
+
+        self.assertEqual(str(raised.exception), 'Expected a bytes-like object, received "str"')
+
+    def test_raise_exception_if_provided_level_is_invalid(self):
+        with self.assertRaises(ValueError) as raised:
+            compress_bytes(self.data, compression_level=10)
+
+        self.assertEqual(str(raised.exception), 'Invalid compression_level: it must be an "int" between 0 and 9')
+
+    def test_output_is_compress_output_before_base64_encoding(self):
+        string = self.data.decode('utf-8')
+
+        self.assertEqual(base64.urlsafe_b64encode(compress_bytes(self.data)).decode(), compress(string))
+        self.assertEqual(
+            base64.urlsafe_b64encode(compress_bytes(self.data, codec='bz2')).decode(),
+            compress(string, codec='bz2')
+        )
+
+    def test_compressed_data_is_shorter(self):
+        compressed = compress_bytes(self.data)
+
+        self.assertIsInstance(compressed, bytes)
+        self.assertLess(len(compressed), len(self.data))
+
+    def test_accepts_any_buffer(self):
+        expected = compress_bytes(self.data)
+
+        self.assertEqual(compress_bytes(bytearray(self.data)), expected)
+        self.assertEqual(compress_bytes(memoryview(self.data)), expected)
+        self.assertEqual(compress_bytes(memoryview(b'xx' + self.data)[2:]), expected)
+
+    def test_multi_byte_items_are_compressed_as_raw_bytes(self):
+        numbers = array.array('I', range(1000))
+
+        self.assertEqual(decompress_bytes(compress_bytes(numbers)), numbers.tobytes())
+
+    def test_empty_data_can_be_compressed(self):
+        self.assertEqual(decompress_bytes(compress_bytes(b'')), b'')
+
+    def test_raise_exception_if_threads_is_invalid(self):
+        with self.assertRaises(ValueError) as raised:
+            compress_bytes(self.data, threads=0)
+
+        self.assertEqual(str(raised.exception), 'threads must be >= 1')
+
+    def test_multiple_threads_use_blocks_format(self):
+        data = bytes(range(256)) * 10000
+        compressed = compress_bytes(data, compression_level=1, threads=2)
+
+        # header, block size, number of blocks
+        self.assertEqual(compressed[0], 6)
+        self.assertEqual(int.from_bytes(compressed[1:5], 'big'), 1 << 20)
+        self.assertEqual(int.from_bytes(compressed[5:9], 'big'), 3)
+        self.assertEqual(decompress_bytes(compressed), data)
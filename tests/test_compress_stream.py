@@ -0,0 +1,51 @@
+import io
+from unittest import TestCase
+
+from string_utils import compress, compress_stream, decompress
+from string_utils.errors import InvalidInputError
+
+
+class CompressStreamTestCase(TestCase):
+    input_string_with_utf8_chars = ', '.join(
+        ['Test æåëýþÿìäçìíó¿æåëëýþÿüïöœäßðèéùúĳøáçìíñ¡ªº£€ {}'.format(i) for i in range(500)]
+    )
+
+    def test_raise_exception_if_provided_encoding_is_not_string(self):
+        with self.assertRaises(ValueError) as raised:
+            # noinspection PyTypeChecker
+            compress_stream(['A string to compress'], encoding=None)
+
+        self.assertEqual(str(raised.exception), 'Invalid encoding')
+
+    def test_raise_exception_if_provided_level_is_invalid(self):
+        with self.assertRaises(ValueError) as raised:
+            compress_stream(['A string to compress'], compression_level=10)
+
+        self.assertEqual(str(raised.exception), 'Invalid compression_level: it must be an "int" between 0 and 9')
+
+    def test_raise_exception_if_chunk_size_is_invalid(self):
+        self.assertRaises(ValueError, lambda: compress_stream(io.StringIO('foo'), chunk_size=0))
+
+    def test_raise_exception_if_chunks_are_not_strings(self):
+        with self.assertRaises(InvalidInputError) as raised:
+            list(compress_stream([b'foo']))
+
+        self.assertEqual(str(raised.exception), 'Expected "str", received "bytes"')
+
+    def test_output_is_same_of_compress(self):
+        expected = compress(self.input_string_with_utf8_chars)
+
+        for chunk_size in (1, 7, 100, 100000):
+            stream = io.StringIO(self.input_string_with_utf8_chars)
+            chunks = list(compress_stream(stream, chunk_size=chunk_size))
+
+            self.assertEqual(''.join(chunks), expected)
+
+    def test_output_can_be_decompressed(self):
+        chunks = ['first chunk, ', 'second chunk, ', 'third chunk']
+        compressed = ''.join(compress_stream(chunks, compression_level=1))
+
+        self.assertEqual(decompress(compressed), 'first chunk, second chunk, third chunk')
+
+    def test_empty_stream_is_compressed(self):
+        self.assertEqual(decompress(''.join(compress_stream(io.StringIO('')))), '')
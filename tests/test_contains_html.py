@@ -149,3 +149,11 @@ class ContainsHtmlTestCase(TestCase):
             should return false!
 
         '''))
+
+    def test_is_linear_on_malicious_input(self):
+        # these strings used to take several seconds
+        self.assertFalse(contains_html('text <a ' * 20000))
+        self.assertFalse(contains_html('x <!-- ' * 20000))
+        self.assertFalse(contains_html('<!doctype ' * 20000))
+        self.assertTrue(contains_html('text <a ' * 20000 + '>'))
+        self.assertTrue(contains_html('x <!-- ' * 20000 + '-->'))
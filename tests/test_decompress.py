@@ -1,6 +1,9 @@
+import base64
+import zlib
 from unittest import TestCase
 
 from string_utils import decompress, compress
+from string_utils._compression import CODECS
 from string_utils.errors import InvalidInputError
 
 
@@ -29,3 +32,50 @@ class DecompressTestCase(TestCase):
 
         self.assertNotEqual(self.input_string_with_utf8_chars, compressed)
         self.assertEqual(self.input_string_with_utf8_chars, decompressed)
+
+    def test_decompress_detects_codec(self):
+        for codec in CODECS.values():
+            if codec.available:
+                compressed = compress(self.input_string_with_utf8_chars, codec=codec.name, compression_level=0)
+                self.assertEqual(decompress(compressed), self.input_string_with_utf8_chars)
+
+                compressed = compress(self.input_string_with_utf8_chars, codec=codec.name)
+                self.assertEqual(decompress(compressed), self.input_string_with_utf8_chars)
+
+    def test_decompress_raise_exception_if_codec_header_is_unknown(self):
+        with self.assertRaises(ValueError) as raised:
+            decompress(base64.urlsafe_b64encode(b'\x0ffoo').decode())
+
+        self.assertEqual(str(raised.exception), 'Invalid compressed data: unknown codec header')
+
+    def test_decompress_picks_dictionary_by_id(self):
+        dictionaries = [b'first dictionary', b'Test \xc3\xa6\xc3\xa5, Test', b'third dictionary']
+
+        for dictionary in dictionaries:
+            compressed = compress(self.input_string_with_utf8_chars, dictionary=dictionary)
+            self.assertEqual(decompress(compressed, dictionaries=dictionaries), self.input_string_with_utf8_chars)
+
+    def test_decompress_raise_exception_if_dictionary_is_missing(self):
+        compressed = compress(self.input_string_with_utf8_chars, dictionary=b'dictionary')
+
+        with self.assertRaises(ValueError) as raised:
+            decompress(compressed, dictionaries=[b'another dictionary'])
+
+        self.assertEqual(
+            str(raised.exception),
+            'Dictionary not found: compressed data requires dictionary with id {}'.format(zlib.adler32(b'dictionary'))
+        )
+
+        self.assertRaises(ValueError, lambda: decompress(compressed))
+
+    def test_decompress_ignores_dictionaries_if_not_used(self):
+        compressed = compress(self.input_string_with_utf8_chars)
+
+        self.assertEqual(decompress(compressed, dictionaries=[b'dictionary']), self.input_string_with_utf8_chars)
+
+    def test_decompress_restores_string_compressed_with_multiple_threads(self):
+        input_string = self.input_string_with_utf8_chars * 1000
+        compressed = compress(input_string, compression_level=1, threads=2)
+
+        self.assertEqual(decompress(compressed), input_string)
+        self.assertEqual(decompress(compressed, threads=2), input_string)
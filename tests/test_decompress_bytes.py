@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+from string_utils import compress, compress_bytes, decompress_bytes
+
+
+class DecompressBytesTestCase(TestCase):
+    data = ', '.join(['Test æåëýþÿìäçìíó¿ {}'.format(i) for i in range(50)]).encode('utf-8')
+
+    def test_raise_exception_if_data_is_not_bytes_like(self):
+        with self.assertRaises(TypeError) as raised:
+            # noinspection PyTypeChecker
+            decompress_bytes(compress('A string to compress'))
+
+        self.assertEqual(str(raised.exception), 'Expected a bytes-like object, received "str"')
+
+    def test_raise_exception_if_codec_header_is_unknown(self):
+        with self.assertRaises(ValueError) as raised:
+            decompress_bytes(b'')
+
+        self.assertEqual(str(raised.exception), 'Invalid compressed data: unknown codec header')
+
+    def test_restores_original_data(self):
+        for codec in ('zlib', 'lzma', 'bz2'):
+            compressed = compress_bytes(self.data, codec=codec)
+
+            self.assertEqual(decompress_bytes(compressed), self.data)
+            self.assertEqual(decompress_bytes(bytearray(compressed)), self.data)
+            self.assertEqual(decompress_bytes(memoryview(b'xx' + compressed)[2:]), self.data)
+
+    def test_restores_data_compressed_with_dictionary(self):
+        dictionary = b'Test \xc3\xa6\xc3\xa5'
+        compressed = compress_bytes(self.data, dictionary=dictionary)
+
+        self.assertEqual(decompress_bytes(compressed, dictionaries=[dictionary]), self.data)
+        self.assertRaises(ValueError, lambda: decompress_bytes(compressed))
+
+    def test_restores_data_compressed_in_blocks(self):
+        data = self.data * 5000
+
+        for codec in ('zlib', 'bz2'):
+            compressed = compress_bytes(data, compression_level=1, codec=codec, threads=3)
+
+            self.assertEqual(decompress_bytes(compressed), data)
+            self.assertEqual(decompress_bytes(compressed, threads=2), data)
+
+    def test_raise_exception_if_blocks_index_is_invalid(self):
+        compressed = compress_bytes(self.data * 5000, compression_level=1, threads=2)
+
+        with self.assertRaises(ValueError) as raised:
+            decompress_bytes(compressed[:-1])
+
+        self.assertEqual(str(raised.exception), 'Invalid compressed data: blocks size mismatch')
+
+        with self.assertRaises(ValueError) as raised:
+            decompress_bytes(compressed[:12])
+
+        self.assertEqual(str(raised.exception), 'Invalid compressed data: truncated blocks index')
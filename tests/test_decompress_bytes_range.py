@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from string_utils import compress_bytes, decompress_bytes_range
+
+
+class DecompressBytesRangeTestCase(TestCase):
+    data = bytes(range(256)) * 10000
+
+    def test_raise_exception_if_range_is_invalid(self):
+        compressed = compress_bytes(self.data)
+        expected_msg = 'Invalid range: start and stop must be integers >= 0'
+
+        with self.assertRaises(ValueError) as raised:
+            decompress_bytes_range(compressed, -1, 10)
+
+        self.assertEqual(str(raised.exception), expected_msg)
+
+        with self.assertRaises(ValueError) as raised:
+            # noinspection PyTypeChecker
+            decompress_bytes_range(compressed, 0, None)
+
+        self.assertEqual(str(raised.exception), expected_msg)
+
+    def test_returns_range_of_data_compressed_in_blocks(self):
+        compressed = compress_bytes(self.data, compression_level=1, threads=2)
+        block_size = 1 << 20
+
+        for start, stop in ((0, 10), (block_size - 5, block_size + 5), (0, len(self.data)), (2 * block_size, 10 ** 9)):
+            self.assertEqual(decompress_bytes_range(compressed, start, stop), self.data[start:stop])
+            self.assertEqual(decompress_bytes_range(compressed, start, stop, threads=2), self.data[start:stop])
+
+    def test_returns_empty_bytes_for_empty_ranges(self):
+        compressed = compress_bytes(self.data, compression_level=1, threads=2)
+
+        self.assertEqual(decompress_bytes_range(compressed, 10, 10), b'')
+        self.assertEqual(decompress_bytes_range(compressed, 10, 5), b'')
+        self.assertEqual(decompress_bytes_range(compressed, 10 ** 9, 10 ** 9 + 5), b'')
+
+    def test_returns_range_of_data_not_compressed_in_blocks(self):
+        compressed = compress_bytes(self.data, compression_level=1)
+
+        self.assertEqual(decompress_bytes_range(compressed, 1000, 2000), self.data[1000:2000])
@@ -0,0 +1,79 @@
+import io
+import zlib
+from binascii import Error as Base64Error
+from unittest import TestCase
+
+from string_utils import compress, compress_stream, decompress, decompress_stream
+from string_utils.errors import InvalidInputError
+
+
+class DecompressStreamTestCase(TestCase):
+    input_string_with_utf8_chars = ', '.join(
+        ['Test æåëýþÿìäçìíó¿æåëëýþÿüïöœäßðèéùúĳøáçìíñ¡ªº£€ {}'.format(i) for i in range(500)]
+    )
+
+    def test_raise_exception_if_provided_encoding_is_not_string(self):
+        with self.assertRaises(ValueError) as raised:
+            # noinspection PyTypeChecker
+            decompress_stream(['eNoDAAAAAAE='], encoding=None)
+
+        self.assertEqual(str(raised.exception), 'Invalid encoding')
+
+    def test_raise_exception_if_chunks_are_not_strings(self):
+        with self.assertRaises(InvalidInputError):
+            list(decompress_stream([None]))
+
+    def test_restores_string_compressed_with_compress(self):
+        compressed = compress(self.input_string_with_utf8_chars)
+
+        for chunk_size in (1, 3, 5, 100, 100000):
+            stream = io.StringIO(compressed)
+            chunks = list(decompress_stream(stream, chunk_size=chunk_size))
+
+            self.assertEqual(''.join(chunks), self.input_string_with_utf8_chars)
+
+    def test_restores_string_compressed_with_compress_stream(self):
+        for encoding in ('utf-8', 'utf-16'):
+            compressed = compress_stream([self.input_string_with_utf8_chars], encoding=encoding)
+
+            self.assertEqual(''.join(decompress_stream(compressed, encoding)), self.input_string_with_utf8_chars)
+
+    def test_raise_exception_if_stream_is_truncated(self):
+        compressed = compress(self.input_string_with_utf8_chars)
+
+        self.assertRaises(zlib.error, lambda: list(decompress_stream([compressed[:40]])))
+        self.assertRaises(Base64Error, lambda: list(decompress_stream([compressed[:-1]])))
+
+    def test_white_spaces_are_ignored_like_decompress_does(self):
+        compressed = compress(self.input_string_with_utf8_chars)
+
+        # line wrapped data (76 chars per line, like MIME base64)
+        wrapped = '\n'.join(compressed[i:i + 76] for i in range(0, len(compressed), 76)) + '\r\n'
+
+        self.assertEqual(decompress(wrapped), self.input_string_with_utf8_chars)
+
+        for chunk_size in (1, 5, 77, 100000):
+            chunks = decompress_stream(io.StringIO(wrapped, newline=''), chunk_size=chunk_size)
+            self.assertEqual(''.join(chunks), self.input_string_with_utf8_chars)
+
+        chunks = decompress_stream([' ' + c + '\t' for c in compressed])
+        self.assertEqual(''.join(chunks), self.input_string_with_utf8_chars)
+
+    def test_raise_exception_if_data_cannot_be_decompressed_incrementally(self):
+        dictionary = b'Test \xc3\xa6\xc3\xa5\xc3\xab'
+        cases = [
+            (compress(self.input_string_with_utf8_chars, codec='lzma'), 'data compressed using "lzma" codec'),
+            (compress(self.input_string_with_utf8_chars, codec='bz2'), 'data compressed using "bz2" codec'),
+            (compress(self.input_string_with_utf8_chars, dictionary=dictionary), 'data compressed using a dictionary'),
+            (compress(self.input_string_with_utf8_chars, threads=2), 'data compressed using multiple threads'),
+        ]
+
+        for compressed, reason in cases:
+            for chunk_size in (1, 100000):
+                with self.assertRaises(ValueError) as raised:
+                    list(decompress_stream(io.StringIO(compressed), chunk_size=chunk_size))
+
+                self.assertEqual(
+                    str(raised.exception),
+                    'Cannot decompress stream of {}: use decompress() instead'.format(reason)
+                )
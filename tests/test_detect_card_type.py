@@ -0,0 +1,35 @@
+from unittest import TestCase
+
+from string_utils import detect_card_type
+
+
+class DetectCardTypeTestCase(TestCase):
+    def test_returns_none_for_non_string_objects(self):
+        # noinspection PyTypeChecker
+        self.assertIsNone(detect_card_type(None))
+
+        # noinspection PyTypeChecker
+        self.assertIsNone(detect_card_type(4929108461099666))
+
+        self.assertIsNone(detect_card_type(''))
+        self.assertIsNone(detect_card_type(' '))
+
+    def test_detects_card_type(self):
+        self.assertEqual(detect_card_type('4929108461099666'), 'VISA')
+        self.assertEqual(detect_card_type('5593685744413543'), 'MASTERCARD')
+        self.assertEqual(detect_card_type('6011738421556670'), 'DISCOVER')
+        self.assertEqual(detect_card_type('378255041294558'), 'AMERICAN_EXPRESS')
+        self.assertEqual(detect_card_type('3528968052436214'), 'JCB')
+        self.assertEqual(detect_card_type('30161673137117'), 'DINERS_CLUB')
+
+    def test_returns_none_if_luhn_checksum_is_wrong(self):
+        self.assertIsNone(detect_card_type('4929108461099667'))
+        self.assertIsNone(detect_card_type('5593685744413544'))
+
+    def test_checksum_verification_can_be_disabled(self):
+        self.assertEqual(detect_card_type('4929108461099667', luhn=False), 'VISA')
+
+    def test_returns_none_for_invalid_numbers(self):
+        self.assertIsNone(detect_card_type('492910846109966'))
+        self.assertIsNone(detect_card_type('7992739871300000'))
+        self.assertIsNone(detect_card_type('4929-1084-6109-9666'))
@@ -0,0 +1,51 @@
+import io
+from unittest import TestCase
+
+from string_utils import extract_emails
+from string_utils._regex import EMAILS_RE
+
+
+class ExtractEmailsTestCase(TestCase):
+    text = '\n'.join([
+        'contact me at my.name@gmail.com or at other_name@sub.domain.org',
+        'not.an.email@ nor @this.com',
+        'last: someone+tag@yahoo.it',
+    ] * 10)
+
+    def expected(self):
+        return [(m.start(), m.group(0)) for m in EMAILS_RE.finditer(self.text)]
+
+    def test_raise_exception_if_stream_is_not_readable(self):
+        with self.assertRaises(TypeError) as raised:
+            # noinspection PyTypeChecker
+            extract_emails(None)
+
+        self.assertEqual(str(raised.exception), 'Expected a readable stream, received "NoneType"')
+
+    def test_finds_emails_with_offsets(self):
+        emails = list(extract_emails(io.StringIO(self.text)))
+
+        self.assertEqual(len(emails), 30)
+        self.assertEqual(emails[0], (14, 'my.name@gmail.com'))
+        self.assertEqual(emails, self.expected())
+
+    def test_emails_across_chunk_boundaries_are_found(self):
+        expected = self.expected()
+
+        for chunk_size in (1, 3, 10, 33):
+            self.assertEqual(list(extract_emails(io.StringIO(self.text), chunk_size=chunk_size)), expected)
+            self.assertEqual(list(extract_emails(io.BytesIO(self.text.encode()), chunk_size=chunk_size)), expected)
+
+    def test_generator_is_lazy(self):
+        stream = io.StringIO(self.text)
+        emails = extract_emails(stream, chunk_size=70)
+
+        self.assertEqual(next(emails), (14, 'my.name@gmail.com'))
+        self.assertLess(stream.tell(), len(self.text))
+
+    def test_emails_are_found_in_streams_without_white_spaces(self):
+        text = ';'.join('<user{}@site{}.com>'.format(n, n % 7) for n in range(20000))
+        expected = [(m.start(), m.group(0)) for m in EMAILS_RE.finditer(text)]
+
+        for chunk_size in (100, 4096, 65536):
+            self.assertEqual(list(extract_emails(io.StringIO(text), chunk_size=chunk_size)), expected)
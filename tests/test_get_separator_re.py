@@ -0,0 +1,66 @@
+import re
+from unittest import TestCase
+from unittest.mock import patch
+
+from string_utils import is_snake_case, is_slug, slugify
+import string_utils._regex
+from string_utils._regex import get_separator_re, SNAKE_CASE_TEST_RE, SNAKE_CASE_TEST_DASH_RE, SEPARATOR_RE_TEMPLATES
+
+
+class GetSeparatorReTestCase(TestCase):
+    def test_same_compiled_object_is_returned_for_same_separator(self):
+        regex = get_separator_re('SNAKE_CASE_TEST', '*')
+
+        self.assertIs(get_separator_re('SNAKE_CASE_TEST', '*'), regex)
+        self.assertIsNot(get_separator_re('SEPARATORS_RUN', '*'), regex)
+        self.assertIsNot(get_separator_re('SNAKE_CASE_TEST', '+'), regex)
+
+    def test_default_separators_use_precompiled_regex(self):
+        self.assertIs(get_separator_re('SNAKE_CASE_TEST', '_'), SNAKE_CASE_TEST_RE)
+        self.assertIs(get_separator_re('SNAKE_CASE_TEST', '-'), SNAKE_CASE_TEST_DASH_RE)
+
+    def test_regex_are_compiled_once_and_shared_by_validators_and_manipulators(self):
+        # first calls may compile the regex of the custom separator
+        is_snake_case('foo*bar', separator='*')
+        is_slug('foo*bar', separator='*')
+        slugify('Foo Bar', separator='*')
+
+        with patch.object(re, 'compile', wraps=re.compile) as compile_mock:
+            for _ in range(10):
+                self.assertTrue(is_snake_case('foo*bar', separator='*'))
+                self.assertTrue(is_slug('foo*bar', separator='*'))
+                self.assertEqual(slugify('Foo  Bar', separator='*'), 'foo*bar')
+
+        self.assertEqual(compile_mock.call_count, 0)
+
+    def test_results_are_correct_after_cache_reset(self):
+        # many distinct separators fill the cache, which is then cleared
+        for n in range(2000):
+            separator = '<{}>'.format(n)
+
+            self.assertTrue(is_snake_case('foo{}bar'.format(separator), separator=separator))
+            self.assertTrue(is_slug('foo{}bar'.format(separator), separator=separator))
+
+        # default separators must still match whole strings only
+        self.assertIs(get_separator_re('SNAKE_CASE_TEST', '_'), SNAKE_CASE_TEST_RE)
+        self.assertIs(get_separator_re('SNAKE_CASE_TEST', '-'), SNAKE_CASE_TEST_DASH_RE)
+        self.assertTrue(is_snake_case('foo_bar'))
+        self.assertFalse(is_snake_case('foo_bar!'))
+        self.assertFalse(is_snake_case('foo-bar!', separator='-'))
+        self.assertTrue(is_slug('foo-bar'))
+        self.assertFalse(is_slug('foo-bar-'))
+        self.assertEqual(slugify('Foo  Bar'), 'foo-bar')
+        self.assertTrue(is_snake_case('foo*bar', separator='*'))
+
+    def test_default_separators_are_not_affected_by_cache_content(self):
+        # a template built regex may end up in the cache for a default separator (eg: stored by a thread which was
+        # compiling it while another one was resetting the cache), it must never be used
+        cache = getattr(string_utils._regex, '__separator_re_cache')
+        template, flags = SEPARATOR_RE_TEMPLATES['SNAKE_CASE_TEST']
+        cache[('SNAKE_CASE_TEST', '_')] = re.compile(template.format(sign='_'), flags)
+
+        try:
+            self.assertIs(get_separator_re('SNAKE_CASE_TEST', '_'), SNAKE_CASE_TEST_RE)
+            self.assertFalse(is_snake_case('foo_bar!'))
+        finally:
+            cache.pop(('SNAKE_CASE_TEST', '_'), None)
@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+from string_utils import is_cidr
+
+
+class IsCidrTestCase(TestCase):
+    def test_return_false_for_non_string_objects(self):
+        # noinspection PyTypeChecker
+        self.assertFalse(is_cidr(None))
+
+        # noinspection PyTypeChecker
+        self.assertFalse(is_cidr(1))
+
+        # noinspection PyTypeChecker
+        self.assertFalse(is_cidr(['10.0.0.0/8']))
+
+    def test_recognizes_ip_v4_cidr(self):
+        self.assertTrue(is_cidr('10.0.0.0/8'))
+        self.assertTrue(is_cidr('192.168.0.0/16'))
+        self.assertTrue(is_cidr('192.168.1.1/32'))
+        self.assertTrue(is_cidr('0.0.0.0/0'))
+
+    def test_recognizes_ip_v6_cidr(self):
+        self.assertTrue(is_cidr('2001:db8::/32'))
+        self.assertTrue(is_cidr('::1/128'))
+        self.assertTrue(is_cidr('::/0'))
+
+    def test_prefix_cannot_exceed_address_size(self):
+        self.assertFalse(is_cidr('10.0.0.0/33'))
+        self.assertFalse(is_cidr('2001:db8::/129'))
+        self.assertFalse(is_cidr('2001:db8::/1000'))
+
+    def test_returns_false_for_invalid_cidr(self):
+        self.assertFalse(is_cidr('10.0.0.0'))
+        self.assertFalse(is_cidr('10.0.0.0/'))
+        self.assertFalse(is_cidr('/8'))
+        self.assertFalse(is_cidr('10.0.0/8'))
+        self.assertFalse(is_cidr('10.0.0.0/-8'))
+        self.assertFalse(is_cidr('10.0.0.0/+8'))
+        self.assertFalse(is_cidr('10.0.0.0/8 '))
+        self.assertFalse(is_cidr('10.0.0.0/8/8'))
+        self.assertFalse(is_cidr('10.0.0.0/٨'))
+        self.assertFalse(is_cidr('10.0.0.0/8\n'))
+        self.assertFalse(is_cidr('10.0.0.0/²'))
+        self.assertFalse(is_cidr('10.0.0.0/0008'))
+
+    def test_host_bits_are_ignored_by_default(self):
+        self.assertTrue(is_cidr('192.168.1.1/16'))
+        self.assertTrue(is_cidr('2001:db8::1/32'))
+
+    def test_host_bits_must_be_zero_if_strict(self):
+        self.assertFalse(is_cidr('192.168.1.1/16', strict=True))
+        self.assertFalse(is_cidr('2001:db8::1/32', strict=True))
+        self.assertTrue(is_cidr('192.168.0.0/16', strict=True))
+        self.assertTrue(is_cidr('2001:db8::/32', strict=True))
+        self.assertTrue(is_cidr('192.168.1.1/32', strict=True))
+        self.assertTrue(is_cidr('0.0.0.0/0', strict=True))
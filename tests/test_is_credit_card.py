@@ -98,3 +98,25 @@ class IsCreditCardTestCase(TestCase):
 
     def test_cannot_provide_unsupported_card_type(self):
         self.assertRaises(KeyError, lambda: is_credit_card(self.sample_cards['VISA'][0], card_type='FOO_CARD'))
+
+    def test_luhn_checksum_is_verified_if_specified(self):
+        self.assertTrue(is_credit_card('4929108461099666', luhn=True))
+        self.assertTrue(is_credit_card('4929108461099666', card_type='VISA', luhn=True))
+        self.assertTrue(is_credit_card('4929108461099667'))
+        self.assertFalse(is_credit_card('4929108461099667', luhn=True))
+        self.assertFalse(is_credit_card('4929108461099667', card_type='VISA', luhn=True))
+
+    def test_luhn_checksum_does_not_make_invalid_numbers_valid(self):
+        # valid checksum, but unknown prefix
+        self.assertFalse(is_credit_card('7992739871300000', luhn=True))
+
+    def test_should_reject_numbers_with_wrong_length_for_their_type(self):
+        self.assertFalse(is_credit_card('49291084610996'))
+        self.assertFalse(is_credit_card('55936857444135430'))
+        self.assertFalse(is_credit_card('3782550412945580'))
+
+    def test_luhn_checksum_is_verified_on_unicode_decimal_digits(self):
+        # "\d" accepts any unicode decimal digit after the prefix, the checksum must use their values as well
+        arabic_digits = str.maketrans('0123456789', '٠١٢٣٤٥٦٧٨٩')
+        self.assertTrue(is_credit_card('4' + '929108461099666'.translate(arabic_digits), luhn=True))
+        self.assertFalse(is_credit_card('4' + '929108461099667'.translate(arabic_digits), luhn=True))
@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from string_utils import is_credit_card_many
+
+
+class IsCreditCardManyTestCase(TestCase):
+    def test_returns_bytearray_of_results(self):
+        results = is_credit_card_many(['4929108461099666', '5593685744413543', 'not a card', '', None, 1, '1' * 16])
+
+        self.assertEqual(results, bytearray([1, 1, 0, 0, 0, 0, 0]))
+
+    def test_checks_card_type_if_specified(self):
+        results = is_credit_card_many(['4929108461099666', '5593685744413543'], card_type='MASTERCARD')
+
+        self.assertEqual(results, bytearray([0, 1]))
+
+    def test_verifies_luhn_checksum_if_specified(self):
+        results = is_credit_card_many(['4929108461099666', '4929108461099667'], luhn=True)
+
+        self.assertEqual(results, bytearray([1, 0]))
+
+    def test_cannot_provide_unsupported_card_type(self):
+        self.assertRaises(KeyError, lambda: is_credit_card_many(['4929108461099666'], card_type='FOO_CARD'))
+
+    def test_empty_iterable_returns_empty_bytearray(self):
+        self.assertEqual(is_credit_card_many(iter([])), bytearray())
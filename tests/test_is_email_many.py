@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from string_utils import is_email, is_email_many
+
+
+class IsEmailManyTestCase(TestCase):
+    samples = [
+        None,
+        42,
+        '',
+        ' ',
+        'name.site.com',
+        '@foo.com',
+        'name@',
+        '.name@site.com',
+        'name.@site.com',
+        'na..me@site.com',
+        'me@foo.123',
+        'me@foo.c',
+        'me@foo.com',
+        'first_name.last_name@yahoo.it',
+        'UPPER_CASE_EMAIL@somesite.com',
+        'my\\mail@gmail.com',
+        'my\\ mail@gmail.com',
+        '"my mail"@gmail.com',
+        '"Abc@def"@example.com',
+        'Abc\\@def@example.com',
+        'Joe.\\\\Blow@example.com',
+        'a@b@c.com',
+        'me@foo.com\n',
+        'me@FOO.com',
+        'x' * 64 + '@gmail.com',
+        'x' * 65 + '@gmail.com',
+        'me@' + 'x' * 250 + '.com',
+        'me@' + 'x' * 251 + '.com',
+        'x' * 64 + '@' + 'y' * 252 + '.com',
+    ]
+
+    def test_returns_bytearray(self):
+        self.assertEqual(is_email_many([]), bytearray())
+        self.assertEqual(is_email_many(['me@foo.com', 'nope']), bytearray([1, 0]))
+
+    def test_accepts_any_iterable(self):
+        self.assertEqual(is_email_many(s for s in ['@foo.com', 'me@foo.com']), bytearray([0, 1]))
+
+    def test_results_are_consistent_with_is_email(self):
+        expected = bytearray([is_email(s) for s in self.samples])
+
+        self.assertEqual(is_email_many(self.samples), expected)
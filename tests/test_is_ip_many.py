@@ -0,0 +1,18 @@
+from unittest import TestCase
+
+from string_utils import is_ip, is_ip_many
+
+
+class IsIpManyTestCase(TestCase):
+    def test_returns_bytearray_of_results(self):
+        results = is_ip_many(['255.200.100.75', '::1', '::ffff:10.0.0.1', '1.2.3', '', None, 127001])
+
+        self.assertEqual(results, bytearray([1, 1, 1, 0, 0, 0, 0]))
+
+    def test_results_are_same_of_is_ip(self):
+        strings = ['0.0.0.0', '256.0.0.1', ' 1.2.3.4', '2001:db8::', '2001:db8:::1', 'fe80::1%eth0', '1.2.3.4.5']
+
+        self.assertEqual(is_ip_many(strings), bytearray(is_ip(s) for s in strings))
+
+    def test_empty_iterable_returns_empty_bytearray(self):
+        self.assertEqual(is_ip_many(iter([])), bytearray())
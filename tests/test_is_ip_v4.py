@@ -54,3 +54,7 @@ class IsIpV4TestCase(TestCase):
 
     def test_ip_v6_is_not_recognized(self):
         self.assertFalse(is_ip_v4('2001:db8:85a3:0:0:8a2e:370:7334'))
+
+    def test_surrounding_new_lines_are_not_allowed(self):
+        self.assertFalse(is_ip_v4('127.0.0.1\n'))
+        self.assertFalse(is_ip_v4('\n127.0.0.1'))
@@ -38,3 +38,37 @@ class IsIpV6TestCase(TestCase):
         self.assertTrue(is_ip_v6('2001:db8:85a3:0000:0000:8a2e:370:1'))
         self.assertTrue(is_ip_v6('123:db8:85a3:0000:0000:8a2e:370:1'))
         self.assertTrue(is_ip_v6('2001:db8:85a3:0:0:8a2e:370:7334'))
+
+    def test_recognizes_compressed_ip_v6(self):
+        self.assertTrue(is_ip_v6('2001:db8:85a3::8a2e:370:7334'))
+        self.assertTrue(is_ip_v6('::1'))
+        self.assertTrue(is_ip_v6('fe80::'))
+        self.assertTrue(is_ip_v6('::'))
+        self.assertTrue(is_ip_v6('1::8'))
+        self.assertTrue(is_ip_v6('1:2:3:4:5:6:7::'))
+
+    def test_compression_can_be_used_only_once(self):
+        self.assertFalse(is_ip_v6('2001::85a3::7334'))
+        self.assertFalse(is_ip_v6(':::'))
+        self.assertFalse(is_ip_v6('1:2:3:4::5:6:7:8'))
+        self.assertFalse(is_ip_v6(':1:2:3:4:5:6:7'))
+        self.assertFalse(is_ip_v6('1:2:3:4:5:6:7:'))
+
+    def test_recognizes_embedded_ip_v4(self):
+        self.assertTrue(is_ip_v6('::ffff:192.168.0.1'))
+        self.assertTrue(is_ip_v6('::192.168.0.1'))
+        self.assertTrue(is_ip_v6('1:2:3:4:5:6:192.168.0.1'))
+        self.assertFalse(is_ip_v6('1:2:3:4:5:6:7:192.168.0.1'))
+        self.assertFalse(is_ip_v6('::ffff:192.168.0.256'))
+        self.assertFalse(is_ip_v6('::192.168.0.1:ffff'))
+
+    def test_groups_must_be_hexadecimal(self):
+        self.assertFalse(is_ip_v6('2001:db8:85a3:0000:0000:8a2e:370:zzzz'))
+        self.assertFalse(is_ip_v6('2001:db8:85a3::8a2e:370:g'))
+        self.assertFalse(is_ip_v6('2001:db8:85a3::8a2e:370:1_0'))
+        self.assertFalse(is_ip_v6('2001:db8:85a3::8a2e:370:12345'))
+        self.assertTrue(is_ip_v6('2001:DB8:85A3::8A2E:370:7334'))
+
+    def test_returns_false_for_empty_groups(self):
+        self.assertFalse(is_ip_v6(':::::::'))
+        self.assertFalse(is_ip_v6('2001:db8:85a3:0:0:8a2e::370:'))
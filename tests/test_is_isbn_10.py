@@ -50,3 +50,10 @@ class IsISBN10TestCase(TestCase):
         self.assertFalse(is_isbn_10('1506715214y'))
         self.assertFalse(is_isbn_10('x' * 10))
         self.assertFalse(is_isbn_10(''))
+
+    def test_last_digit_can_be_x(self):
+        self.assertTrue(is_isbn_10('080442957X'))
+        self.assertTrue(is_isbn_10('080442957x'))
+        self.assertTrue(is_isbn_10('0-8044-2957-X'))
+        self.assertFalse(is_isbn_10('0804429570'))
+        self.assertFalse(is_isbn_10('X804429575'))
@@ -48,3 +48,8 @@ class IsISBN13TestCase(TestCase):
         self.assertFalse(is_isbn_13('x9780312498580'))
         self.assertFalse(is_isbn_13('x' * 13))
         self.assertFalse(is_isbn_13(''))
+
+    def test_unicode_decimal_digits_are_accepted(self):
+        # same isbn of the first test written with arabic-indic digits
+        self.assertTrue(is_isbn_13('٩٧٨٠٣١٢٤٩٨٥٨٠'))
+        self.assertFalse(is_isbn_13('٩٧٨٠٣١٢٤٩٨٥٨١'))
@@ -0,0 +1,22 @@
+from unittest import TestCase
+
+from string_utils import is_isbn, is_isbn_many
+
+
+class IsISBNManyTestCase(TestCase):
+    def test_returns_bytearray_of_results(self):
+        results = is_isbn_many(['9780312498580', '1506715214', '080442957X', '1506715215', '', None, 9780312498580])
+
+        self.assertEqual(results, bytearray([1, 1, 1, 0, 0, 0, 0]))
+
+    def test_hyphens_are_not_considered_by_default(self):
+        self.assertEqual(is_isbn_many(['978-0312498580', '150-6715214']), bytearray([1, 1]))
+        self.assertEqual(is_isbn_many(['978-0312498580', '150-6715214'], normalize=False), bytearray([0, 0]))
+
+    def test_results_are_same_of_is_isbn(self):
+        strings = ['9780312498580', '978-0312498580', '8830102180', '1506715214!', ' 1506715214', 'x' * 10, '1' * 13]
+
+        self.assertEqual(is_isbn_many(strings), bytearray(is_isbn(s) for s in strings))
+
+    def test_empty_iterable_returns_empty_bytearray(self):
+        self.assertEqual(is_isbn_many(iter([])), bytearray())
@@ -0,0 +1,149 @@
+import io
+import json
+import tracemalloc
+from unittest import TestCase
+
+from string_utils import is_json, is_json_structure
+
+
+class IsJsonStructureTestCase(TestCase):
+    def test_unsupported_objects_are_not_valid(self):
+        # noinspection PyTypeChecker
+        self.assertFalse(is_json_structure({'a': 1}))
+
+        # noinspection PyTypeChecker
+        self.assertFalse(is_json_structure(None))
+
+        # noinspection PyTypeChecker
+        self.assertFalse(is_json_structure([1, 2, 3]))
+
+        # noinspection PyTypeChecker
+        self.assertFalse(is_json_structure(500))
+
+    def test_empty_sources_are_invalid(self):
+        self.assertFalse(is_json_structure(''))
+        self.assertFalse(is_json_structure(' '))
+        self.assertFalse(is_json_structure(b''))
+        self.assertFalse(is_json_structure(io.StringIO('')))
+
+    def test_recognizes_objects_and_arrays(self):
+        self.assertTrue(is_json_structure('{}'))
+        self.assertTrue(is_json_structure('[]'))
+        self.assertTrue(is_json_structure(' { "foo": "bar", "list": [1, 2.5, -3e10, true, false, null, {}] } '))
+        self.assertTrue(is_json_structure('[{"a": [[], [{"b": "\\u00e8\\n"}]]}, "x"]'))
+
+    def test_top_level_scalars_are_invalid(self):
+        self.assertFalse(is_json_structure('"hello"'))
+        self.assertFalse(is_json_structure('1'))
+        self.assertFalse(is_json_structure('null'))
+
+    def test_returns_false_for_invalid_grammar(self):
+        self.assertFalse(is_json_structure('{nope}'))
+        self.assertFalse(is_json_structure('{"a": 1,}'))
+        self.assertFalse(is_json_structure('[1, 2,]'))
+        self.assertFalse(is_json_structure('[1 2]'))
+        self.assertFalse(is_json_structure('{"a" 1}'))
+        self.assertFalse(is_json_structure('{1: 2}'))
+        self.assertFalse(is_json_structure('[1, 2}'))
+        self.assertFalse(is_json_structure('[[]'))
+        self.assertFalse(is_json_structure('[]]'))
+        self.assertFalse(is_json_structure('[] []'))
+        self.assertFalse(is_json_structure('[01]'))
+        self.assertFalse(is_json_structure('["\\x"]'))
+        self.assertFalse(is_json_structure('["new\nline"]'))
+
+    def test_results_are_same_of_is_json(self):
+        strings = [
+            '{"name": "Peter"}', '[1, 2, 3]', '[NaN, Infinity, -Infinity]', '[1.]', '[.5]', '[tru]', '[1]\f',
+            '﻿[]', '{"a": {"b": {"c": [1, {"d": 2}]}}}', "{'a': 1}", '[1, 2, 3] x',
+        ]
+
+        for string in strings:
+            self.assertEqual(is_json_structure(string), is_json(string), string)
+
+    def test_bytes_are_decoded_like_json_loads(self):
+        data = json.dumps({'name': 'Jérôme', 'tags': ['€', '日本']}, ensure_ascii=False)
+
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-be', 'utf-16-le', 'utf-32', 'utf-32-be', 'utf-32-le'):
+            self.assertTrue(is_json_structure(data.encode(encoding)), encoding)
+            self.assertTrue(is_json_structure(bytearray(data.encode(encoding))), encoding)
+            self.assertTrue(is_json_structure(memoryview(data.encode(encoding))), encoding)
+
+        self.assertFalse(is_json_structure(b'["\xff"]'))
+        self.assertTrue(is_json_structure('[]'.encode('utf-32-le')))
+        self.assertTrue(is_json_structure('[]'.encode('utf-16-be')))
+
+    def test_streams_are_read_in_chunks(self):
+        data = json.dumps([{'id': n, 'value': n / 3, 'name': 'é' * n} for n in range(100)])
+
+        for chunk_size in (1, 2, 3, 7, 1024):
+            self.assertTrue(is_json_structure(io.StringIO(data), chunk_size=chunk_size))
+            self.assertTrue(is_json_structure(io.BytesIO(data.encode('utf-8')), chunk_size=chunk_size))
+            self.assertTrue(is_json_structure(io.BytesIO(data.encode('utf-16')), chunk_size=chunk_size))
+            self.assertFalse(is_json_structure(io.StringIO(data + ','), chunk_size=chunk_size))
+            self.assertFalse(is_json_structure(io.BytesIO(data[:-1].encode()), chunk_size=chunk_size))
+
+    def test_tokens_split_across_chunks_are_recognized(self):
+        self.assertTrue(is_json_structure(io.StringIO('[12.5e-3, -Infinity, "ab\\u00e8c"]'), chunk_size=1))
+        self.assertFalse(is_json_structure(io.StringIO('[12.5e-, -Infinity]'), chunk_size=1))
+
+    def test_strings_split_across_chunks_are_recognized(self):
+        strings = [
+            '["abc"]', '{"key": "value", "k\\"ey": "\\\\"}', '["\\u00e8\\n\\t", "\\/"]', '["a\\u00"]',
+            '["a\\x"]', '["a\tb"]', '["abc]', '["abc\\"]', '{"abc": 1}', '{"abc" 1}', '["\\', '["\\u12',
+            '["", ""]', '[""]', '["" ""]', '{"": ""}', '["abc", 1, "def"]', '["\\ud83d\\ude00"]',
+        ]
+
+        for string in strings:
+            for chunk_size in (1, 2, 3, 5, 7, 100):
+                self.assertEqual(is_json_structure(io.StringIO(string), chunk_size=chunk_size), is_json(string), string)
+
+    def test_long_strings_are_scanned_without_keeping_them_in_memory(self):
+        # 6MB strings
+        stream = io.BytesIO(('{"key": "' + 'x\\"' * 2000000 + '", "other": [1, 2]}').encode())
+        unterminated_stream = io.BytesIO(('["' + 'x' * 6000000).encode())
+
+        tracemalloc.start()
+
+        try:
+            self.assertTrue(is_json_structure(stream, chunk_size=4096))
+            self.assertFalse(is_json_structure(unterminated_stream, chunk_size=4096))
+            self.assertLess(tracemalloc.get_traced_memory()[1], 1024 * 1024)
+        finally:
+            tracemalloc.stop()
+
+    def test_max_depth(self):
+        self.assertTrue(is_json_structure('[{"a": [1]}]', max_depth=3))
+        self.assertFalse(is_json_structure('[{"a": [1]}]', max_depth=2))
+        self.assertFalse(is_json_structure('[' * 100000 + ']' * 100000, max_depth=1000))
+
+    def test_deeply_nested_json_is_supported_without_limits(self):
+        self.assertTrue(is_json_structure('[' * 100000 + ']' * 100000))
+
+    def test_max_size(self):
+        self.assertTrue(is_json_structure('[1, 2]', max_size=6))
+        self.assertFalse(is_json_structure('[1, 2]', max_size=5))
+        self.assertTrue(is_json_structure(b'[1, 2]', max_size=6))
+        self.assertFalse(is_json_structure(b'[1, 2]', max_size=5))
+        self.assertFalse(is_json_structure(io.BytesIO(b'[' + b'1, ' * 100000 + b'1]'), max_size=1000))
+
+    def test_large_flat_arrays(self):
+        self.assertTrue(is_json_structure(json.dumps(list(range(100000)))))
+        self.assertTrue(is_json_structure(json.dumps({str(n): n for n in range(100000)})))
+        self.assertFalse(is_json_structure(json.dumps(list(range(100000))) + ']'))
+
+    def test_raises_value_error_for_invalid_limits(self):
+        with self.assertRaises(ValueError) as raised:
+            is_json_structure('[]', max_depth=0)
+
+        self.assertEqual(str(raised.exception), 'max_depth must be >= 1 (or None)')
+
+        with self.assertRaises(ValueError) as raised:
+            is_json_structure('[]', max_size=-1)
+
+        self.assertEqual(str(raised.exception), 'max_size must be >= 1 (or None)')
+
+        with self.assertRaises(ValueError) as raised:
+            is_json_structure(io.StringIO('[]'), chunk_size=0)
+
+        self.assertEqual(str(raised.exception), 'chunk_size must be >= 1')
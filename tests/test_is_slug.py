@@ -72,3 +72,18 @@ class IsSlugTestCase(TestCase):
 
     def test_slug_must_have_at_least_one_non_separator_char(self):
         self.assertFalse(is_slug('-'))
+
+    def test_slug_can_use_multi_char_separator(self):
+        self.assertTrue(is_slug('yep::i::am::a::slug', '::'))
+        self.assertTrue(is_slug('yep::::slug', '::'))
+        self.assertFalse(is_slug('yep:slug', '::'))
+        self.assertFalse(is_slug('yep-slug', ''))
+
+    def test_validation_time_is_linear_on_malicious_input(self):
+        # these strings used to cause catastrophic backtracking (it would have taken forever to check them)
+        size = 100000
+        self.assertFalse(is_slug('a' * size + '!'))
+        self.assertFalse(is_slug('a-' * (size // 2) + '!'))
+        self.assertFalse(is_slug('a' + '-' * size))
+        self.assertFalse(is_slug('a---a' * (size // 5) + ' '))
+        self.assertTrue(is_slug('a-' * (size // 2) + 'a'))
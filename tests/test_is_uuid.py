@@ -37,3 +37,64 @@ class IsUUIDTestCase(TestCase):
             # noinspection PyTypeChecker
             self.assertTrue(is_uuid(uuid4().hex, True))
             self.assertTrue(is_uuid(uuid1().hex, True))
+
+    def test_objects_are_not_converted_to_string(self):
+        class UUIDLike:
+            def __str__(self):
+                return '6f8aa2f9-686c-4ac3-8766-5712354a04cf'
+
+        # noinspection PyTypeChecker
+        self.assertFalse(is_uuid(UUIDLike()))
+
+    def test_should_accept_uuid_bytes(self):
+        self.assertTrue(is_uuid(uuid4().bytes))
+        self.assertTrue(is_uuid(bytearray(uuid4().bytes)))
+        self.assertFalse(is_uuid(uuid4().bytes[:15]))
+        self.assertFalse(is_uuid(uuid4().bytes + b'\x00'))
+        self.assertFalse(is_uuid(str(uuid4()).encode()))
+
+    def test_strings_must_have_exact_size(self):
+        value = str(uuid4())
+
+        self.assertFalse(is_uuid(value + '\n'))
+        self.assertFalse(is_uuid(' ' + value))
+        self.assertFalse(is_uuid(value[:-1]))
+        self.assertFalse(is_uuid(value + '0'))
+        self.assertFalse(is_uuid(value.replace('-', '') + '0', True))
+
+    def test_hex_value_may_contain_some_hyphens(self):
+        self.assertTrue(is_uuid('6f8aa2f9686c-4ac3-8766-5712354a04cf', True))
+        self.assertFalse(is_uuid('6f8aa2f9686c-4ac3-8766-5712354a04cf'))
+
+    def test_chars_must_be_hexadecimal(self):
+        self.assertTrue(is_uuid('6F8AA2F9-686C-4AC3-8766-5712354A04CF'))
+        self.assertFalse(is_uuid('6f8aa2f9-686c-4ac3-8766-5712354a04cg'))
+        self.assertFalse(is_uuid('6f8aa2f9-686c-4ac3-8766-5712354a04c٣'))
+        self.assertFalse(is_uuid('6f8aa2f9_686c_4ac3_8766_5712354a04cf'))
+
+    def test_version_can_be_checked(self):
+        for i in range(100):
+            self.assertTrue(is_uuid(str(uuid4()), version=4))
+            self.assertFalse(is_uuid(str(uuid4()), version=1))
+            self.assertTrue(is_uuid(uuid1(), version=1))
+            self.assertFalse(is_uuid(uuid1(), version=4))
+            self.assertTrue(is_uuid(uuid4().hex, allow_hex=True, version=4))
+            self.assertTrue(is_uuid(uuid4().bytes, version=4))
+            self.assertFalse(is_uuid(uuid1().bytes, version=4))
+
+    def test_version_requires_rfc_4122_variant(self):
+        self.assertTrue(is_uuid('6f8aa2f9-686c-4ac3-8766-5712354a04cf', version=4))
+        self.assertTrue(is_uuid('6f8aa2f9-686c-4ac3-B766-5712354a04cf', version=4))
+        self.assertFalse(is_uuid('6f8aa2f9-686c-4ac3-c766-5712354a04cf', version=4))
+        self.assertTrue(is_uuid('6f8aa2f9-686c-4ac3-c766-5712354a04cf'))
+
+    def test_raise_value_error_for_invalid_version(self):
+        for version in (0, 9, '4', 4.0, True, False):
+            with self.assertRaises(ValueError) as raised:
+                # noinspection PyTypeChecker
+                is_uuid(str(uuid4()), version=version)
+
+            self.assertEqual(
+                str(raised.exception),
+                'Invalid UUID version "{}": it must be an integer between 1 and 8'.format(version)
+            )
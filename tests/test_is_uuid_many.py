@@ -0,0 +1,54 @@
+from unittest import TestCase
+from uuid import uuid1, uuid4
+
+from string_utils import is_uuid, is_uuid_many
+
+
+class IsUUIDManyTestCase(TestCase):
+    def test_returns_bytearray_of_results(self):
+        results = is_uuid_many([str(uuid4()), uuid4(), uuid4().bytes, uuid4().hex, 'nope', '', None, 1])
+
+        self.assertEqual(results, bytearray([1, 1, 1, 0, 0, 0, 0, 0]))
+
+    def test_accepts_hex_values_if_allowed(self):
+        self.assertEqual(is_uuid_many([uuid4().hex, str(uuid4())], allow_hex=True), bytearray([1, 1]))
+        self.assertEqual(is_uuid_many([uuid4().hex] * 500, allow_hex=True), bytearray([1] * 500))
+        self.assertEqual(is_uuid_many([uuid4().hex] * 500), bytearray(500))
+
+    def test_results_are_same_of_is_uuid(self):
+        values = [str(uuid4()) for _ in range(1000)] + [str(uuid1()) for _ in range(1000)]
+        values[10] = values[10].upper()
+        values[200] = values[200][:-1] + 'x'
+        values[300] = values[300].replace('-', '_')
+        values[400] = '-' + values[400][:-1]
+        values[500] = values[500][:8] + values[500][9:] + '-'
+        values[600] = values[600] + '\n'
+        values[700] = values[700][:19] + 'c' + values[700][20:]
+
+        for allow_hex in (False, True):
+            for version in (None, 1, 4):
+                expected = bytearray(is_uuid(value, allow_hex, version) for value in values)
+
+                self.assertEqual(is_uuid_many(values, allow_hex, version), expected)
+                self.assertEqual(is_uuid_many(iter(values), allow_hex, version), expected)
+
+    def test_large_batches_of_valid_uuid(self):
+        values = [str(uuid4()) for _ in range(10000)]
+
+        self.assertEqual(is_uuid_many(values), bytearray([1] * 10000))
+        self.assertEqual(is_uuid_many(values, version=4), bytearray([1] * 10000))
+        self.assertEqual(is_uuid_many(values, version=1), bytearray(10000))
+
+    def test_empty_iterable_returns_empty_bytearray(self):
+        self.assertEqual(is_uuid_many(iter([])), bytearray())
+
+    def test_raise_value_error_for_invalid_version(self):
+        with self.assertRaises(ValueError) as raised:
+            is_uuid_many([], version=0)
+
+        self.assertEqual(str(raised.exception), 'Invalid UUID version "0": it must be an integer between 1 and 8')
+
+        with self.assertRaises(ValueError) as raised:
+            is_uuid_many([], version=True)
+
+        self.assertEqual(str(raised.exception), 'Invalid UUID version "True": it must be an integer between 1 and 8')
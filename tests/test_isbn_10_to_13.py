@@ -0,0 +1,31 @@
+from unittest import TestCase
+
+from string_utils import is_isbn_13, isbn_10_to_13
+from string_utils.errors import InvalidInputError
+
+
+class Isbn10To13TestCase(TestCase):
+    def test_requires_valid_string(self):
+        # noinspection PyTypeChecker
+        self.assertRaises(InvalidInputError, lambda: isbn_10_to_13(None))
+
+        # noinspection PyTypeChecker
+        self.assertRaises(InvalidInputError, lambda: isbn_10_to_13(1506715214))
+
+    def test_raise_exception_if_not_isbn_10(self):
+        with self.assertRaises(ValueError) as raised:
+            isbn_10_to_13('1506715215')
+
+        self.assertEqual(str(raised.exception), 'Invalid ISBN 10: "1506715215"')
+
+        self.assertRaises(ValueError, lambda: isbn_10_to_13('9780312498580'))
+        self.assertRaises(ValueError, lambda: isbn_10_to_13('150-6715214', normalize=False))
+
+    def test_converts_isbn_10(self):
+        self.assertEqual(isbn_10_to_13('1506715214'), '9781506715216')
+        self.assertEqual(isbn_10_to_13('150-671-5214'), '9781506715216')
+        self.assertEqual(isbn_10_to_13('8830102180'), '9788830102187')
+
+    def test_converts_isbn_10_with_x_check_digit(self):
+        self.assertEqual(isbn_10_to_13('080442957X'), '9780804429573')
+        self.assertTrue(is_isbn_13(isbn_10_to_13('080442957X')))
@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+from string_utils import is_isbn, isbn_check_digit
+from string_utils.errors import InvalidInputError
+
+
+class IsbnCheckDigitTestCase(TestCase):
+    def test_requires_valid_string(self):
+        # noinspection PyTypeChecker
+        self.assertRaises(InvalidInputError, lambda: isbn_check_digit(None))
+
+        # noinspection PyTypeChecker
+        self.assertRaises(InvalidInputError, lambda: isbn_check_digit(1506715214))
+
+    def test_raise_exception_if_not_isbn(self):
+        with self.assertRaises(ValueError) as raised:
+            isbn_check_digit('15067152')
+
+        self.assertEqual(str(raised.exception), 'Invalid ISBN: "15067152"')
+
+        self.assertRaises(ValueError, lambda: isbn_check_digit(''))
+        self.assertRaises(ValueError, lambda: isbn_check_digit('15067152a4'))
+        self.assertRaises(ValueError, lambda: isbn_check_digit('150671521?'))
+        self.assertRaises(ValueError, lambda: isbn_check_digit('978031249858X'))
+        self.assertRaises(ValueError, lambda: isbn_check_digit('150-6715214', normalize=False))
+
+    def test_returns_check_digit_of_isbn_10(self):
+        self.assertEqual(isbn_check_digit('1506715214'), '4')
+        self.assertEqual(isbn_check_digit('1506715215'), '4')
+        self.assertEqual(isbn_check_digit('150-671521'), '4')
+        self.assertEqual(isbn_check_digit('8830102180'), '0')
+
+    def test_returns_x_check_digit_of_isbn_10(self):
+        self.assertEqual(isbn_check_digit('0804429570'), 'X')
+        self.assertEqual(isbn_check_digit('080442957x'), 'X')
+        self.assertEqual(isbn_check_digit('080442957'), 'X')
+
+    def test_returns_check_digit_of_isbn_13(self):
+        self.assertEqual(isbn_check_digit('9780312498580'), '0')
+        self.assertEqual(isbn_check_digit('9780312498587'), '0')
+        self.assertEqual(isbn_check_digit('978-031249858'), '0')
+        self.assertEqual(isbn_check_digit('978150671521'), '6')
+
+    def test_wrong_isbn_is_fixed_by_the_check_digit(self):
+        for isbn in ('1506715210', '8830102189', '0804429571', '9780312498589', '9781506715210'):
+            self.assertFalse(is_isbn(isbn))
+            self.assertTrue(is_isbn(isbn[:-1] + isbn_check_digit(isbn)))
+
+    def test_unicode_digits_are_supported(self):
+        self.assertEqual(isbn_check_digit('١٥٠٦٧١٥٢١'), '4')
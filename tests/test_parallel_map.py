@@ -0,0 +1,37 @@
+from unittest import TestCase
+
+from string_utils import slugify, parallel
+from string_utils.errors import InvalidInputError
+
+
+class ParallelMapTestCase(TestCase):
+    titles = ['Title number {}!'.format(n) for n in range(100)]
+    slugs = ['title-number-{}'.format(n) for n in range(100)]
+
+    def test_raise_exception_if_func_is_not_callable(self):
+        # noinspection PyTypeChecker
+        self.assertRaises(TypeError, lambda: parallel.map(None, self.titles))
+
+    def test_raise_exception_if_workers_is_invalid(self):
+        self.assertRaises(ValueError, lambda: parallel.map(slugify, self.titles, workers=0))
+        # noinspection PyTypeChecker
+        self.assertRaises(ValueError, lambda: parallel.map(slugify, self.titles, workers='2'))
+
+    def test_raise_exception_if_chunksize_is_invalid(self):
+        self.assertRaises(ValueError, lambda: parallel.map(slugify, self.titles, chunksize=0))
+
+    def test_returns_results_in_order_with_single_worker(self):
+        self.assertEqual(list(parallel.map(slugify, self.titles, workers=1)), self.slugs)
+
+    def test_returns_results_in_order_with_multiple_workers(self):
+        self.assertEqual(list(parallel.map(slugify, self.titles, workers=2, chunksize=7)), self.slugs)
+        self.assertEqual(list(parallel.map(slugify, iter(self.titles), workers=3, chunksize=1)), self.slugs)
+
+    def test_empty_iterable(self):
+        self.assertEqual(list(parallel.map(slugify, [], workers=2)), [])
+
+    def test_errors_are_raised_in_caller_process(self):
+        # noinspection PyTypeChecker
+        results = parallel.map(slugify, ['foo', None], workers=2)
+
+        self.assertRaises(InvalidInputError, lambda: list(results))
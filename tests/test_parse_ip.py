@@ -0,0 +1,47 @@
+import ipaddress
+from unittest import TestCase
+
+from string_utils import parse_ip
+from string_utils.errors import InvalidInputError
+
+
+class ParseIpTestCase(TestCase):
+    def test_cannot_handle_non_string_objects(self):
+        with self.assertRaises(InvalidInputError) as raised:
+            # noinspection PyTypeChecker
+            parse_ip(None)
+
+        self.assertEqual(str(raised.exception), 'Expected "str", received "NoneType"')
+
+        with self.assertRaises(InvalidInputError) as raised:
+            # noinspection PyTypeChecker
+            parse_ip(3232235521)
+
+        self.assertEqual(str(raised.exception), 'Expected "str", received "int"')
+
+    def test_raises_value_error_for_invalid_ip(self):
+        with self.assertRaises(ValueError) as raised:
+            parse_ip('192.168.0.256')
+
+        self.assertEqual(str(raised.exception), 'Invalid ip: "192.168.0.256"')
+
+        with self.assertRaises(ValueError) as raised:
+            parse_ip('2001::db8::1')
+
+        self.assertEqual(str(raised.exception), 'Invalid ip: "2001::db8::1"')
+
+    def test_parses_ip_v4(self):
+        self.assertEqual(parse_ip('0.0.0.0'), (4, 0))
+        self.assertEqual(parse_ip('192.168.0.1'), (4, 3232235521))
+        self.assertEqual(parse_ip('255.255.255.255'), (4, 2 ** 32 - 1))
+
+    def test_parses_ip_v6(self):
+        self.assertEqual(parse_ip('::'), (6, 0))
+        self.assertEqual(parse_ip('::1'), (6, 1))
+        self.assertEqual(parse_ip('::ffff:192.168.0.1'), (6, 0xffffc0a80001))
+        self.assertEqual(parse_ip('ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff'), (6, 2 ** 128 - 1))
+
+    def test_values_are_same_of_ipaddress(self):
+        for ip in ('10.20.30.40', '2001:db8:85a3::8a2e:370:7334', '2001:db8::', 'fe80::1:2', '1:2:3:4:5:6:7.8.9.10'):
+            address = ipaddress.ip_address(ip)
+            self.assertEqual(parse_ip(ip), (address.version, int(address)))
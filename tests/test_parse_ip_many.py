@@ -0,0 +1,40 @@
+from array import array
+from unittest import TestCase
+
+from string_utils import parse_ip, parse_ip_many
+
+
+class ParseIpManyTestCase(TestCase):
+    def test_parses_ip_v4_into_array(self):
+        values, valid = parse_ip_many(['192.168.0.1', '0.0.0.0', '255.255.255.255'])
+
+        self.assertEqual(values, array('I', [3232235521, 0, 2 ** 32 - 1]))
+        self.assertEqual(valid, bytearray([1, 1, 1]))
+
+    def test_parses_ip_v6_into_bytes(self):
+        values, valid = parse_ip_many(['::1', '2001:db8::'], version=6)
+
+        self.assertIsInstance(values, bytes)
+        self.assertEqual(values, (1).to_bytes(16, 'big') + parse_ip('2001:db8::')[1].to_bytes(16, 'big'))
+        self.assertEqual(valid, bytearray([1, 1]))
+
+    def test_invalid_items_are_zeros(self):
+        values, valid = parse_ip_many(['10.0.0.1', 'nope', None, '::1', '10.0.0.2'])
+
+        self.assertEqual(values, array('I', [167772161, 0, 0, 0, 167772162]))
+        self.assertEqual(valid, bytearray([1, 0, 0, 0, 1]))
+
+        values, valid = parse_ip_many(['10.0.0.1', '::1', 1], version=6)
+
+        self.assertEqual(values, bytes(16) + (1).to_bytes(16, 'big') + bytes(16))
+        self.assertEqual(valid, bytearray([0, 1, 0]))
+
+    def test_empty_iterable_returns_empty_buffers(self):
+        self.assertEqual(parse_ip_many(iter([])), (array('I'), bytearray()))
+        self.assertEqual(parse_ip_many(iter([]), version=6), (b'', bytearray()))
+
+    def test_raises_value_error_for_invalid_version(self):
+        with self.assertRaises(ValueError) as raised:
+            parse_ip_many(['10.0.0.1'], version=5)
+
+        self.assertEqual(str(raised.exception), 'Invalid ip version "5": it must be 4 or 6')
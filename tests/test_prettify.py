@@ -274,3 +274,21 @@ class PrettifyTestCase(TestCase):
 
         multiple_ip = ['255.255.10.1', '255.255.10.2', '255.255.10.3']
         self.assertEqual(prettify(' '.join(multiple_ip)), ' '.join(multiple_ip))
+
+    def test_text_without_quotes_brackets_or_apostrophes_is_formatted(self):
+        self.assertEqual(prettify('hello   world ,how are you?fine .thanks'), 'Hello world, how are you? Fine. Thanks')
+
+    def test_long_text_is_formatted(self):
+        text = ' '.join(['the dog of dave\' s  is nice ,it barks sometimes .really !'] * 1000)
+        expected = ' '.join(['The dog of dave\'s is nice, it barks sometimes. Really!'] * 1000)
+        self.assertEqual(prettify(text), expected)
+
+    def test_many_urls_and_emails_are_preserved(self):
+        urls = ['http://www.site{}.com/page'.format(n) for n in range(1000)]
+        emails = ['user{}@gmail.com'.format(n) for n in range(1000)]
+        text = ' '.join(['see {} ,or write to {}'.format(u, e) for u, e in zip(urls, emails)])
+        expected = ' '.join(['see {}, or write to {}'.format(u, e) for u, e in zip(urls, emails)])
+        self.assertEqual(prettify(text), 'S' + expected[1:])
+
+    def test_text_looking_like_placeholders_is_not_replaced(self):
+        self.assertEqual(prettify('$ph0$ and $phh1$ http://foo.com'), '$ph0$ and $phh1$ http://foo.com')
@@ -0,0 +1,157 @@
+import random
+import re
+from unittest import TestCase
+
+from string_utils import prettify
+from string_utils._regex import URLS_RE, EMAILS_RE
+
+
+class ReferenceFormatter:
+    """
+    Frozen copy of the original prettify rules (eight regex substitutions applied one after another, without any of
+    the optimizations made later), used as reference to check that the output of `prettify()` never changes.
+
+    Urls and emails are protected in the same way of `prettify()`, since only the rules are checked here.
+    """
+
+    rules = [
+        ('UPPERCASE_FIRST_LETTER', re.compile(r'^\s*\w', re.UNICODE), lambda m: m.group(0).upper()),
+
+        ('DUPLICATES', re.compile(
+            r'(\({2,}|\){2,}|\[{2,}|\]{2,}|{{2,}|\}{2,}|:{2,}|,{2,}|;{2,}|\+{2,}|-{2,}|\s{2,}|%{2,}|={2,}|"{2,}|\'{2,})',
+            re.MULTILINE
+        ), lambda m: m.group(1)[0]),
+
+        ('RIGHT_SPACE', re.compile(
+            r'('
+            r'(?<=[^\s\d]),(?=[^\s\d])|\s,\s|\s,(?=[^\s\d])|\s,(?!.)|'
+            r'(?<=[^\s\d.])\.+(?=[^\s\d.])|\s\.+\s|\s\.+(?=[^\s\d])|\s\.+(?!\.)|'
+            r'(?<=\S);(?=\S)|\s;\s|\s;(?=\S)|\s;(?!.)|'
+            r'(?<=\S):(?=\S)|\s:\s|\s:(?=\S)|\s:(?!.)|'
+            r'(?<=[^\s!])!+(?=[^\s!])|\s!+\s|\s!+(?=[^\s!])|\s!+(?!!)|'
+            r'(?<=[^\s?])\?+(?=[^\s?])|\s\?+\s|\s\?+(?=[^\s?])|\s\?+(?!\?)|'
+            r'\d%(?=\S)|(?<=\d)\s%\s|(?<=\d)\s%(?=\S)|(?<=\d)\s%(?!.)'
+            r')',
+            re.MULTILINE | re.DOTALL
+        ), lambda m: m.group(1).strip() + ' '),
+
+        ('LEFT_SPACE', re.compile(
+            r'('
+            r'\s"[^"]+"(?=[?.:!,;])|(?<=\S)"[^"]+"\s|(?<=\S)"[^"]+"(?=[?.:!,;])|'
+            r'\s\([^)]+\)(?=[?.:!,;])|(?<=\S)\([^)]+\)\s|(?<=\S)(\([^)]+\))(?=[?.:!,;])'
+            r')',
+            re.MULTILINE | re.DOTALL
+        ), lambda m: ' ' + m.group(1).strip()),
+
+        ('SPACES_AROUND', re.compile(
+            r'('
+            r'(?<=\S)\+(?=\S)|(?<=\S)\+\s|\s\+(?=\S)|'
+            r'(?<=\S)-(?=\S)|(?<=\S)-\s|\s-(?=\S)|'
+            r'(?<=\S)/(?=\S)|(?<=\S)/\s|\s/(?=\S)|'
+            r'(?<=\S)\*(?=\S)|(?<=\S)\*\s|\s\*(?=\S)|'
+            r'(?<=\S)=(?=\S)|(?<=\S)=\s|\s=(?=\S)|'
+            r'\s"[^"]+"(?=[^\s?.:!,;])|(?<=\S)"[^"]+"\s|(?<=\S)"[^"]+"(?=[^\s?.:!,;])|'
+            r'\s\([^)]+\)(?=[^\s?.:!,;])|(?<=\S)\([^)]+\)\s|(?<=\S)(\([^)]+\))(?=[^\s?.:!,;])'
+            r')',
+            re.MULTILINE | re.DOTALL
+        ), lambda m: ' ' + m.group(1).strip() + ' '),
+
+        ('SPACES_INSIDE', re.compile(
+            r'((?<=")[^"]+(?=")|(?<=\()[^)]+(?=\)))',
+            re.MULTILINE | re.DOTALL
+        ), lambda m: m.group(1).strip()),
+
+        ('UPPERCASE_AFTER_SIGN', re.compile(
+            r'([.?!]\s\w)',
+            re.MULTILINE | re.UNICODE
+        ), lambda m: m.group(1)[:-1] + m.group(1)[2].upper()),
+
+        ('SAXON_GENITIVE', re.compile(
+            r'((?<=\w)\'\ss\s|(?<=\w)\s\'s(?=\w)|(?<=\w)\s\'s\s(?=\w))',
+            re.MULTILINE | re.UNICODE
+        ), lambda m: m.group(1).replace(' ', '') + ' '),
+    ]
+
+    @staticmethod
+    def protected_spans(input_string: str) -> list:
+        url_spans = [m.span() for m in URLS_RE.finditer(input_string)]
+        email_spans = [
+            m.span() for m in EMAILS_RE.finditer(input_string)
+            if not any(start < m.end() and m.start() < end for start, end in url_spans)
+        ]
+
+        return sorted(url_spans + email_spans)
+
+    @classmethod
+    def format(cls, input_string: str) -> str:
+        prefix = '$ph'
+
+        while prefix in input_string:
+            prefix += 'h'
+
+        protected_values = []
+        tokens = []
+        last_end = 0
+
+        for start, end in cls.protected_spans(input_string):
+            tokens.append(input_string[last_end:start])
+            tokens.append(prefix + str(len(protected_values)) + '$')
+            protected_values.append(input_string[start:end])
+            last_end = end
+
+        tokens.append(input_string[last_end:])
+        out = ''.join(tokens)
+
+        for _, regex, replace in cls.rules:
+            out = regex.sub(replace, out)
+
+        out = out.strip()
+
+        if protected_values:
+            placeholders = re.compile(re.escape(prefix) + r'(\d+)\$')
+            out = placeholders.sub(lambda m: protected_values[int(m.group(1))], out)
+
+        return out
+
+
+class PrettifyReferenceTestCase(TestCase):
+    # fragments used to build the random corpus: every sign handled by the rules, with and without spaces around,
+    # along with words, numbers, urls, emails and non ascii text
+    fragments = [
+        ' ', '  ', '\n', '\t', 'hello', 'World', 'dave', 's', 'a', 'è', 'ñandú', '日本', '42', '5.5', '3,14', '100',
+        '.', '..', '...', ',', ',,', ';', ':', '::', '!', '!!', '?', '??', '%', '%%', '+', '++', '-', '--', '/', '*',
+        '=', '==', '"', '""', "'", "''", "'s", " 's", "' s ", '(', ')', '((', '))', '[', ']', '[[', '{', '}', '{{',
+        '"quoted text"', '( bracket text )', '(x)', 'http://www.site.com/page?x=1', 'https://foo.org', 'me@mail.com',
+        'john.doe@site.co.uk', '$ph0$', '$phh1$', '192.168.0.1',
+    ]
+
+    sentences = [
+        'unprettified string ,, like this one,will be"prettified" .it\' s awesome!',
+        'the dog of dave\' s  is nice ,it barks sometimes .really !',
+        'this is a test ( with brackets ) and "quotes" ;see  http://www.foo.com ,or write to foo@bar.com .',
+        '1 +1 =2 , 5 * 5=25 ,10/ 2= 5 and 10 -3 = 7 .100 % sure !!!',
+        '   leading spaces ,trailing spaces ...   ',
+        'l\'albero è bello , ma il "cielo" è più bello !! perché?',
+    ]
+
+    def assert_same_of_reference(self, strings):
+        for string in strings:
+            self.assertEqual(prettify(string), ReferenceFormatter.format(string), repr(string))
+
+    def test_sentences_are_formatted_like_reference(self):
+        self.assert_same_of_reference(self.sentences)
+
+    def test_random_corpus_is_formatted_like_reference(self):
+        generator = random.Random(20201018)
+        corpus = [
+            ''.join(generator.choice(self.fragments) for _ in range(generator.randint(0, 30)))
+            for _ in range(3000)
+        ]
+
+        self.assert_same_of_reference(corpus)
+
+    def test_long_text_is_formatted_like_reference(self):
+        generator = random.Random(7)
+        text = ' '.join(generator.choice(self.sentences + self.fragments) for _ in range(5000))
+
+        self.assert_same_of_reference([text])
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from string_utils.manipulation import roman_decode
+from string_utils.manipulation import roman_decode, roman_encode
 
 
 class RomanDecodeTestCase(TestCase):
@@ -184,3 +184,34 @@ class RomanDecodeTestCase(TestCase):
         self.assertEqual(82, roman_decode('lxxxii'))
         self.assertEqual(roman_decode('VII'), roman_decode('vii'))
         self.assertEqual(roman_decode('VII'), roman_decode('Vii'))
+
+    def test_decode_is_the_inverse_of_encode_for_the_whole_range(self):
+        for n in range(1, 4000):
+            self.assertEqual(roman_decode(roman_encode(n)), n)
+
+    def test_non_canonical_numbers_are_still_decoded(self):
+        self.assertEqual(roman_decode('IIII'), 4)
+        self.assertEqual(roman_decode('VV'), 10)
+        self.assertEqual(roman_decode('MMMM'), 4000)
+
+    def test_extended_mode_decodes_overlined_signs(self):
+        self.assertEqual(roman_decode('I̅V̅', extended=True), 4000)
+        self.assertEqual(roman_decode('v̅', extended=True), 5000)
+        self.assertEqual(roman_decode('M̅̅̅VII', extended=True), 10 ** 12 + 7)
+        self.assertEqual(roman_decode('XIV', extended=True), 14)
+
+    def test_overlines_are_invalid_tokens_if_not_in_extended_mode(self):
+        with self.assertRaises(ValueError) as raised:
+            roman_decode('V̅')
+
+        self.assertEqual(str(raised.exception), 'Invalid token found: "̅"')
+
+    def test_overline_must_follow_a_sign(self):
+        with self.assertRaises(ValueError) as raised:
+            roman_decode('̅V', extended=True)
+
+        self.assertEqual(str(raised.exception), 'Invalid token found: "̅"')
+
+    def test_extended_mode_decodes_any_encoded_number(self):
+        for n in (4000, 4999, 123456, 3999999, 4000000, 987654321, 10 ** 40 + 1):
+            self.assertEqual(roman_decode(roman_encode(n, extended=True), extended=True), n)
@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+from string_utils.manipulation import roman_decode, roman_decode_many, roman_encode_many
+
+
+class RomanDecodeManyTestCase(TestCase):
+    def test_returns_same_output_of_roman_decode(self):
+        strings = roman_encode_many(range(1, 4000)) + ['iv', 'Xii', 'IIII', 'VV']
+
+        self.assertEqual(roman_decode_many(strings), [roman_decode(s) for s in strings])
+
+    def test_accepts_any_iterable(self):
+        self.assertEqual(roman_decode_many(s for s in ('I', 'II')), [1, 2])
+        self.assertEqual(roman_decode_many([]), [])
+
+    def test_raise_exception_for_invalid_items(self):
+        self.assertRaises(ValueError, lambda: roman_decode_many(['I', '']))
+        self.assertRaises(ValueError, lambda: roman_decode_many(['I', 'K']))
+        self.assertRaises(ValueError, lambda: roman_decode_many(['I', None]))
+        self.assertRaises(ValueError, lambda: roman_decode_many(['I', ['V']]))
+        self.assertRaises(ValueError, lambda: roman_decode_many([{}]))
+
+    def test_extended_mode(self):
+        self.assertEqual(roman_decode_many(['I', 'V̅'], extended=True), [1, 5000])
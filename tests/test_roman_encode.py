@@ -174,3 +174,24 @@ class RomanEncodeTestCase(TestCase):
         self.assertEqual(roman_encode(1200), 'MCC')
         self.assertEqual(roman_encode(2739), 'MMDCCXXXIX')
         self.assertEqual(roman_encode(3999), 'MMMCMXCIX')
+
+    def test_extended_mode_is_required_for_numbers_greater_than_3999(self):
+        self.assertRaises(ValueError, lambda: roman_encode(4000))
+        self.assertRaises(ValueError, lambda: roman_encode(0, extended=True))
+        self.assertRaises(ValueError, lambda: roman_encode(-5000, extended=True))
+        self.assertRaises(ValueError, lambda: roman_encode(5000.5, extended=True))
+
+    def test_extended_mode_does_not_change_standard_range(self):
+        for n in range(1, 4000):
+            self.assertEqual(roman_encode(n, extended=True), roman_encode(n))
+
+    def test_extended_mode_uses_overlines_for_thousands(self):
+        self.assertEqual(roman_encode(4000, extended=True), 'I̅V̅')
+        self.assertEqual(roman_encode(5000, extended=True), 'V̅')
+        self.assertEqual(roman_encode('12345', extended=True), 'X̅I̅I̅CCCXLV')
+        self.assertEqual(roman_encode(1000000, extended=True), 'M̅')
+        self.assertEqual(roman_encode(3999999, extended=True), 'M̅M̅M̅C̅M̅X̅C̅I̅X̅CMXCIX')
+
+    def test_extended_mode_uses_multiple_overlines_for_greater_powers(self):
+        self.assertEqual(roman_encode(4000000, extended=True), 'I̅̅V̅̅')
+        self.assertEqual(roman_encode(10 ** 12 + 7, extended=True), 'M̅̅̅VII')
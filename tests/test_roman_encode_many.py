@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+from string_utils.manipulation import roman_encode, roman_encode_many
+
+
+class RomanEncodeManyTestCase(TestCase):
+    def test_returns_same_output_of_roman_encode(self):
+        numbers = list(range(1, 4000))
+
+        self.assertEqual(roman_encode_many(numbers), [roman_encode(n) for n in numbers])
+
+    def test_accepts_any_iterable(self):
+        self.assertEqual(roman_encode_many(range(1, 4)), ['I', 'II', 'III'])
+        self.assertEqual(roman_encode_many(str(n) for n in (4, 5)), ['IV', 'V'])
+        self.assertEqual(roman_encode_many([]), [])
+
+    def test_raise_exception_for_invalid_items(self):
+        self.assertRaises(ValueError, lambda: roman_encode_many([1, 0]))
+        self.assertRaises(ValueError, lambda: roman_encode_many([1, 4000]))
+        self.assertRaises(ValueError, lambda: roman_encode_many([1, True]))
+        self.assertRaises(ValueError, lambda: roman_encode_many([1, None]))
+
+    def test_extended_mode(self):
+        self.assertEqual(roman_encode_many([1, 5000], extended=True), ['I', 'V̅'])
@@ -115,3 +115,80 @@ class RomanRangeTestCase(TestCase):
 
         # start (10) + step (-6) will exceed stop (5)
         self.assertRaises(OverflowError, lambda: roman_range(start=10, stop=5, step=-6))
+
+    def test_range_can_be_iterated_multiple_times(self):
+        numbers = roman_range(5)
+
+        self.assertEqual(list(numbers), ['I', 'II', 'III', 'IV', 'V'])
+        self.assertEqual(list(numbers), ['I', 'II', 'III', 'IV', 'V'])
+
+    def test_iteration_continues_from_next_like_generator_did(self):
+        numbers = roman_range(5)
+
+        self.assertEqual(next(numbers), 'I')
+        self.assertEqual(list(numbers), ['II', 'III', 'IV', 'V'])
+        self.assertEqual(list(numbers), [])
+        self.assertRaises(StopIteration, lambda: next(numbers))
+
+        # the sequence itself is unchanged
+        self.assertEqual(len(numbers), 5)
+        self.assertEqual(numbers[0], 'I')
+        self.assertEqual(list(reversed(numbers)), ['V', 'IV', 'III', 'II', 'I'])
+        self.assertTrue('I' in numbers)
+        self.assertEqual(numbers.count('I'), 1)
+        self.assertEqual(list(numbers[:]), ['I', 'II', 'III', 'IV', 'V'])
+
+        numbers = roman_range(3)
+        next(numbers)
+
+        self.assertEqual([n for n in numbers], ['II', 'III'])
+
+    def test_range_supports_len(self):
+        self.assertEqual(len(roman_range(3999)), 3999)
+        self.assertEqual(len(roman_range(start=10, stop=30, step=5)), 5)
+        self.assertEqual(len(roman_range(start=10, stop=1, step=-3)), 4)
+
+    def test_range_supports_indexing(self):
+        numbers = roman_range(start=10, stop=30, step=5)
+
+        self.assertEqual(numbers[0], 'X')
+        self.assertEqual(numbers[3], 'XXV')
+        self.assertEqual(numbers[-1], 'XXX')
+        self.assertEqual(roman_range(3999)[3998], 'MMMCMXCIX')
+        self.assertRaises(IndexError, lambda: numbers[5])
+
+    def test_range_supports_slicing(self):
+        numbers = roman_range(10)
+
+        self.assertEqual(list(numbers[2:5]), ['III', 'IV', 'V'])
+        self.assertEqual(list(numbers[::3]), ['I', 'IV', 'VII', 'X'])
+        self.assertEqual(list(numbers[::-4]), ['X', 'VI', 'II'])
+        self.assertEqual(len(numbers[20:]), 0)
+
+    def test_range_supports_reversed_iteration(self):
+        self.assertEqual(list(reversed(roman_range(4))), ['IV', 'III', 'II', 'I'])
+        self.assertEqual(list(reversed(roman_range(start=10, stop=1, step=-4))), ['II', 'VI', 'X'])
+
+    def test_range_supports_membership_and_index(self):
+        numbers = roman_range(start=10, stop=30, step=5)
+
+        self.assertIn('XV', numbers)
+        self.assertNotIn('XVI', numbers)
+        self.assertNotIn('', numbers)
+        self.assertNotIn(15, numbers)
+        self.assertNotIn(['XV'], numbers)
+        self.assertNotIn('xv', numbers)
+        self.assertEqual(numbers.index('XX'), 2)
+        self.assertEqual(numbers[::-1].index('XX'), 2)
+        self.assertEqual(numbers.index('XX', 1, 3), 2)
+        self.assertRaises(ValueError, lambda: numbers.index('XVI'))
+        self.assertRaises(ValueError, lambda: numbers.index(['XX']))
+
+    def test_repr_shows_inclusive_stop(self):
+        self.assertEqual(repr(roman_range(7)), 'roman_range(start=1, stop=7, step=1)')
+        self.assertEqual(repr(roman_range(7)[::-1]), 'roman_range(start=7, stop=1, step=-1)')
+        self.assertEqual(repr(roman_range(start=1, stop=10, step=4)), 'roman_range(start=1, stop=9, step=4)')
+        self.assertEqual(repr(roman_range(7)[5:2]), 'roman_range(empty)')
+
+    def test_stop_is_the_last_value_not_exceeding_it(self):
+        self.assertEqual(list(roman_range(start=1, stop=10, step=4)), ['I', 'V', 'IX'])
@@ -0,0 +1,101 @@
+import threading
+from unittest import TestCase
+
+from string_utils import slugify, cache
+from string_utils.errors import InvalidInputError
+
+
+class SlugifyCachedTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.configure(maxsize=100000, max_bytes=64 * 1024 * 1024)
+        cache.clear()
+
+    def test_raise_exception_if_provided_input_is_not_string(self):
+        with self.assertRaises(InvalidInputError) as raised:
+            # noinspection PyTypeChecker
+            cache.slugify_cached(['nope'])
+
+        self.assertEqual(str(raised.exception), 'Expected "str", received "list"')
+
+    def test_returns_same_result_of_slugify(self):
+        for s in ('Top 10 Reasons To Love Dogs!!!', 'Mönstér Mägnët', '', '- -'):
+            self.assertEqual(cache.slugify_cached(s), slugify(s))
+            self.assertEqual(cache.slugify_cached(s, '#'), slugify(s, '#'))
+
+    def test_counts_hits_and_misses(self):
+        cache.slugify_cached('Hello World')
+        cache.slugify_cached('Hello World')
+        cache.slugify_cached('Hello World', '_')
+
+        stats = cache.info()['slugify']
+
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['entries'], 2)
+        self.assertGreater(stats['bytes'], 0)
+
+    def test_clear_removes_entries_and_statistics(self):
+        cache.slugify_cached('Hello World')
+        cache.clear()
+
+        self.assertEqual(cache.info()['slugify'], {'hits': 0, 'misses': 0, 'entries': 0, 'bytes': 0})
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache.configure(maxsize=2, func='slugify')
+
+        cache.slugify_cached('a')
+        cache.slugify_cached('b')
+        cache.slugify_cached('a')
+        cache.slugify_cached('c')
+
+        self.assertEqual(cache.info()['slugify']['entries'], 2)
+
+        # "a" has been used recently, so "b" has been evicted
+        cache.slugify_cached('a')
+        self.assertEqual(cache.info()['slugify']['hits'], 2)
+        cache.slugify_cached('b')
+        self.assertEqual(cache.info()['slugify']['misses'], 4)
+
+    def test_size_in_bytes_is_limited(self):
+        cache.configure(max_bytes=2000, func='slugify')
+
+        for n in range(100):
+            cache.slugify_cached('Title number {}'.format(n))
+
+        stats = cache.info()['slugify']
+
+        self.assertLessEqual(stats['bytes'], 2000)
+        self.assertLess(stats['entries'], 100)
+
+        # too big values are not stored at all
+        cache.clear()
+        cache.slugify_cached('x' * 5000)
+        self.assertEqual(cache.info()['slugify']['entries'], 0)
+
+    def test_configure_raise_exception_for_invalid_values(self):
+        self.assertRaises(ValueError, lambda: cache.configure(maxsize=0))
+        self.assertRaises(ValueError, lambda: cache.configure(max_bytes=-1))
+        self.assertRaises(KeyError, lambda: cache.configure(maxsize=10, func='prettify'))
+
+    def test_can_be_used_by_multiple_threads(self):
+        cache.configure(maxsize=50, func='slugify')
+        titles = ['Title {}'.format(n % 80) for n in range(2000)]
+        errors = []
+
+        def work():
+            try:
+                for t in titles:
+                    if cache.slugify_cached(t) != slugify(t):
+                        errors.append(t)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(cache.info()['slugify']['entries'], 50)
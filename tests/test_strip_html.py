@@ -82,3 +82,59 @@ class StripHtmlTestCase(TestCase):
             </html>
         '''
         self.assertEqual('content text!', strip_html(multiline_string, keep_tag_content=True).strip())
+
+    def test_raise_exception_if_engine_is_invalid(self):
+        with self.assertRaises(ValueError) as raised:
+            strip_html('foo', engine='nope')
+
+        self.assertEqual(str(raised.exception), 'Invalid engine "nope". Valid engines are: regex, scanner')
+
+    def test_scanner_engine_removes_tags(self):
+        self.assertEqual('', strip_html('', engine='scanner'))
+        self.assertEqual(' hello world ', strip_html(' hello world ', engine='scanner'))
+        self.assertEqual('foo  bar', strip_html('foo <br> bar', engine='scanner'))
+        self.assertEqual('foo  bar', strip_html('foo <br/> bar', engine='scanner'))
+        self.assertEqual('foo  bar', strip_html('foo <br /> bar', engine='scanner'))
+        self.assertEqual('  ', strip_html(' <div></div> ', engine='scanner'))
+        self.assertEqual('a  b', strip_html('a <dz:foo power="100">x</dz:foo> b', engine='scanner'))
+
+    def test_scanner_engine_keeps_tag_content_if_specified(self):
+        s = 'test: <a href="foo/bar">click here</a>'
+        self.assertEqual('test: ', strip_html(s, engine='scanner'))
+        self.assertEqual('test: click here', strip_html(s, keep_tag_content=True, engine='scanner'))
+
+        multiline_string = '''
+            <html>
+                <body>
+                    <div id="container">
+                        <p>content text!<p>
+                    </div>
+                </body>
+            </html>
+        '''
+        stripped = strip_html(multiline_string, keep_tag_content=True, engine='scanner')
+        self.assertEqual('content text!', stripped.strip())
+
+    def test_scanner_engine_does_not_remove_content_of_void_tags(self):
+        self.assertEqual('a b c', strip_html('a <br>b<hr/> c</p>', engine='scanner'))
+        self.assertEqual('a  b', strip_html('a <input type="text" /> b</p>', engine='scanner'))
+
+    def test_scanner_engine_removes_comments_and_doctype_up_to_their_end(self):
+        self.assertEqual(' keep  this', strip_html('<!-- a --> keep <!-- b --> this', engine='scanner'))
+        self.assertEqual('keep', strip_html('<!DOCTYPE html>keep', keep_tag_content=True, engine='scanner'))
+
+    def test_scanner_engine_keeps_text_which_is_not_html(self):
+        self.assertEqual('a < b > c', strip_html('a < b > c', engine='scanner'))
+        self.assertEqual('1 <2 and <!-- nope', strip_html('1 <2 and <!-- nope', engine='scanner'))
+        self.assertEqual('<not a tag', strip_html('<not a tag', engine='scanner'))
+
+    def test_scanner_engine_removes_tags_following_unterminated_ones(self):
+        self.assertEqual('<!-- x  z', strip_html('<!-- x <i>y</i> z', engine='scanner'))
+        self.assertEqual('<!-- x y z', strip_html('<!-- x <i>y</i> z', keep_tag_content=True, engine='scanner'))
+        self.assertEqual('<!-- a  b', strip_html('<!-- a <!doctype html> b', engine='scanner'))
+
+    def test_scanner_engine_is_linear_on_malicious_input(self):
+        # these strings take several seconds with the regex engine
+        self.assertEqual('text <a ' * 20000, strip_html('text <a ' * 20000, engine='scanner'))
+        self.assertEqual('x <!-- ' * 20000, strip_html('x <!-- ' * 20000, engine='scanner'))
+        self.assertEqual('x ' * 20000, strip_html('x <p>' * 20000, keep_tag_content=True, engine='scanner'))
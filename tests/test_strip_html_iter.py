@@ -0,0 +1,115 @@
+import io
+import tracemalloc
+from unittest import TestCase
+
+from string_utils import strip_html, strip_html_iter
+from string_utils.errors import InvalidInputError
+
+
+class StripHtmlIterTestCase(TestCase):
+    document = '''
+        <!DOCTYPE html>
+        <html>
+            <!-- header -->
+            <body>
+                <div id="container" class="main">
+                    <p>first <strong>bold</strong> paragraph</p><br/>
+                    <dz:foo power="100">namespace</dz:foo>
+                    1 < 2 and 3 > 2
+                </div>
+            </body>
+        </html>
+    ''' * 10
+
+    def test_raise_exception_if_chunk_size_is_invalid(self):
+        self.assertRaises(ValueError, lambda: strip_html_iter(io.StringIO('foo'), chunk_size=0))
+
+    def test_raise_exception_if_max_tag_size_is_invalid(self):
+        for max_tag_size in (0, -1, '10', 1.5):
+            with self.assertRaises(ValueError) as raised:
+                # noinspection PyTypeChecker
+                strip_html_iter(io.StringIO('foo'), max_tag_size=max_tag_size)
+
+            self.assertEqual(str(raised.exception), 'max_tag_size must be >= 1')
+
+    def test_raise_exception_if_chunks_are_not_strings(self):
+        with self.assertRaises(InvalidInputError) as raised:
+            list(strip_html_iter(io.BytesIO(b'<b>foo</b>')))
+
+        self.assertEqual(str(raised.exception), 'Expected "str", received "bytes"')
+
+    def test_empty_source(self):
+        self.assertEqual(list(strip_html_iter(io.StringIO(''))), [])
+        self.assertEqual(list(strip_html_iter([])), [])
+
+    def test_output_is_same_of_strip_html_with_scanner_engine(self):
+        for keep_tag_content in (True, False):
+            expected = strip_html(self.document, keep_tag_content, engine='scanner')
+
+            for chunk_size in (1, 2, 5, 13, 64, 100000):
+                stream = io.StringIO(self.document)
+                output = ''.join(strip_html_iter(stream, keep_tag_content, chunk_size=chunk_size))
+
+                self.assertEqual(output, expected)
+
+    def test_accepts_iterable_of_strings(self):
+        chunks = ['test: <a hr', 'ef="foo/bar">click', ' here</', 'a> <!', '-- comment -', '-> end']
+
+        self.assertEqual(''.join(strip_html_iter(chunks)), 'test:   end')
+        self.assertEqual(''.join(strip_html_iter(chunks, keep_tag_content=True)), 'test: click here  end')
+
+    def test_text_is_produced_before_the_end_of_the_stream(self):
+        output = strip_html_iter(['hello <b>', 'world</b> <br', '> and <i>more'])
+
+        self.assertEqual(next(output), 'hello ')
+        self.assertEqual(next(output), ' ')
+        self.assertEqual(next(output), ' and ')
+
+        # content of an unclosed tag is known to be kept only at the end of the stream
+        self.assertEqual(next(output), 'more')
+
+    def test_terminators_split_across_many_chunks_are_found(self):
+        # chunks keep arriving while a tag, a comment or the content of a tag is waiting for its terminator
+        chunks = ['a <!-', '-', ' x ' * 100, '-', '-', '>', ' b <p cl', 'ass="x"'] + ['y'] * 100 + ['>c<', '/', 'p']
+        chunks += ['z'] * 100 + ['<', '/n', 's:', 'p', '>', ' d <b>', 'e', ' < f', '<', '/', 'b', '> g']
+
+        self.assertEqual(''.join(strip_html_iter(chunks)), 'a  b  d  g')
+        self.assertEqual(''.join(strip_html_iter(chunks, keep_tag_content=True)), 'a  b c</p' + 'z' * 100 + ' d e < f g')
+
+    def test_unclosed_tags_are_kept_at_the_end_of_the_stream(self):
+        for head in ('<!--', '<div ', '<!doctype'):
+            chunks = ['text ', head] + ['x' * 10] * 1000
+
+            self.assertEqual(''.join(strip_html_iter(chunks)), 'text ' + head + 'x' * 10000)
+
+    def test_tags_longer_than_max_tag_size_are_kept_as_text(self):
+        chunks = ['a <b', ' title="', 'x' * 20, '">b</b> c <!-- ', 'y' * 20, ' --> d <p>', 'z' * 20, '</p>']
+
+        self.assertEqual(''.join(strip_html_iter(chunks)), 'a  c  d ')
+        self.assertEqual(
+            ''.join(strip_html_iter(chunks, max_tag_size=10)),
+            'a <b title="' + 'x' * 20 + '">b c <!-- ' + 'y' * 20 + ' --> d ' + 'z' * 20
+        )
+        self.assertEqual(''.join(strip_html_iter(chunks, max_tag_size=None)), 'a  c  d ')
+
+        # tags split across chunks within the limit are still removed
+        self.assertEqual(''.join(strip_html_iter(['a <b', 'r> c <!', '-- d -', '->'], max_tag_size=10)), 'a  c ')
+
+    def test_memory_is_bounded_by_max_tag_size(self):
+        # unclosed tag, comment and tag content followed by a long tail (10MB)
+        for head in ('<b ', '<!--', '<p>'):
+            chunks = [head] + ['x' * 1000 + ' < y '] * 10000
+            expected_size = len(strip_html(''.join(chunks), engine='scanner'))
+            stripped_size = 0
+
+            tracemalloc.start()
+
+            try:
+                for text in strip_html_iter(chunks, max_tag_size=65536):
+                    stripped_size += len(text)
+
+                self.assertLess(tracemalloc.get_traced_memory()[1], 1024 * 1024, head)
+            finally:
+                tracemalloc.stop()
+
+            self.assertEqual(stripped_size, expected_size, head)
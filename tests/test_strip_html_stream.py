@@ -0,0 +1,22 @@
+import io
+from unittest import TestCase
+
+from string_utils import strip_html, strip_html_stream
+
+
+class StripHtmlStreamTestCase(TestCase):
+    def test_writes_stripped_text(self):
+        document = 'test: <a href="foo/bar">click here</a> <!-- comment --> <br/>end' * 100
+        writable = io.StringIO()
+
+        written = strip_html_stream(io.StringIO(document), writable, chunk_size=7)
+
+        self.assertEqual(writable.getvalue(), strip_html(document, engine='scanner'))
+        self.assertEqual(written, len(writable.getvalue()))
+
+    def test_keeps_tag_content_if_specified(self):
+        writable = io.StringIO()
+
+        strip_html_stream(io.StringIO('test: <a href="foo/bar">click here</a>'), writable, keep_tag_content=True)
+
+        self.assertEqual(writable.getvalue(), 'test: click here')
@@ -0,0 +1,45 @@
+import json
+from unittest import TestCase
+
+from string_utils import compress, train_dictionary
+from string_utils.errors import InvalidInputError
+
+
+class TrainDictionaryTestCase(TestCase):
+    samples = [
+        json.dumps({'session_id': i * 7919, 'user': 'user{}'.format(i % 10), 'page': i % 50, 'sort': 'descending'})
+        for i in range(500)
+    ]
+
+    def test_raise_exception_if_size_is_invalid(self):
+        with self.assertRaises(ValueError) as raised:
+            train_dictionary(self.samples, size=0)
+
+        self.assertEqual(str(raised.exception), 'size must be >= 1')
+
+    def test_raise_exception_if_samples_are_not_strings(self):
+        with self.assertRaises(InvalidInputError) as raised:
+            # noinspection PyTypeChecker
+            train_dictionary(['foo', 1])
+
+        self.assertEqual(str(raised.exception), 'Expected "str", received "int"')
+
+    def test_dictionary_contains_shared_sequences(self):
+        dictionary = train_dictionary(self.samples)
+
+        self.assertIsInstance(dictionary, bytes)
+        self.assertIn(b'"session_id": ', dictionary)
+        self.assertIn(b'sort": "descending"}', dictionary)
+
+    def test_dictionary_does_not_exceed_size(self):
+        self.assertLessEqual(len(train_dictionary(self.samples, size=64)), 64)
+
+    def test_dictionary_is_empty_without_shared_sequences(self):
+        self.assertEqual(train_dictionary([]), b'')
+        self.assertEqual(train_dictionary(['one sample only']), b'')
+
+    def test_dictionary_improves_compression_of_short_strings(self):
+        dictionary = train_dictionary(self.samples)
+        string = json.dumps({'session_id': 123456, 'user': 'user5', 'page': 1, 'sort': 'descending'})
+
+        self.assertLess(len(compress(string, dictionary=dictionary)), len(compress(string)) // 2)
@@ -0,0 +1,98 @@
+import io
+import json
+import mmap
+import os
+import tempfile
+from unittest import TestCase
+
+from string_utils import validate_json_lines
+
+
+class ValidateJsonLinesTestCase(TestCase):
+    lines = [
+        '{"id": 1, "name": "foo"}\n',
+        '{"id": 2, "name": "bar"\n',
+        '[1, 2, 3]\n',
+        '\n',
+        '{"id": 3, "tags": ["è", "€"]}\r\n',
+        'nope\n',
+        '"scalar"\n',
+        '{"id": 4}',
+    ]
+
+    invalid_line_numbers = [2, 4, 6, 7]
+
+    def test_yields_invalid_line_numbers_from_text_streams(self):
+        results = validate_json_lines(io.StringIO(''.join(self.lines)))
+
+        self.assertEqual(list(results), self.invalid_line_numbers)
+
+    def test_yields_invalid_line_numbers_from_binary_streams(self):
+        results = validate_json_lines(io.BytesIO(''.join(self.lines).encode('utf-8')))
+
+        self.assertEqual(list(results), self.invalid_line_numbers)
+
+    def test_binary_lines_must_be_utf8(self):
+        source = io.BytesIO('["è"]\n'.encode('utf-8') + '["è"]\n'.encode('latin-1') + b'[]\n')
+
+        self.assertEqual(list(validate_json_lines(source)), [2])
+
+    def test_yields_invalid_line_numbers_from_iterables(self):
+        self.assertEqual(list(validate_json_lines(self.lines)), self.invalid_line_numbers)
+        self.assertEqual(list(validate_json_lines(iter(['[]', None, 1, b'{}']))), [2, 3])
+
+    def test_yields_invalid_line_numbers_from_mmap(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'data.jsonl')
+
+            with open(path, 'wb') as f:
+                f.write(''.join(self.lines).encode('utf-8'))
+
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                self.assertEqual(list(validate_json_lines(mapped)), self.invalid_line_numbers)
+
+    def test_returns_empty_generator_for_empty_sources(self):
+        self.assertEqual(list(validate_json_lines(io.StringIO(''))), [])
+        self.assertEqual(list(validate_json_lines([])), [])
+
+    def test_lines_can_be_checked_by_multiple_workers(self):
+        lines = [json.dumps({'id': n}) + '\n' if n % 7 else '{"id": ' + str(n) + '\n' for n in range(1, 500)]
+
+        expected = [n for n in range(1, 500) if n % 7 == 0]
+
+        self.assertEqual(list(validate_json_lines(lines, workers=2, chunksize=50)), expected)
+        self.assertEqual(list(validate_json_lines(iter(lines), workers=1)), expected)
+
+    def test_long_lines_are_supported(self):
+        line = json.dumps({'values': list(range(100000))})
+        lines = [line + '\n', line[:-1] + '\n', line]
+
+        self.assertEqual(list(validate_json_lines(lines)), [2])
+
+    def test_deeply_nested_lines_are_supported(self):
+        lines = ['[' * 100000 + ']' * 100000 + '\n', '[' * 100000 + ']' * 99999 + '\n']
+
+        self.assertEqual(list(validate_json_lines(lines)), [2])
+
+    def test_limits_are_applied_to_each_line(self):
+        lines = ['[1, 2]\n', '[[1], 2]\n', '[1, 2, 3, 4]\n']
+
+        self.assertEqual(list(validate_json_lines(lines, max_depth=1)), [2])
+        self.assertEqual(list(validate_json_lines(lines, max_size=10)), [3])
+        self.assertEqual(list(validate_json_lines([line.encode() for line in lines], max_size=10)), [3])
+
+    def test_raises_value_error_for_invalid_arguments(self):
+        with self.assertRaises(ValueError) as raised:
+            validate_json_lines([], max_depth=0)
+
+        self.assertEqual(str(raised.exception), 'max_depth must be >= 1 (or None)')
+
+        with self.assertRaises(ValueError) as raised:
+            validate_json_lines([], workers=0)
+
+        self.assertEqual(str(raised.exception), 'workers must be >= 1')
+
+        with self.assertRaises(ValueError) as raised:
+            validate_json_lines([], chunksize=0)
+
+        self.assertEqual(str(raised.exception), 'chunksize must be >= 1')
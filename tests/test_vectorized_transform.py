@@ -0,0 +1,36 @@
+from unittest import TestCase, skipIf
+
+from string_utils import slugify, asciify
+from string_utils.vectorized import transform, numpy, pyarrow
+
+
+class VectorizedTransformTestCase(TestCase):
+    values = ['Top 10 Reasons To Love Dogs!!!', 'Mönstér Mägnët']
+    slugs = ['top-10-reasons-to-love-dogs', 'monster-magnet']
+
+    def test_works_with_plain_iterables(self):
+        self.assertEqual(transform(slugify, self.values), self.slugs)
+        self.assertEqual(transform(slugify, self.values, separator='_'), [s.replace('-', '_') for s in self.slugs])
+        self.assertEqual(transform(asciify, ['èé', None]), ['ee', None])
+
+    @skipIf(numpy is None, 'numpy is not installed')
+    def test_returns_numpy_array(self):
+        result = transform(slugify, numpy.array(self.values, dtype=object))
+        self.assertEqual(result.dtype, numpy.dtype(object))
+        self.assertEqual(result.tolist(), self.slugs)
+
+        # fixed size strings are resized as needed
+        result = transform(slugify, numpy.array(['a', 'B C']))
+        self.assertEqual(result.tolist(), ['a', 'b-c'])
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_returns_arrow_array(self):
+        result = transform(slugify, pyarrow.array(self.values + [None]))
+
+        self.assertEqual(result.type, pyarrow.string())
+        self.assertEqual(result.to_pylist(), self.slugs + [None])
+
+        chunked = pyarrow.chunked_array([self.values[:1], self.values[1:]], type=pyarrow.large_string())
+        result = transform(slugify, chunked)
+        self.assertEqual(result.type, pyarrow.large_string())
+        self.assertEqual(result.to_pylist(), self.slugs)
@@ -0,0 +1,52 @@
+from unittest import TestCase, skipIf
+
+from string_utils import is_uuid, is_email, is_snake_case, is_camel_case
+from string_utils.vectorized import validate, numpy, pyarrow
+
+
+class VectorizedValidateTestCase(TestCase):
+    uuid = '6f8aa2f9-686c-4ac3-8766-5712354a04cf'
+
+    def test_works_with_plain_iterables(self):
+        self.assertEqual(validate(is_uuid, [self.uuid, 'nope', None]), [True, False, False])
+        self.assertEqual(validate(is_email, (s for s in ['me@foo.com', 'foo'])), [True, False])
+
+    def test_keyword_arguments_are_passed_to_validator(self):
+        self.assertEqual(validate(is_uuid, [self.uuid.replace('-', '')]), [False])
+        self.assertEqual(validate(is_uuid, [self.uuid.replace('-', '')], allow_hex=True), [True])
+
+    @skipIf(numpy is None, 'numpy is not installed')
+    def test_returns_numpy_bool_mask(self):
+        for dtype in (object, str):
+            mask = validate(is_uuid, numpy.array([self.uuid, 'nope'], dtype=dtype))
+
+            self.assertEqual(mask.dtype, numpy.dtype(bool))
+            self.assertEqual(mask.tolist(), [True, False])
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_returns_arrow_boolean_array(self):
+        values = pyarrow.array([self.uuid, 'nope', None])
+
+        self.assertEqual(validate(is_uuid, values).to_pylist(), [True, False, False])
+        self.assertEqual(validate(is_email, values).to_pylist(), [False, False, False])
+
+    @skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow_regex_kernels_give_same_results(self):
+        values = [
+            'foo_bar', 'foo-bar', 'FooBar', 'foo', '_foo', '', self.uuid, self.uuid.upper(), None,
+
+            # python "$" allows a trailing new line, while RE2 one does not
+            'foo_bar\n', 'fooBar\n', 'fooBar\n\n', 'foo\nBar', self.uuid + '\n',
+
+            # python "\d" and case insensitive matching are not limited to ascii, while RE2 ones are
+            'fooBar١', 'foo_bar١', 'foo١_bar', 'fooBar²', 'foo_\u212a', 'Fooßar', self.uuid[:-1] + '١',
+        ]
+        array = pyarrow.array(values)
+        chunked = pyarrow.chunked_array([values[:4], values[4:11], [], values[11:]])
+
+        for validator, kwargs in ((is_snake_case, {}), (is_snake_case, {'separator': '-'}), (is_camel_case, {}),
+                                  (is_uuid, {}), (is_uuid, {'allow_hex': True}), (is_uuid, {'version': 4})):
+            expected = validate(validator, values, **kwargs)
+
+            self.assertEqual(validate(validator, array, **kwargs).to_pylist(), expected)
+            self.assertEqual(validate(validator, chunked, **kwargs).to_pylist(), expected)